@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+BBox = Tuple[int, int, int, int]
+
+# Mechanical limits, matching MockHardwareController.
+PAN_LIMITS = (-90.0, 90.0)
+TILT_LIMITS = (-45.0, 45.0)
+
+
+def box_centres(boxes: Sequence[BBox]) -> np.ndarray:
+    arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return np.stack([(arr[:, 0] + arr[:, 2]) / 2.0, (arr[:, 1] + arr[:, 3]) / 2.0], axis=1)
+
+
+@dataclass
+class PointingSolver:
+    """Calibrated pixel → (pan, tilt) inverse kinematics via lookup tables.
+
+    ``pan_lut``/``tilt_lut`` hold angles at grid nodes spaced ``step`` pixels
+    apart over a ``size`` = (width, height) frame; queries are bilinearly
+    interpolated, so a batch of targets is a handful of array ops. With
+    ``relative`` set, the camera rides on the gimbal and table values are
+    offsets added to the pose the frame was captured at.
+    """
+
+    pan_lut: np.ndarray
+    tilt_lut: np.ndarray
+    size: Tuple[int, int]
+    step: float
+    relative: bool = False
+    _luts: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._luts = np.stack([self.pan_lut, self.tilt_lut], axis=-1)
+
+    @classmethod
+    def from_pinhole(
+        cls,
+        size: Tuple[int, int] = (1280, 720),
+        hfov_deg: float = 70.0,
+        vfov_deg: float | None = None,
+        mount_offset: Tuple[float, float] = (0.0, 0.0),
+        relative: bool = False,
+        step: float = 16.0,
+    ) -> "PointingSolver":
+        """Tables for an ideal pinhole camera co-located with the gimbal pivot.
+
+        ``mount_offset`` is the gimbal's (pan, tilt) when the laser hits the
+        image centre.
+        """
+        width, height = size
+        fx = (width / 2.0) / math.tan(math.radians(hfov_deg) / 2.0)
+        fy = fx if vfov_deg is None else (height / 2.0) / math.tan(math.radians(vfov_deg) / 2.0)
+        xs, ys = cls._grid(size, step)
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        pan = np.degrees(np.arctan((grid_x - width / 2.0) / fx)) + mount_offset[0]
+        # Image y grows downwards while positive tilt points up.
+        tilt = -np.degrees(np.arctan((grid_y - height / 2.0) / fy)) + mount_offset[1]
+        return cls(pan_lut=pan, tilt_lut=tilt, size=(int(width), int(height)), step=step, relative=relative)
+
+    @classmethod
+    def from_samples(
+        cls,
+        pixels: Sequence[Tuple[float, float]],
+        angles: Sequence[Tuple[float, float]],
+        size: Tuple[int, int],
+        relative: bool = False,
+        step: float = 16.0,
+    ) -> "PointingSolver":
+        """Fit tables to calibration shots: laser angles that hit known pixels.
+
+        A cubic surface per axis absorbs lens distortion and mount offset;
+        ten or more well-spread samples are needed.
+        """
+        pts = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+        targets = np.asarray(angles, dtype=np.float64).reshape(-1, 2)
+        if pts.shape[0] < 10:
+            raise ValueError("calibration needs at least 10 samples")
+        scale = np.array(size, dtype=np.float64)
+        design = cls._design(pts / scale)
+        coeffs, *_ = np.linalg.lstsq(design, targets, rcond=None)
+        xs, ys = cls._grid(size, step)
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        nodes = np.stack([grid_x.ravel(), grid_y.ravel()], axis=1) / scale
+        fitted = cls._design(nodes) @ coeffs
+        return cls(
+            pan_lut=fitted[:, 0].reshape(grid_x.shape),
+            tilt_lut=fitted[:, 1].reshape(grid_x.shape),
+            size=(int(size[0]), int(size[1])),
+            step=step,
+            relative=relative,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PointingSolver":
+        size = tuple(data.get("size", (1280, 720)))
+        step = float(data.get("step", 16.0))
+        relative = bool(data.get("relative", False))
+        if "samples" in data:
+            samples = data["samples"]
+            return cls.from_samples(
+                [sample["pixel"] for sample in samples],
+                [sample["angles"] for sample in samples],
+                size=size,
+                relative=relative,
+                step=step,
+            )
+        return cls.from_pinhole(
+            size=size,
+            hfov_deg=float(data.get("hfov_deg", 70.0)),
+            vfov_deg=data.get("vfov_deg"),
+            mount_offset=tuple(data.get("mount_offset", (0.0, 0.0))),
+            relative=relative,
+            step=step,
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "PointingSolver":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def solve(self, points: np.ndarray, poses: Optional[np.ndarray] = None) -> np.ndarray:
+        """(N, 2) pixels → (N, 2) clipped (pan, tilt) angles.
+
+        ``poses`` is the gimbal pose each pixel was captured at, either one
+        (pan, tilt) pair or one per point; only used when ``relative``.
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        rows, cols = self.pan_lut.shape
+        gx = np.clip(pts[:, 0] / self.step, 0.0, cols - 1.0)
+        gy = np.clip(pts[:, 1] / self.step, 0.0, rows - 1.0)
+        # Tables always have at least two nodes per axis (see ``_grid``).
+        x0 = np.minimum(gx.astype(np.int64), cols - 2)
+        y0 = np.minimum(gy.astype(np.int64), rows - 2)
+        x1, y1 = x0 + 1, y0 + 1
+        wx = (gx - x0)[:, None]
+        wy = (gy - y0)[:, None]
+
+        luts = self._luts
+        top = luts[y0, x0] * (1.0 - wx) + luts[y0, x1] * wx
+        bottom = luts[y1, x0] * (1.0 - wx) + luts[y1, x1] * wx
+        angles = top * (1.0 - wy) + bottom * wy
+        if self.relative and poses is not None:
+            angles = angles + np.asarray(poses, dtype=np.float64).reshape(-1, 2)
+        angles[:, 0] = np.clip(angles[:, 0], *PAN_LIMITS)
+        angles[:, 1] = np.clip(angles[:, 1], *TILT_LIMITS)
+        return angles
+
+    def solve_boxes(self, boxes: Sequence[BBox], poses: Optional[np.ndarray] = None) -> np.ndarray:
+        if not len(boxes):
+            return np.zeros((0, 2), dtype=np.float64)
+        return self.solve(box_centres(boxes), poses)
+
+    def aim(self, bbox: BBox, pose: Optional[Tuple[float, float]] = None) -> Tuple[float, float]:
+        pan, tilt = self.solve_boxes([bbox], None if pose is None else np.asarray(pose))[0]
+        return float(pan), float(tilt)
+
+    @staticmethod
+    def _grid(size: Tuple[int, int], step: float) -> Tuple[np.ndarray, np.ndarray]:
+        width, height = size
+        # Nodes cover [0, width] and [0, height] inclusive.
+        xs = np.arange(int(math.ceil(width / step)) + 1, dtype=np.float64) * step
+        ys = np.arange(int(math.ceil(height / step)) + 1, dtype=np.float64) * step
+        return xs, ys
+
+    @staticmethod
+    def _design(pts: np.ndarray) -> np.ndarray:
+        x, y = pts[:, 0], pts[:, 1]
+        return np.stack(
+            [np.ones_like(x), x, y, x * x, x * y, y * y, x**3, x * x * y, x * y * y, y**3], axis=1
+        )
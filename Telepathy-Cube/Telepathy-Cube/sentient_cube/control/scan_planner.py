@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from sentient_cube.control.hardware import HardwareController
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import Detection, ObjectDetector
+from sentient_cube.vision.zones import NO_ZONE, ZoneMap
+
+Pose = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class ScanView:
+    pan: float
+    tilt: float
+    zone: Optional[str] = None
+
+
+@dataclass
+class ScanPlan:
+    views: List[ScanView]
+    travel_deg: float
+    priority_zones: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ViewResult:
+    view: ScanView
+    detections: List[Detection]
+
+
+def move_cost(a: Pose, b: Pose) -> float:
+    """Both axes slew at once, so a move takes as long as its larger leg."""
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+def _cost_matrix(points: np.ndarray) -> np.ndarray:
+    return np.abs(points[:, None, :] - points[None, :, :]).max(axis=-1)
+
+
+def order_views(points: np.ndarray, start: Pose) -> List[int]:
+    """Short open tour from ``start``: nearest neighbour, then 2-opt."""
+    count = len(points)
+    if count <= 1:
+        return list(range(count))
+    dist = _cost_matrix(points)
+    from_start = np.abs(points - np.asarray(start)).max(axis=1)
+
+    tour = [int(np.argmin(from_start))]
+    visited = np.zeros(count, dtype=bool)
+    visited[tour[0]] = True
+    for _ in range(count - 1):
+        row = np.where(visited, np.inf, dist[tour[-1]])
+        nxt = int(np.argmin(row))
+        tour.append(nxt)
+        visited[nxt] = True
+
+    # 2-opt on the open path; node -1 stands for the fixed start pose.
+    def leg(a: int, b: int) -> float:
+        return float(from_start[b]) if a < 0 else float(dist[a, b])
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(count - 1):
+            prev = tour[i - 1] if i > 0 else -1
+            for j in range(i + 1, count):
+                after = tour[j + 1] if j + 1 < count else None
+                before = leg(prev, tour[i]) + (dist[tour[j], after] if after is not None else 0.0)
+                swapped = leg(prev, tour[j]) + (dist[tour[i], after] if after is not None else 0.0)
+                if swapped + 1e-9 < before:
+                    tour[i : j + 1] = tour[i : j + 1][::-1]
+                    improved = True
+    return tour
+
+
+def tour_cost(views: Sequence[ScanView], start: Pose) -> float:
+    total = 0.0
+    here = start
+    for view in views:
+        total += move_cost(here, (view.pan, view.tilt))
+        here = (view.pan, view.tilt)
+    return total
+
+
+def stale_zones(
+    freshness: Dict[str, Tuple[datetime, float]],
+    zones: Iterable[str],
+    max_age: timedelta = timedelta(minutes=30),
+    min_confidence: float = 0.5,
+    now: datetime | None = None,
+) -> Set[str]:
+    """Zones never seen, seen too long ago, or only seen with low confidence."""
+    now = now or datetime.now(timezone.utc)
+    stale = set()
+    for zone in zones:
+        seen = freshness.get(zone)
+        if seen is None or now - seen[0] > max_age or seen[1] < min_confidence:
+            stale.add(zone)
+    return stale
+
+
+class ScanPlanner:
+    """Covers the calibrated desk area with a minimal-travel gimbal tour.
+
+    Candidate views come from binning the pan/tilt of every calibrated zone
+    cell into steps of the gimbal camera's field of view. Views over stale
+    zones are toured first, the rest after. Plans are cached by a
+    fingerprint of the calibration, so only a recalibration triggers a new
+    solve.
+    """
+
+    def __init__(
+        self,
+        pointing: PointingSolver,
+        zone_map: ZoneMap | None = None,
+        view_fov: Tuple[float, float] = (30.0, 20.0),
+        overlap: float = 0.15,
+    ) -> None:
+        self.pointing = pointing
+        self.zone_map = zone_map
+        self.view_fov = view_fov
+        self.overlap = overlap
+        self._views: Optional[List[ScanView]] = None
+        self._views_key = ""
+        self._plans: Dict[Tuple[str, frozenset, Pose], ScanPlan] = {}
+
+    def calibration_key(self) -> str:
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(self.pointing.pan_lut).tobytes())
+        digest.update(np.ascontiguousarray(self.pointing.tilt_lut).tobytes())
+        if self.zone_map is not None:
+            digest.update(np.ascontiguousarray(self.zone_map.labels).tobytes())
+            digest.update("|".join(self.zone_map.names).encode("utf-8"))
+        digest.update(repr((self.view_fov, self.overlap)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def views(self) -> List[ScanView]:
+        key = self.calibration_key()
+        if self._views is None or key != self._views_key:
+            self._views = self._coverage_views()
+            self._views_key = key
+            self._plans.clear()
+        return self._views
+
+    def plan(self, priority_zones: Iterable[str] = (), start: Pose = (0.0, 0.0)) -> ScanPlan:
+        views = self.views()
+        priority = frozenset(priority_zones)
+        # Start poses are bucketed so small jitter still hits the cache.
+        start_key = (round(start[0] / 5.0) * 5.0, round(start[1] / 5.0) * 5.0)
+        cache_key = (self._views_key, priority, start_key)
+        cached = self._plans.get(cache_key)
+        if cached is not None:
+            return cached
+
+        ordered: List[ScanView] = []
+        here = start_key
+        for tier in (
+            [view for view in views if view.zone in priority],
+            [view for view in views if view.zone not in priority],
+        ):
+            if not tier:
+                continue
+            points = np.array([(view.pan, view.tilt) for view in tier], dtype=np.float64)
+            tour = [tier[i] for i in order_views(points, here)]
+            ordered.extend(tour)
+            here = (tour[-1].pan, tour[-1].tilt)
+        plan = ScanPlan(views=ordered, travel_deg=tour_cost(ordered, start_key), priority_zones=set(priority))
+        self._plans[cache_key] = plan
+        return plan
+
+    def _coverage_views(self) -> List[ScanView]:
+        if self.zone_map is not None:
+            labels = self.zone_map.labels
+            rows, cols = np.nonzero(labels != NO_ZONE)
+            stride = self.zone_map.stride
+            points = np.stack([cols * stride + stride / 2.0, rows * stride + stride / 2.0], axis=1)
+            cell_zones = labels[rows, cols]
+        else:
+            width, height = self.pointing.size
+            xs, ys = np.meshgrid(np.arange(0, width, 8.0) + 4.0, np.arange(0, height, 8.0) + 4.0)
+            points = np.stack([xs.ravel(), ys.ravel()], axis=1)
+            cell_zones = np.full(len(points), NO_ZONE, dtype=np.int16)
+        if not len(points):
+            return []
+
+        angles = self.pointing.solve(points)
+        step = np.array(self.view_fov, dtype=np.float64) * (1.0 - self.overlap)
+        bins = np.floor(angles / step).astype(np.int64)
+        unique_bins, inverse = np.unique(bins, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        views = []
+        for index in range(len(unique_bins)):
+            members = inverse == index
+            pan, tilt = angles[members].mean(axis=0)
+            zone_ids = cell_zones[members]
+            zone_ids = zone_ids[zone_ids != NO_ZONE]
+            zone = None
+            if zone_ids.size and self.zone_map is not None:
+                zone = self.zone_map.names[int(np.bincount(zone_ids).argmax())]
+            views.append(ScanView(pan=round(float(pan), 2), tilt=round(float(tilt), 2), zone=zone))
+        return views
+
+
+class ScanExecutor:
+    """Drives a plan with gimbal moves overlapping detection.
+
+    Frames are grabbed at each view and handed to ``detect_batch`` in
+    batches on a worker thread, so the gimbal is already slewing to the
+    next views while the previous batch is being detected.
+    """
+
+    def __init__(
+        self,
+        hardware: HardwareController,
+        detector: ObjectDetector,
+        settle_s: float = 0.05,
+        batch_size: int = 4,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.hardware = hardware
+        self.detector = detector
+        self.settle_s = settle_s
+        self.batch_size = max(1, batch_size)
+        self.sleep = sleep
+
+    def run(self, plan: ScanPlan, camera: FrameSource, imgsz: int | None = None) -> List[ViewResult]:
+        results: List[ViewResult] = []
+        pending: List[Tuple[List[ScanView], Future]] = []
+        views: List[ScanView] = []
+        frames: List = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-detect") as worker:
+            for view in plan.views:
+                self.hardware.move_gimbal(view.pan, view.tilt)
+                self.sleep(self.settle_s)
+                frame = camera.read()
+                if frame is None:
+                    continue
+                # Keep a copy: cameras may reuse their buffer on the next read.
+                views.append(view)
+                frames.append(frame.copy())
+                if len(frames) >= self.batch_size:
+                    pending.append((views, worker.submit(self.detector.detect_batch, frames, imgsz)))
+                    views, frames = [], []
+            if frames:
+                pending.append((views, worker.submit(self.detector.detect_batch, frames, imgsz)))
+            for batch_views, future in pending:
+                for view, detections in zip(batch_views, future.result()):
+                    results.append(ViewResult(view=view, detections=detections))
+        return results
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from sentient_cube.control.hardware import HardwareController
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.vision.boxes import expand_box
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import ObjectDetector
+from sentient_cube.vision.tiling import TiledDetector
+
+BBox = Tuple[int, int, int, int]
+Pixel = Tuple[float, float]
+
+
+def find_laser_spot(frame: np.ndarray, region: BBox | None = None, min_score: int = 80) -> Optional[Pixel]:
+    """Centre of the reddest blob in ``region`` (BGR), or ``None`` if too faint."""
+    x1, y1 = 0, 0
+    view = frame
+    if region is not None:
+        x1, y1, x2, y2 = region
+        view = frame[y1:y2, x1:x2]
+    if not view.size:
+        return None
+    pixels = view.astype(np.int16)
+    redness = pixels[..., 2] - np.maximum(pixels[..., 0], pixels[..., 1])
+    peak = int(redness.max())
+    if peak < min_score:
+        return None
+    ys, xs = np.nonzero(redness >= peak - 20)
+    return (float(xs.mean()) + x1, float(ys.mean()) + y1)
+
+
+class AlphaBetaFilter:
+    """Constant-velocity alpha-beta filter that leads a moving target."""
+
+    def __init__(self, alpha: float = 0.6, beta: float = 0.3) -> None:
+        self.alpha = alpha
+        self.beta = beta
+        self.position: Optional[np.ndarray] = None
+        self.velocity = np.zeros(2)
+
+    def update(self, measurement: Pixel, dt: float) -> None:
+        observed = np.asarray(measurement, dtype=np.float64)
+        if self.position is None:
+            self.position = observed
+            return
+        predicted = self.position + self.velocity * dt
+        residual = observed - predicted
+        self.position = predicted + self.alpha * residual
+        if dt > 0:
+            self.velocity = self.velocity + self.beta * residual / dt
+
+    def predict(self, lead: float) -> Optional[Pixel]:
+        if self.position is None:
+            return None
+        x, y = self.position + self.velocity * lead
+        return (float(x), float(y))
+
+
+@dataclass
+class ServoConfig:
+    budget_ms: float = 50.0
+    gain: float = 0.7
+    tolerance_px: float = 4.0
+    settle_frames: int = 3
+    max_iterations: int = 60
+    roi_imgsz: int = 320
+    min_roi_imgsz: int = 160
+
+
+@dataclass
+class ServoStep:
+    target: Optional[Pixel]
+    spot: Optional[Pixel]
+    error_px: Optional[float]
+    command: Tuple[float, float]
+    latency_ms: float
+
+
+@dataclass
+class ServoResult:
+    converged: bool
+    iterations: int
+    error_px: Optional[float]
+    overruns: int
+    steps: List[ServoStep] = field(default_factory=list)
+
+
+class VisualServo:
+    """Closed-loop spotlight: drives the laser dot onto a detected object.
+
+    Each iteration grabs a frame, runs ROI detection around the last known
+    box, finds the laser dot and predicts where the target will be one
+    period ahead. The pixel error is mapped to a gimbal correction through
+    the pointing tables. Iterations are paced to ``budget_ms``; an overrun
+    halves the ROI model size so the next one fits.
+    """
+
+    def __init__(
+        self,
+        detector: ObjectDetector,
+        hardware: HardwareController,
+        pointing: PointingSolver,
+        config: ServoConfig | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.detector = detector
+        self.hardware = hardware
+        self.pointing = pointing
+        self.config = config or ServoConfig()
+        self.clock = clock
+        self.sleep = sleep
+
+    def run(
+        self,
+        camera: FrameSource,
+        label: str,
+        bbox: BBox | None = None,
+        pose: Tuple[float, float] | None = None,
+    ) -> ServoResult:
+        """Servo onto ``label``, starting the search at ``bbox`` seen from gimbal ``pose``.
+
+        A gimbal-mounted camera that has moved since ``bbox`` was seen would
+        find the object elsewhere in the frame, so the servo first aims
+        open-loop at it and then searches the whole frame.
+        """
+        cfg = self.config
+        if bbox is not None and pose is not None and self.pointing.relative:
+            state = self.hardware.get_state()
+            if not np.allclose(pose, (state.pan_angle, state.tilt_angle)):
+                self.hardware.move_gimbal(*self.pointing.aim(bbox, pose))
+                bbox = None
+        budget = cfg.budget_ms / 1000.0
+        imgsz = cfg.roi_imgsz
+        target_filter = AlphaBetaFilter()
+        steps: List[ServoStep] = []
+        settled = overruns = 0
+        error: Optional[float] = None
+        last = self.clock()
+
+        for _ in range(cfg.max_iterations):
+            start = self.clock()
+            dt, last = start - last, start
+            frame = camera.read()
+            if frame is None:
+                break
+            height, width = frame.shape[:2]
+            region = expand_box(bbox, width, height) if bbox is not None else (0, 0, width, height)
+
+            tiler = TiledDetector(self.detector, tile_size=imgsz * 2, imgsz=imgsz)
+            hits = [det for det in tiler.detect_regions(frame, [region]) if det.label == label]
+            if hits:
+                bbox = max(hits, key=lambda det: det.confidence).bbox
+                target_filter.update(((bbox[0] + bbox[2]) / 2.0, (bbox[1] + bbox[3]) / 2.0), dt)
+            target = target_filter.predict(max(dt, budget))
+            spot = find_laser_spot(frame, region) or find_laser_spot(frame)
+
+            state = self.hardware.get_state()
+            command = (state.pan_angle, state.tilt_angle)
+            error = None
+            if target is not None and spot is not None:
+                error = float(np.hypot(target[0] - spot[0], target[1] - spot[1]))
+                # Differences of table angles cancel the capture pose for relative solvers too.
+                delta = self.pointing.solve(np.array([target]))[0] - self.pointing.solve(np.array([spot]))[0]
+                command = (command[0] + cfg.gain * float(delta[0]), command[1] + cfg.gain * float(delta[1]))
+                self.hardware.move_gimbal(*command)
+            elif target is not None:
+                # Dot not visible: aim open-loop at the predicted target, from the pose this frame was seen at.
+                pan, tilt = self.pointing.solve(np.array([target]), np.array(command))[0]
+                command = (float(pan), float(tilt))
+                self.hardware.move_gimbal(*command)
+
+            elapsed = self.clock() - start
+            steps.append(ServoStep(target, spot, error, command, elapsed * 1000.0))
+            if error is not None and error <= cfg.tolerance_px:
+                settled += 1
+                if settled >= cfg.settle_frames:
+                    return ServoResult(True, len(steps), error, overruns, steps)
+            else:
+                settled = 0
+
+            if elapsed > budget:
+                overruns += 1
+                imgsz = max(cfg.min_roi_imgsz, (imgsz // 2) // 32 * 32)
+            else:
+                self.sleep(budget - elapsed)
+        return ServoResult(False, len(steps), error, overruns, steps)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from sentient_cube.control.hardware import MockHardwareController
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import Detection, ObjectDetector
+from sentient_cube.vision.image import ImageInput, load_frame
+
+BBox = Tuple[int, int, int, int]
+
+LASER_BGR = (40, 40, 255)
+
+
+class SlewingGimbal(MockHardwareController):
+    """Mock gimbal whose actual angles lag the command by a slew limit per tick."""
+
+    def __init__(self, slew_deg: float = 4.0) -> None:
+        super().__init__()
+        self.slew_deg = slew_deg
+        self.actual = (0.0, 0.0)
+
+    def tick(self) -> None:
+        pan, tilt = self.actual
+        state = self.get_state()
+        pan += float(np.clip(state.pan_angle - pan, -self.slew_deg, self.slew_deg))
+        tilt += float(np.clip(state.tilt_angle - tilt, -self.slew_deg, self.slew_deg))
+        self.actual = (pan, tilt)
+
+
+class DeskSimulator(FrameSource):
+    """Renders a desk with one coloured object and the laser dot.
+
+    The laser lands where the *true* optics put it: a pinhole camera whose
+    mount is off by ``mount_error`` degrees from what the calibration
+    assumes, so an open-loop aim misses and only feedback closes the gap.
+    Every ``read`` advances the object by ``velocity`` pixels and the gimbal
+    by one slew tick.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (640, 360),
+        hfov_deg: float = 70.0,
+        object_box: BBox = (400, 200, 440, 240),
+        velocity: Tuple[float, float] = (0.0, 0.0),
+        mount_error: Tuple[float, float] = (2.0, -1.5),
+        object_bgr: Tuple[int, int, int] = (30, 200, 30),
+        gimbal: SlewingGimbal | None = None,
+    ) -> None:
+        self.size = size
+        self.fx = (size[0] / 2.0) / math.tan(math.radians(hfov_deg) / 2.0)
+        self.box = np.array(object_box, dtype=np.float64)
+        self.velocity = np.array([*velocity, *velocity], dtype=np.float64)
+        self.mount_error = mount_error
+        self.object_bgr = object_bgr
+        self.gimbal = gimbal or SlewingGimbal()
+        self.frames = 0
+
+    @property
+    def object_bbox(self) -> BBox:
+        x1, y1, x2, y2 = (int(round(v)) for v in self.box)
+        return (x1, y1, x2, y2)
+
+    def laser_pixel(self) -> Optional[Tuple[float, float]]:
+        pan, tilt = self.gimbal.actual
+        pan -= self.mount_error[0]
+        tilt -= self.mount_error[1]
+        if abs(pan) >= 89.0 or abs(tilt) >= 89.0:
+            return None
+        x = self.size[0] / 2.0 + self.fx * math.tan(math.radians(pan))
+        y = self.size[1] / 2.0 - self.fx * math.tan(math.radians(tilt))
+        return (x, y)
+
+    def read(self) -> Optional[np.ndarray]:
+        self.gimbal.tick()
+        self.box += self.velocity
+        self.frames += 1
+        width, height = self.size
+        frame = np.full((height, width, 3), 110, dtype=np.uint8)
+        x1, y1, x2, y2 = self.object_bbox
+        frame[max(0, y1) : max(0, y2), max(0, x1) : max(0, x2)] = self.object_bgr
+        spot = self.laser_pixel()
+        if spot is not None:
+            sx, sy = int(round(spot[0])), int(round(spot[1]))
+            frame[max(0, sy - 2) : max(0, sy + 3), max(0, sx - 2) : max(0, sx + 3)] = LASER_BGR
+        return frame
+
+
+class ColorBlobDetector(ObjectDetector):
+    """Finds the simulator's object by its exact colour, in frames or crops."""
+
+    def __init__(self, label: str, bgr: Tuple[int, int, int], confidence: float = 0.9) -> None:
+        super().__init__()
+        self.label = label
+        self.bgr = np.array(bgr, dtype=np.uint8)
+        self.confidence = confidence
+
+    def detect(self, image: ImageInput, imgsz: int | None = None) -> List[Detection]:
+        del imgsz
+        frame = load_frame(image)
+        mask = np.all(frame == self.bgr, axis=-1)
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if not rows.size:
+            return []
+        bbox = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+        return self.config.filter([Detection(label=self.label, confidence=self.confidence, bbox=bbox)])
@@ -33,6 +33,12 @@ class DualBrainStateMachine:
             return self.switch(Mode.AMBIENT, reason=event)
         return StateSnapshot(mode=self.mode, changed_at=self.changed_at, reason="no_change")
 
+    def idle_deadline(self) -> datetime | None:
+        """When FOCUS will time out, or ``None`` in AMBIENT."""
+        if self.mode != Mode.FOCUS:
+            return None
+        return self.changed_at + self.idle_timeout
+
     def check_idle_timeout(self) -> StateSnapshot:
         if self.mode == Mode.FOCUS and datetime.now(timezone.utc) - self.changed_at >= self.idle_timeout:
             return self.switch(Mode.AMBIENT, reason="idle_timeout")
@@ -1,32 +1,91 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import Future
 from dataclasses import asdict
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Sequence, Set
 
 from sentient_cube.control.hardware import MockHardwareController
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.control.scan_planner import ScanExecutor, ScanPlanner, stale_zones
+from sentient_cube.control.servo import ServoConfig, ServoResult, VisualServo
 from sentient_cube.control.state_machine import DualBrainStateMachine
 from sentient_cube.memory.spatial_memory import SpatialMemoryDB
-from sentient_cube.models import IntentType, Mode, ObjectMemory, Reminder
+from sentient_cube.memory.utterance_log import Utterance, UtteranceLog
+from sentient_cube.models import Intent, IntentType, Mode, ObjectMemory, Reminder
 from sentient_cube.reminder.manager import ReminderManager
-from sentient_cube.vision.detector import MockObjectDetector, ObjectDetector
-from sentient_cube.voice.intent import parse_intent, parse_reminder_time
+from sentient_cube.reminder.store import ReminderStore
+from sentient_cube.system.deadline import DeadlineScheduler
+from sentient_cube.vision.boxes import expand_box
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import DetectionConfig, MockObjectDetector, ObjectDetector
+from sentient_cube.vision.hotswap import DetectorSwapper, SwapResult
+from sentient_cube.vision.image import ImageInput, PreparedFrame, prepare
+from sentient_cube.vision.multicam import MultiCameraRig
+from sentient_cube.vision.rate import DetectionRateController
+from sentient_cube.vision.tiling import TiledDetector
+from sentient_cube.vision.tracker import ObjectTracker, TrackEventType
+from sentient_cube.vision.zones import ZoneMap, ZoneRegistry
+from sentient_cube.voice.audio import AudioFrontEnd
+from sentient_cube.voice.intent import default_engine, parse_intent
+from sentient_cube.voice.streaming import StreamEventType, StreamingIntentRecognizer
+from sentient_cube.voice.time_parser import parse_time_spec, resolve
 
 
 class SentientCubeCore:
-    def __init__(self, db_path: str = "spatial_memory.db", detector: ObjectDetector | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str = "spatial_memory.db",
+        detector: ObjectDetector | None = None,
+        tracker: ObjectTracker | None = None,
+        detection_config: DetectionConfig | None = None,
+        zones: ZoneRegistry | None = None,
+        pointing: PointingSolver | None = None,
+    ) -> None:
         self.memory = SpatialMemoryDB(db_path=db_path)
+        self.utterances = UtteranceLog(self.memory)
         self.hardware = MockHardwareController()
         self.state_machine = DualBrainStateMachine()
-        self.reminder_manager = ReminderManager()
+        self.reminder_manager = ReminderManager(store=ReminderStore(self.memory))
+        self.scheduler: DeadlineScheduler | None = None
         self.detector = detector or MockObjectDetector()
+        if detection_config is not None:
+            self.detector.configure(detection_config)
+        self.tracker = tracker or ObjectTracker()
+        self.zones = zones or ZoneRegistry()
+        self.camera_pose = "default"
+        # Camera on the gimbal; its boxes are the only ones the pointing calibration applies to.
+        self.gimbal_camera = "main"
+        self.pointing = pointing or PointingSolver.from_pinhole()
+        self.scan_planner = ScanPlanner(self.pointing)
+        self.laser_target: str | None = None
+        self.roi_imgsz = 320
+        self.rate_controller = DetectionRateController(self.state_machine)
+        self.frame_lock = threading.RLock()
+        self.detector_swapper = DetectorSwapper(
+            get_detector=lambda: self.detector,
+            set_detector=lambda detector: setattr(self, "detector", detector),
+            frame_lock=self.frame_lock,
+        )
+        self.voice_stream: StreamingIntentRecognizer | None = None
+        self._prefetched: Dict[str, ObjectMemory | None] = {}
+        self._vocabulary: Set[str] = set()
+        self._early_find: tuple[str, Dict[str, Any]] | None = None
         self.emotion = "calm"
         self.last_message = "系统已启动"
 
     def set_mode(self, mode: Mode, reason: str = "manual") -> Dict[str, Any]:
         snapshot = self.state_machine.switch(mode, reason=reason)
+        self.rate_controller.notify()
+        if self.scheduler is not None:
+            # A switch into or within FOCUS moves the idle deadline.
+            self.scheduler.poke()
         self.hardware.set_mode(mode)
         if mode == Mode.AMBIENT:
             self.hardware.set_laser(False)
+            self.laser_target = None
         return {"mode": snapshot.mode.value, "reason": snapshot.reason}
 
     def set_emotion(self, emotion: str) -> Dict[str, Any]:
@@ -39,55 +98,387 @@ class SentientCubeCore:
         return SpatialMemoryDB.as_dict(memory)
 
     def find_object(self, name: str) -> Dict[str, Any]:
+        return self._find(name, self.memory.latest_object(name))
+
+    def _find(self, name: str, latest: ObjectMemory | None) -> Dict[str, Any]:
         self.set_mode(Mode.FOCUS, reason="find_request")
-        latest = self.memory.latest_object(name)
-        if latest is None:
-            self.last_message = f"没有找到{name}的位置信息。"
-            return {"found": False, "message": self.last_message}
+        self.rate_controller.trigger_burst()
+        result = self._find_result(name, latest, self._recall(name, latest))
+        self.last_message = result["message"]
+        if latest is not None:
+            self._light(name, latest)
+        return result
 
-        self.hardware.move_gimbal(15.0, -5.0)
-        self.hardware.set_laser(True)
-        self.last_message = f"{name} 在 {latest.location}。"
+    def _recall(self, name: str, latest: ObjectMemory | None) -> Utterance | None:
+        """Fallback for items never seen: the best past utterance mentioning them."""
+        if latest is not None:
+            return None
+        mentions = self.utterances.mentions(name, limit=1)
+        return mentions[0] if mentions else None
+
+    @staticmethod
+    def _find_result(name: str, latest: ObjectMemory | None, recalled: Utterance | None = None) -> Dict[str, Any]:
+        if latest is None and recalled is not None:
+            when = recalled.timestamp.astimezone().strftime("%m月%d日 %H:%M")
+            return {
+                "found": False,
+                "message": f"没有看到{name}，不过你在{when}说过：“{recalled.text}”。",
+                "recalled": {"text": recalled.text, "timestamp": recalled.timestamp.isoformat()},
+            }
+        if latest is None:
+            return {"found": False, "message": f"没有找到{name}的位置信息。"}
         return {
             "found": True,
-            "message": self.last_message,
+            "message": f"{name} 在 {latest.location}。",
             "memory": SpatialMemoryDB.as_dict(latest),
         }
 
-    def detect_and_remember(self, image_path: str, location_hint: str = "桌面区域") -> Dict[str, Any]:
-        detections = self.detector.detect(image_path)
-        accepted = []
-        for det in detections:
-            if det.confidence < 0.35:
-                continue
+    def detect_and_remember(
+        self,
+        image: ImageInput,
+        location_hint: str = "桌面区域",
+        imgsz: int | None = None,
+        camera: str = "main",
+    ) -> Dict[str, Any]:
+        with self.frame_lock:
+            on_gimbal = camera == self.gimbal_camera
+            pose = self._gimbal_pose() if on_gimbal else None
+            # Encoded inputs are decoded no larger than the model will look at.
+            frame = prepare(image, decode_size=self._decode_size(imgsz))
+            # Settle the zone map before tracking, so a frame it cannot map still records its events.
+            zones = self._zones_for_frame(camera, frame)
+            accepted = self.detector.detect(frame, imgsz=imgsz)
+            events = self.tracker.update(accepted)
+            locations = self._locate(zones, [event.bbox for event in events], location_hint)
+            recorded = 0
+            for event, location in zip(events, locations):
+                if event.kind == TrackEventType.LEFT:
+                    if event.label == self.laser_target:
+                        self.hardware.set_laser(False)
+                        self.laser_target = None
+                    continue
+                memory = ObjectMemory(
+                    name=event.label,
+                    location=location,
+                    confidence=event.confidence,
+                    bbox=event.bbox,
+                    pose=pose,
+                    camera=camera,
+                )
+                self.memory.add_object(memory)
+                recorded += 1
+                if on_gimbal and event.label == self.laser_target and event.kind == TrackEventType.MOVED:
+                    self._point_laser(event.bbox, pose)
+            self.last_message = f"识别完成，共记录 {recorded} 个目标。"
+            return {
+                "detections": [
+                    {"label": det.label, "confidence": det.confidence, "bbox": det.bbox} for det in accepted
+                ],
+                "count": len(accepted),
+                "events": [
+                    {
+                        "event": event.kind.value,
+                        "track_id": event.track_id,
+                        "label": event.label,
+                        "bbox": event.bbox,
+                        "location": location,
+                    }
+                    for event, location in zip(events, locations)
+                ],
+                "recorded": recorded,
+            }
+
+    def locate_object(
+        self,
+        name: str,
+        image: ImageInput,
+        location_hint: str = "桌面区域",
+        camera: str = "main",
+    ) -> Dict[str, Any]:
+        with self.frame_lock:
+            pose = self._gimbal_pose() if camera == self.gimbal_camera else None
+            tiler = TiledDetector(self.detector, tile_size=self.roi_imgsz * 2, imgsz=self.roi_imgsz)
+            # Keep enough pixels for a grid of tiles; a smaller decode would defeat the tiling.
+            frame = prepare(image, decode_size=2 * tiler.tile_size)
+            width, height = frame.source_size
+            latest = self.memory.latest_object(name)
+            hits = []
+            if latest is not None and latest.bbox is not None:
+                region = expand_box(latest.bbox, width, height)
+                hits = [det for det in tiler.detect_regions(frame, [region]) if det.label == name]
+            if not hits:
+                hits = [det for det in tiler.detect(frame) if det.label == name]
+            if not hits:
+                self.last_message = f"画面中没有看到{name}。"
+                return {"found": False, "message": self.last_message}
+
+            best = max(hits, key=lambda det: det.confidence)
+            location = self._locate(self._zones_for_frame(camera, frame), [best.bbox], location_hint)[0]
             memory = ObjectMemory(
-                name=det.label,
-                location=location_hint,
-                confidence=det.confidence,
+                name=name, location=location, confidence=best.confidence, bbox=best.bbox, pose=pose, camera=camera
             )
             self.memory.add_object(memory)
-            accepted.append(
-                {
-                    "label": det.label,
-                    "confidence": det.confidence,
-                    "bbox": det.bbox,
-                }
+            self.last_message = f"{name} 在 {location}。"
+            return {"found": True, "message": self.last_message, "memory": SpatialMemoryDB.as_dict(memory)}
+
+    def detect_from_camera(self, camera: FrameSource, location_hint: str = "桌面区域") -> Dict[str, Any]:
+        frame = camera.read()
+        if frame is None:
+            self.last_message = "摄像头没有返回画面。"
+            return {"detections": [], "count": 0, "events": [], "recorded": 0}
+        return self.detect_and_remember(frame, location_hint=location_hint)
+
+    def detect_multi(self, rig: MultiCameraRig) -> Dict[str, Any]:
+        step = rig.step()
+        gimbal_pose = self._gimbal_pose()
+        memories = []
+        for item in step.fused:
+            event = item.event
+            if event.kind == TrackEventType.LEFT:
+                # One camera losing the object is not enough while another still tracks it.
+                if event.label == self.laser_target and not rig.is_tracking(event.label):
+                    self.hardware.set_laser(False)
+                    self.laser_target = None
+                continue
+            memories.append(
+                ObjectMemory(
+                    name=event.label,
+                    location=item.location,
+                    confidence=event.confidence,
+                    timestamp=datetime.fromtimestamp(item.timestamp, timezone.utc),
+                    bbox=event.bbox,
+                    pose=gimbal_pose if item.camera == self.gimbal_camera else None,
+                    camera=item.camera,
+                )
+            )
+        recorded = self.memory.add_objects(memories)
+        self.last_message = f"多路识别完成，共记录 {recorded} 个目标。"
+        return {
+            "events": [
+                {"camera": item.camera, "event": item.event.kind.value, "label": item.event.label}
+                for item in step.fused
+            ],
+            "recorded": recorded,
+            "cameras": step.captured,
+            "dropped": step.dropped,
+        }
+
+    def spotlight(
+        self,
+        camera: FrameSource,
+        name: str | None = None,
+        config: ServoConfig | None = None,
+    ) -> ServoResult:
+        """Close the loop after ``find_object``: servo the laser onto the object."""
+        name = name or self.laser_target
+        if name is None:
+            return ServoResult(converged=False, iterations=0, error_px=None, overruns=0)
+        latest = self.memory.latest_object(name)
+        servo = VisualServo(self.detector, self.hardware, self.pointing, config=config or ServoConfig())
+        if latest is None or not self._aimable(latest):
+            result = servo.run(camera, name)
+        else:
+            result = servo.run(camera, name, bbox=latest.bbox, pose=latest.pose)
+        self._sync_camera_pose()
+        self.last_message = f"已锁定{name}。" if result.converged else f"未能锁定{name}。"
+        return result
+
+    def scan_desk(self, camera: FrameSource, location_hint: str = "桌面区域") -> Dict[str, Any]:
+        """Sweep the gimbal camera over the desk and refresh spatial memory."""
+        zone_map = self.zones.get(self.gimbal_camera, "default")
+        # Re-point the planner at the live calibration; its cache key notices changes.
+        self.scan_planner.pointing = self.pointing
+        self.scan_planner.zone_map = zone_map
+        priority = set()
+        if zone_map is not None:
+            priority = stale_zones(self.memory.location_freshness(), zone_map.names)
+        plan = self.scan_planner.plan(priority, start=self._gimbal_pose())
+        with self.frame_lock:
+            results = ScanExecutor(self.hardware, self.detector).run(plan, camera)
+            self._sync_camera_pose()
+        memories = [
+            ObjectMemory(
+                name=det.label,
+                location=result.view.zone or location_hint,
+                confidence=det.confidence,
+                bbox=det.bbox,
+                pose=(result.view.pan, result.view.tilt),
+                camera=self.gimbal_camera,
             )
-        self.last_message = f"识别完成，共记录 {len(accepted)} 个目标。"
-        return {"detections": accepted, "count": len(accepted)}
+            for result in results
+            for det in result.detections
+        ]
+        recorded = self.memory.add_objects(memories)
+        self.last_message = f"桌面扫描完成，{len(plan.views)} 个视角，记录 {recorded} 个目标。"
+        return {
+            "views": len(plan.views),
+            "travel_deg": plan.travel_deg,
+            "priority_zones": sorted(plan.priority_zones),
+            "recorded": recorded,
+        }
+
+    def hot_swap_detector(
+        self,
+        factory: Callable[[], ObjectDetector],
+        warmup_image: ImageInput | None = None,
+    ) -> "Future[SwapResult]":
+        return self.detector_swapper.swap(factory, warmup_image=warmup_image)
+
+    def set_camera_pose(self, pose: str) -> None:
+        """Select which calibrated zone map applies to the gimbal camera.
+
+        Registries whose poses carry gimbal angles track the pose themselves
+        after every gimbal move; this is for registries without them.
+        """
+        self.camera_pose = pose
+
+    def _sync_camera_pose(self) -> None:
+        """Follow the gimbal to the zone map calibrated at its current angles."""
+        if self.zones.poses:
+            # Between calibrated poses the registry's default map applies.
+            self.camera_pose = self.zones.pose_at(*self._gimbal_pose()) or "default"
+
+    def _zones_for_frame(self, camera: str, frame: PreparedFrame) -> tuple[ZoneMap, tuple[float, float]] | None:
+        """The zone map for ``camera`` and the scale onto it, or ``None`` if the frame cannot be mapped."""
+        zone_map = self.zones.get(camera, self.camera_pose)
+        if zone_map is None:
+            return None
+        scale = zone_map.frame_scale(frame.source_size)
+        return None if scale is None else (zone_map, scale)
+
+    @staticmethod
+    def _locate(
+        zones: tuple[ZoneMap, tuple[float, float]] | None,
+        boxes: Sequence[tuple[int, int, int, int]],
+        fallback: str,
+    ) -> List[str]:
+        if zones is None or not boxes:
+            return [fallback] * len(boxes)
+        zone_map, scale = zones
+        return zone_map.zones_for(boxes, fallback, scale)
+
+    def _decode_size(self, imgsz: int | None) -> int:
+        return imgsz or self.detector.imgsz or ObjectDetector.imgsz
+
+    def _gimbal_pose(self) -> tuple[float, float]:
+        state = self.hardware.get_state()
+        return (state.pan_angle, state.tilt_angle)
+
+    def _aimable(self, memory: ObjectMemory) -> bool:
+        """Whether the memory's box is in gimbal-camera pixels the pointing solver understands."""
+        if memory.camera is None:
+            # Rows from before cameras were recorded carry a pose only when the gimbal saw them.
+            return memory.pose is not None
+        return memory.camera == self.gimbal_camera
+
+    def _light(self, name: str, memory: ObjectMemory) -> None:
+        """Aim the laser at a remembered object and switch it on.
+
+        A box seen only by another camera cannot be aimed at, so the laser
+        stays where it is and the zone in the answer has to do.
+        """
+        if memory.bbox is not None and not self._aimable(memory):
+            return
+        self._point_laser(memory.bbox, memory.pose)
+        self.hardware.set_laser(True)
+        self.laser_target = name
+
+    def _point_laser(
+        self,
+        bbox: tuple[int, int, int, int] | None,
+        pose: tuple[float, float] | None = None,
+    ) -> None:
+        if bbox is None:
+            # Memories written without a box (manual entries) carry no position to aim at.
+            return
+        pan, tilt = self.pointing.aim(bbox, pose)
+        self.hardware.move_gimbal(pan, tilt)
+        self._sync_camera_pose()
 
     def add_reminder(self, time_text: str, content: str, location: str = "") -> Dict[str, Any]:
-        reminder = Reminder(content=content, remind_at=parse_reminder_time(time_text), location=location)
+        spec = parse_time_spec(time_text.strip())
+        remind_at = resolve(spec, datetime.now())
+        if remind_at is None:
+            self.last_message = f"无法识别的时间：{time_text}"
+            return {"content": content, "remind_at": None, "message": self.last_message}
+        reminder = Reminder(
+            content=content,
+            remind_at=remind_at,
+            location=location,
+            repeat_daily=spec.repeat_daily,
+            recurrence=spec.recurrence,
+        )
         self.reminder_manager.add(reminder)
         self.last_message = f"已设置提醒：{time_text} 提醒 {content}"
         return {
             "content": reminder.content,
             "remind_at": reminder.remind_at.isoformat(),
             "location": reminder.location,
+            "recurrence": reminder.rule.to_rrule() if reminder.rule is not None else "",
         }
 
     def process_text(self, text: str) -> Dict[str, Any]:
         intent = parse_intent(text)
+        self.utterances.log(intent)
+        return self._dispatch(intent)
+
+    def begin_utterance(self) -> None:
+        """Start streaming recognition; known object names become prefetch triggers."""
+        self.voice_stream = StreamingIntentRecognizer(default_engine(), vocabulary=self.memory.known_names())
+        self._vocabulary = set(self.voice_stream.vocabulary)
+        self._prefetched = {}
+        self._early_find = None
+
+    def feed_partial(self, text: str) -> List[Dict[str, Any]]:
+        """React to a partial transcript before the user stops talking."""
+        if self.voice_stream is None:
+            self.begin_utterance()
+        events = self.voice_stream.update(text)
+        for event in events:
+            if event.kind == StreamEventType.PREFETCH:
+                self._prefetched[event.item] = self.memory.latest_object(event.item)
+            elif event.kind == StreamEventType.PROVISIONAL and event.intent.intent_type == IntentType.FIND:
+                # Only act early on names memory knows; other readings may still change and wait for the endpoint.
+                item = event.item
+                if item in self._vocabulary:
+                    if item not in self._prefetched:
+                        self._prefetched[item] = self.memory.latest_object(item)
+                    self._early_find = (item, self._find(item, self._prefetched[item]))
+        return [
+            {
+                "event": event.kind.value,
+                "item": event.item,
+                "intent": event.intent.intent_type.value if event.intent else "",
+            }
+            for event in events
+        ]
+
+    def end_utterance(self) -> Dict[str, Any]:
+        """Endpoint reached: dispatch the final intent, reusing early work."""
+        if self.voice_stream is None:
+            return self._dispatch(parse_intent(""))
+        intent = self.voice_stream.finish().intent
+        prefetched, early = self._prefetched, self._early_find
+        self.voice_stream = None
+        self.utterances.log(intent)
+        if early is not None and (intent.intent_type != IntentType.FIND or intent.item != early[0]):
+            # The user ended on a different reading: undo the early spotlight before answering.
+            if self.laser_target == early[0]:
+                self.hardware.set_laser(False)
+                self.laser_target = None
+            early = None
+        if intent.intent_type == IntentType.FIND:
+            if early is not None:
+                result = early[1]
+                self.last_message = result["message"]
+            elif intent.item in prefetched:
+                result = self._find(intent.item, prefetched[intent.item])
+            else:
+                result = self.find_object(intent.item)
+            return {"intent": intent.intent_type.value, "result": result}
+        return self._dispatch(intent)
+
+    def _dispatch(self, intent: Intent) -> Dict[str, Any]:
         if intent.intent_type == IntentType.FIND:
             result = self.find_object(intent.item)
             return {"intent": intent.intent_type.value, "result": result}
@@ -104,6 +495,131 @@ class SentientCubeCore:
         self.last_message = "我在，已收到你的指令。"
         return {"intent": IntentType.CHAT.value, "result": {"message": self.last_message}}
 
+    def listen(self, front_end: AudioFrontEnd) -> List[Dict[str, Any]]:
+        """Run an audio front end to the end, handling each transcript as it arrives."""
+        results: List[Dict[str, Any]] = []
+        front_end.on_text = lambda text: results.append(self.process_text(text))
+        front_end.run()
+        return results
+
+    def process_many(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Handle a burst of utterances with one memory query and one hardware update.
+
+        Results match what ``process_text`` would return for each text in
+        turn. All FIND items are looked up together, and only the final mode
+        and laser target are applied to the hardware.
+        """
+        intents = [parse_intent(text) for text in texts]
+        memories = self.memory.latest_objects(
+            [intent.item for intent in intents if intent.intent_type == IntentType.FIND]
+        )
+
+        final_mode: tuple[Mode, str] | None = None
+        laser: tuple[str, ObjectMemory] | None = None
+        # An AMBIENT switch with no later found object leaves the laser off.
+        laser_off = False
+        burst = False
+        results: List[Dict[str, Any]] = []
+        for intent in intents:
+            # Logged in turn, so a find only recalls what was said before it.
+            self.utterances.log(intent)
+            if intent.intent_type == IntentType.FIND:
+                final_mode = (Mode.FOCUS, "find_request")
+                burst = True
+                latest = memories.get(intent.item)
+                result = self._find_result(intent.item, latest, self._recall(intent.item, latest))
+                if latest is not None:
+                    laser = (intent.item, latest)
+                    laser_off = False
+                self.last_message = result["message"]
+            elif intent.intent_type == IntentType.REMINDER:
+                result = self.add_reminder(intent.time_text, intent.content)
+            elif intent.intent_type == IntentType.MODE and intent.mode is not None:
+                final_mode = (intent.mode, "voice_command")
+                if intent.mode == Mode.AMBIENT:
+                    laser = None
+                    laser_off = True
+                result = {"mode": intent.mode.value, "reason": "voice_command"}
+                self.last_message = f"已切换到{'左脑' if intent.mode == Mode.FOCUS else '右脑'}模式"
+            else:
+                self.last_message = "我在，已收到你的指令。"
+                results.append({"intent": IntentType.CHAT.value, "result": {"message": self.last_message}})
+                continue
+            results.append({"intent": intent.intent_type.value, "result": result})
+
+        if laser_off and final_mode is not None and final_mode[0] != Mode.AMBIENT:
+            # set_mode only turns the laser off for AMBIENT, which was overridden later in the batch.
+            self.hardware.set_laser(False)
+            self.laser_target = None
+        if final_mode is not None:
+            self.set_mode(*final_mode)
+        if burst:
+            self.rate_controller.trigger_burst()
+        if laser is not None:
+            self._light(*laser)
+        return results
+
+    def start_scheduler(self, on_tick: Callable[[Dict[str, Any]], None] | None = None) -> DeadlineScheduler:
+        """Run ``tick`` exactly at the next reminder or idle timeout, with no polling.
+
+        The same thread flushes the utterance log when its pending batch
+        ages out, so the last utterances of a session reach disk on time,
+        and slides the reminder window forward. Neither of those calls
+        ``on_tick``, which only hears about reminders and idle timeouts.
+        """
+        if self.scheduler is not None:
+            return self.scheduler
+
+        def next_reminder() -> float | None:
+            due = self.reminder_manager.next_due()
+            return None if due is None else due.timestamp()
+
+        def reminder_refill() -> float | None:
+            refill = self.reminder_manager.next_refill()
+            return None if refill is None else refill.timestamp()
+
+        def idle_timeout() -> float | None:
+            deadline = self.state_machine.idle_deadline()
+            return None if deadline is None else deadline.timestamp()
+
+        def utterance_flush() -> float | None:
+            due_in = self.utterances.flush_due_in()
+            return None if due_in is None else time.time() + due_in
+
+        def fire() -> None:
+            self.utterances.flush_if_due()
+            now = time.time()
+            refill = reminder_refill()
+            if refill is not None and refill <= now:
+                self.reminder_manager.refill()
+            if not any(deadline is not None and deadline <= now for deadline in (next_reminder(), idle_timeout())):
+                # Only housekeeping was due; there is no state change to report.
+                return
+            payload = self.tick()
+            if on_tick is not None:
+                on_tick(payload)
+
+        self.scheduler = DeadlineScheduler(
+            {
+                "reminder": next_reminder,
+                "refill": reminder_refill,
+                "idle": idle_timeout,
+                "utterances": utterance_flush,
+            },
+            fire,
+        )
+        self.reminder_manager.on_change = self.scheduler.poke
+        self.utterances.on_change = self.scheduler.poke
+        self.scheduler.start()
+        return self.scheduler
+
+    def stop_scheduler(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.reminder_manager.on_change = None
+            self.utterances.on_change = None
+            self.scheduler = None
+
     def tick(self) -> Dict[str, Any]:
         due = self.reminder_manager.due_reminders()
         if due:
@@ -115,8 +631,12 @@ class SentientCubeCore:
             self.hardware.set_laser(False)
         return self.status()
 
-    def status(self) -> Dict[str, Any]:
+    def status(self, full: bool = False) -> Dict[str, Any]:
+        """Current state. ``reminders`` holds the recently fired and the next 20
+        pending reminders; ``full=True`` lists every reminder instead."""
         hardware_state = self.hardware.get_state()
+        manager = self.reminder_manager
+        reminders = manager.list_all() if full else [*manager.retired, *manager.upcoming()]
         return {
             "mode": self.state_machine.mode.value,
             "emotion": self.emotion,
@@ -124,9 +644,12 @@ class SentientCubeCore:
             "hardware": asdict(hardware_state),
             "reminders": [
                 {"content": r.content, "remind_at": r.remind_at.isoformat(), "triggered": r.triggered}
-                for r in self.reminder_manager.list()
+                for r in reminders
             ],
         }
 
     def close(self) -> None:
+        self.stop_scheduler()
+        self.detector_swapper.shutdown()
+        self.utterances.close()
         self.memory.close()
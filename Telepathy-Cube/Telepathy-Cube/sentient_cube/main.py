@@ -4,7 +4,10 @@ import argparse
 import json
 import time
 
+from sentient_cube.control.kinematics import PointingSolver
 from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.detector import DetectionConfig
+from sentient_cube.vision.zones import ZoneRegistry
 
 
 def main() -> None:
@@ -13,9 +16,15 @@ def main() -> None:
     parser.add_argument("--command", default="", help="One-shot text command")
     parser.add_argument("--detect-image", default="", help="Run object detection for one image")
     parser.add_argument("--location-hint", default="桌面区域", help="Location label for detected objects")
+    parser.add_argument("--detection-config", default="", help="JSON file with class allowlist and thresholds")
+    parser.add_argument("--zones", default="", help="JSON file with calibrated per-camera zone polygons")
+    parser.add_argument("--pointing", default="", help="JSON gimbal calibration (pinhole or laser samples)")
     args = parser.parse_args()
 
-    core = SentientCubeCore(db_path=args.db)
+    detection_config = DetectionConfig.from_file(args.detection_config) if args.detection_config else None
+    zones = ZoneRegistry.from_file(args.zones) if args.zones else None
+    pointing = PointingSolver.from_file(args.pointing) if args.pointing else None
+    core = SentientCubeCore(db_path=args.db, detection_config=detection_config, zones=zones, pointing=pointing)
     try:
         if args.command:
             print(json.dumps(core.process_text(args.command), ensure_ascii=False, indent=2))
@@ -34,6 +43,8 @@ def main() -> None:
             return
 
         print("Sentient Cube core started. Type command and press Enter, type 'exit' to quit.")
+        # Reminders and the FOCUS idle timeout fire on time without waiting for input.
+        core.start_scheduler(on_tick=lambda payload: print(json.dumps(payload, ensure_ascii=False, indent=2)))
         while True:
             text = input("> ").strip()
             if text.lower() in {"exit", "quit"}:
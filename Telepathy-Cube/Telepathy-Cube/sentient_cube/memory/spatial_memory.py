@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from sentient_cube.models import ObjectMemory
 
 
 class SpatialMemoryDB:
+    _INSERT = """
+        INSERT INTO objects (name, location, confidence, timestamp, bbox, pose, camera)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "spatial_memory.db") -> None:
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(self.db_path)
+        # Detection loops write from worker threads; the lock serialises access.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -25,71 +33,153 @@ class SpatialMemoryDB:
                 name TEXT NOT NULL,
                 location TEXT NOT NULL,
                 confidence REAL NOT NULL,
-                timestamp TEXT NOT NULL
+                timestamp TEXT NOT NULL,
+                bbox TEXT,
+                pose TEXT,
+                camera TEXT
             )
             """
         )
+        columns = {row["name"] for row in cur.execute("PRAGMA table_info(objects)")}
+        if "bbox" not in columns:
+            cur.execute("ALTER TABLE objects ADD COLUMN bbox TEXT")
+        if "pose" not in columns:
+            cur.execute("ALTER TABLE objects ADD COLUMN pose TEXT")
+        if "camera" not in columns:
+            cur.execute("ALTER TABLE objects ADD COLUMN camera TEXT")
         self.conn.commit()
 
     def add_object(self, memory: ObjectMemory) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO objects (name, location, confidence, timestamp)
-            VALUES (?, ?, ?, ?)
-            """,
-            (memory.name, memory.location, memory.confidence, memory.timestamp.isoformat()),
-        )
-        self.conn.commit()
-        return int(cur.lastrowid)
+        with self.lock:
+            cur = self.conn.cursor()
+            cur.execute(self._INSERT, self._to_row(memory))
+            self.conn.commit()
+            return int(cur.lastrowid)
+
+    def add_objects(self, memories: Sequence[ObjectMemory]) -> int:
+        """Insert many rows in one transaction; returns the number written."""
+        rows = [self._to_row(memory) for memory in memories]
+        if not rows:
+            return 0
+        with self.lock:
+            self.conn.executemany(self._INSERT, rows)
+            self.conn.commit()
+        return len(rows)
 
     def latest_object(self, name: str) -> Optional[ObjectMemory]:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT name, location, confidence, timestamp
-            FROM objects
-            WHERE name = ?
-            ORDER BY timestamp DESC
-            LIMIT 1
-            """,
-            (name,),
+        with self.lock:
+            cur = self.conn.cursor()
+            cur.execute(
+                """
+                SELECT name, location, confidence, timestamp, bbox, pose, camera
+                FROM objects
+                WHERE name = ?
+                ORDER BY timestamp DESC
+                LIMIT 1
+                """,
+                (name,),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            return self._row_to_memory(row)
+
+    def latest_objects(self, names: Sequence[str]) -> Dict[str, ObjectMemory]:
+        """Latest memory for each of ``names`` in one query; absent names are omitted."""
+        unique = list(dict.fromkeys(names))
+        if not unique:
+            return {}
+        placeholders = ",".join("?" * len(unique))
+        with self.lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT name, location, confidence, timestamp, bbox, pose, camera
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY name ORDER BY timestamp DESC) AS rank
+                    FROM objects
+                    WHERE name IN ({placeholders})
+                )
+                WHERE rank = 1
+                """,
+                unique,
+            ).fetchall()
+        return {row["name"]: self._row_to_memory(row) for row in rows}
+
+    def known_names(self) -> List[str]:
+        with self.lock:
+            rows = self.conn.execute("SELECT DISTINCT name FROM objects").fetchall()
+        return [row["name"] for row in rows]
+
+    def history(self, name: str, limit: int = 10) -> List[ObjectMemory]:
+        with self.lock:
+            cur = self.conn.cursor()
+            cur.execute(
+                """
+                SELECT name, location, confidence, timestamp, bbox, pose, camera
+                FROM objects
+                WHERE name = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (name, limit),
+            )
+            rows = cur.fetchall()
+            return [self._row_to_memory(row) for row in rows]
+
+    def location_freshness(self) -> Dict[str, Tuple[datetime, float]]:
+        """Latest sighting time and its mean confidence for every location."""
+        with self.lock:
+            rows = self.conn.execute(
+                """
+                SELECT location, MAX(timestamp) AS latest, AVG(confidence) AS confidence
+                FROM objects
+                GROUP BY location
+                """
+            ).fetchall()
+        return {row["location"]: (datetime.fromisoformat(row["latest"]), float(row["confidence"])) for row in rows}
+
+    @classmethod
+    def _to_row(cls, memory: ObjectMemory) -> tuple:
+        pose = None if memory.pose is None else ",".join(f"{v:.3f}" for v in memory.pose)
+        return (
+            memory.name,
+            memory.location,
+            memory.confidence,
+            memory.timestamp.isoformat(),
+            cls._encode_bbox(memory.bbox),
+            pose,
+            memory.camera,
         )
-        row = cur.fetchone()
-        if not row:
+
+    @staticmethod
+    def _encode_bbox(bbox: Optional[Tuple[int, int, int, int]]) -> Optional[str]:
+        if bbox is None:
             return None
+        return ",".join(str(int(v)) for v in bbox)
+
+    @staticmethod
+    def _row_to_memory(row: sqlite3.Row) -> ObjectMemory:
+        bbox = None
+        if row["bbox"]:
+            x1, y1, x2, y2 = (int(v) for v in row["bbox"].split(","))
+            bbox = (x1, y1, x2, y2)
+        pose = None
+        if row["pose"]:
+            pan, tilt = (float(v) for v in row["pose"].split(","))
+            pose = (pan, tilt)
         return ObjectMemory(
             name=row["name"],
             location=row["location"],
             confidence=float(row["confidence"]),
             timestamp=datetime.fromisoformat(row["timestamp"]),
+            bbox=bbox,
+            pose=pose,
+            camera=row["camera"],
         )
 
-    def history(self, name: str, limit: int = 10) -> List[ObjectMemory]:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT name, location, confidence, timestamp
-            FROM objects
-            WHERE name = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-            """,
-            (name, limit),
-        )
-        rows = cur.fetchall()
-        return [
-            ObjectMemory(
-                name=row["name"],
-                location=row["location"],
-                confidence=float(row["confidence"]),
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-            )
-            for row in rows
-        ]
-
     def close(self) -> None:
-        self.conn.close()
+        with self.lock:
+            self.conn.close()
 
     @staticmethod
     def as_dict(memory: ObjectMemory) -> dict:
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+from sentient_cube.memory.spatial_memory import SpatialMemoryDB
+from sentient_cube.models import Intent, IntentType
+
+_TERMS = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]+|[0-9a-z]+")
+
+
+def _is_cjk(run: str) -> bool:
+    return not run.isascii()
+
+
+def index_terms(text: str) -> List[str]:
+    """FTS terms for ``text``: CJK runs as overlapping bigrams, other words whole.
+
+    Each CJK run also ends with its last character on its own, so every
+    character starts some term and a one-character search can use a
+    prefix query.
+    """
+    terms: List[str] = []
+    for run in _TERMS.findall(text.lower()):
+        if _is_cjk(run):
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+            terms.append(run[-1])
+        else:
+            terms.append(run)
+    return terms
+
+
+def match_query(item: str) -> str:
+    """FTS5 phrase matching ``item`` against ``index_terms`` output."""
+    parts: List[str] = []
+    for run in _TERMS.findall(item.lower()):
+        if _is_cjk(run) and len(run) > 1:
+            parts.extend(f'"{run[i : i + 2]}"' for i in range(len(run) - 1))
+        elif _is_cjk(run):
+            parts.append(f'"{run}"*')
+        else:
+            parts.append(f'"{run}"')
+    return " + ".join(parts)
+
+
+@dataclass
+class Utterance:
+    text: str
+    intent: str
+    item: str = ""
+    timestamp: datetime | None = None
+    id: Optional[int] = None
+    score: float = 0.0
+
+
+class UtteranceLog:
+    """Every recognised utterance, full-text indexed next to spatial memory.
+
+    Rows live in the same SQLite file as ``objects``. The FTS5 index is
+    contentless and holds pre-split terms (CJK bigrams), since the default
+    tokenizer treats a whole Chinese sentence as one token. Writes are
+    buffered and flushed in one transaction once ``batch_size`` rows are
+    pending or the oldest pending row is ``flush_interval_s`` old; reads
+    flush first, so they always see every logged utterance.
+
+    ``log`` only checks the age rule when it is called. To flush an aged
+    batch on time after the last utterance, a timer polls ``flush_due_in``
+    and calls ``flush_if_due``; ``on_change`` fires when a new batch starts
+    so the timer can re-arm. The core's deadline scheduler does this.
+    Without it, rows wait for the next utterance, read or ``close``.
+    """
+
+    def __init__(
+        self,
+        memory: SpatialMemoryDB,
+        batch_size: int = 32,
+        flush_interval_s: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.conn = memory.conn
+        self.lock = memory.lock
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.clock = clock
+        self._pending: List[Tuple[str, str, str, str]] = []
+        self._oldest = 0.0
+        self.on_change: Optional[Callable[[], None]] = None
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self.lock:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS utterances (
+                    id INTEGER PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    intent TEXT NOT NULL,
+                    item TEXT NOT NULL DEFAULT ''
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS utterance_fts USING fts5(terms, content='');
+                """
+            )
+
+    def log(self, intent: Intent, timestamp: datetime | None = None) -> None:
+        if not intent.raw_text:
+            return
+        stamp = (timestamp or datetime.now(timezone.utc)).isoformat()
+        with self.lock:
+            started = not self._pending
+            if started:
+                self._oldest = self.clock()
+            self._pending.append((stamp, intent.raw_text, intent.intent_type.value, intent.item))
+            due = len(self._pending) >= self.batch_size or self.clock() - self._oldest >= self.flush_interval_s
+        if due:
+            self.flush()
+        elif started and self.on_change is not None:
+            self.on_change()
+
+    def flush_due_in(self) -> Optional[float]:
+        """Seconds until the pending batch ages out, or ``None`` if nothing is pending."""
+        with self.lock:
+            if not self._pending:
+                return None
+            return max(0.0, self._oldest + self.flush_interval_s - self.clock())
+
+    def flush_if_due(self) -> int:
+        due_in = self.flush_due_in()
+        return self.flush() if due_in is not None and due_in <= 0 else 0
+
+    def flush(self) -> int:
+        """Write pending utterances in one transaction; returns how many."""
+        with self.lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            first = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM utterances").fetchone()[0]
+            ids = range(first, first + len(rows))
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO utterances (id, timestamp, text, intent, item) VALUES (?, ?, ?, ?, ?)",
+                    [(row_id, *row) for row_id, row in zip(ids, rows)],
+                )
+                self.conn.executemany(
+                    "INSERT INTO utterance_fts (rowid, terms) VALUES (?, ?)",
+                    [(row_id, " ".join(index_terms(row[1]))) for row_id, row in zip(ids, rows)],
+                )
+        return len(rows)
+
+    def mentions(
+        self,
+        item: str,
+        limit: int = 3,
+        window: int = 50,
+        half_life_days: float = 7.0,
+        include_questions: bool = False,
+        now: datetime | None = None,
+    ) -> List[Utterance]:
+        """Past utterances mentioning ``item``, best first.
+
+        Only the ``window`` most recent matches are read, which keeps the
+        lookup bounded however long the log grows. They are ranked by BM25
+        scaled down with age, so last night's remark beats a better-worded
+        one from last year. Find requests are skipped unless
+        ``include_questions``: asking where something is says nothing about
+        where it is.
+        """
+        query = match_query(item)
+        if not query:
+            return []
+        self.flush()
+        skip = "" if include_questions else "AND u.intent != ?"
+        params: list = [query] + ([] if include_questions else [IntentType.FIND.value]) + [window]
+        with self.lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT u.id, u.timestamp, u.text, u.intent, u.item, bm25(utterance_fts) AS score
+                FROM utterance_fts
+                JOIN utterances AS u ON u.id = utterance_fts.rowid
+                WHERE utterance_fts MATCH ? {skip}
+                ORDER BY utterance_fts.rowid DESC
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+        now = now or datetime.now(timezone.utc)
+        found = []
+        for row in rows:
+            stamp = datetime.fromisoformat(row["timestamp"])
+            age_days = max(0.0, (now - stamp).total_seconds() / 86400.0)
+            # bm25() is negative, lower is better; age shrinks it toward zero.
+            score = float(row["score"]) / (1.0 + age_days / half_life_days)
+            found.append(
+                Utterance(row["text"], row["intent"], row["item"], stamp, id=int(row["id"]), score=score)
+            )
+        found.sort(key=lambda utterance: (utterance.score, -(utterance.id or 0)))
+        return found[:limit]
+
+    def count(self) -> int:
+        self.flush()
+        with self.lock:
+            return int(self.conn.execute("SELECT COUNT(*) FROM utterances").fetchone()[0])
+
+    def close(self) -> None:
+        self.flush()
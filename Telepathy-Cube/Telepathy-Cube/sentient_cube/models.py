@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from sentient_cube.reminder.recurrence import EVERY_DAY, Recurrence
 
 
 class Mode(str, Enum):
@@ -52,6 +54,11 @@ class ObjectMemory:
     location: str
     confidence: float
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    bbox: Optional[Tuple[int, int, int, int]] = None
+    # Gimbal (pan, tilt) when the bbox was captured, for gimbal-mounted cameras.
+    pose: Optional[Tuple[float, float]] = None
+    # Camera whose image the bbox is in; only gimbal boxes can aim the laser.
+    camera: Optional[str] = None
 
 
 @dataclass
@@ -61,3 +68,13 @@ class Reminder:
     location: str = ""
     repeat_daily: bool = False
     triggered: bool = False
+    recurrence: Optional[Recurrence] = None
+    # Row id once persisted by a ReminderStore.
+    id: Optional[int] = None
+
+    @property
+    def rule(self) -> Optional[Recurrence]:
+        """The repeat rule; ``repeat_daily`` is shorthand for an every-day rule."""
+        if self.recurrence is not None:
+            return self.recurrence
+        return EVERY_DAY if self.repeat_daily else None
@@ -0,0 +1,163 @@
+"""Reminder scheduling benchmark: heap manager vs. the original sorted list.
+
+Each run fills a manager with reminders spread over a year and then ticks
+through time one second at a time, as ``SentientCubeCore.tick`` does. The
+heap's tick cost should stay flat as the reminder count grows; the list's
+grows with it. Startup with a persistent store is timed too: it loads only
+the upcoming window, so it should not grow with the stored total.
+
+Usage::
+
+    python -m sentient_cube.reminder.benchmark --sizes 1000,10000,100000 --out bench_reminder.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from sentient_cube.memory.spatial_memory import SpatialMemoryDB
+from sentient_cube.models import Reminder
+from sentient_cube.reminder.manager import ReminderManager
+from sentient_cube.reminder.store import ReminderStore
+
+START = datetime(2026, 1, 1, 8, 0)
+
+
+class LegacyReminderManager:
+    """The original list-based manager, kept as the reference."""
+
+    def __init__(self) -> None:
+        self.reminders: List[Reminder] = []
+
+    def add(self, reminder: Reminder) -> None:
+        self.reminders.append(reminder)
+        self.reminders.sort(key=lambda item: item.remind_at)
+
+    def due_reminders(self, now: datetime | None = None) -> List[Reminder]:
+        current = now or datetime.now()
+        due = [item for item in self.reminders if (not item.triggered and item.remind_at <= current)]
+        for item in due:
+            item.triggered = True
+            if item.repeat_daily:
+                item.remind_at = item.remind_at + timedelta(days=1)
+                item.triggered = False
+        return due
+
+
+def synthetic_reminders(count: int, seed: int = 0, repeat_ratio: float = 0.05) -> List[Reminder]:
+    """Seeded reminders spread uniformly over the year after ``START``."""
+    rng = random.Random(seed)
+    return [
+        Reminder(
+            content=f"事项{index}",
+            remind_at=START + timedelta(seconds=rng.randrange(365 * 86400)),
+            repeat_daily=rng.random() < repeat_ratio,
+        )
+        for index in range(count)
+    ]
+
+
+@dataclass
+class TickStats:
+    manager: str
+    reminders: int
+    ticks: int
+    fired: int
+    tick_us: float
+    add_us: float
+
+
+@dataclass
+class StartupStats:
+    reminders: int
+    loaded: int
+    startup_ms: float
+
+
+@dataclass
+class ReminderBenchmarkReport:
+    stats: List[TickStats] = field(default_factory=list)
+    startup: List[StartupStats] = field(default_factory=list)
+    environment: Dict[str, str] = field(default_factory=dict)
+
+
+def _measure(name: str, manager, reminders: Sequence[Reminder], ticks: int, adds: int, legacy: bool) -> TickStats:
+    if legacy:
+        # Filling the list through ``add`` is quadratic; seed it sorted and time only the sampled adds.
+        manager.reminders = sorted(reminders[adds:], key=lambda item: item.remind_at)
+    else:
+        for reminder in reminders[adds:]:
+            manager.add(reminder)
+    start = time.perf_counter()
+    for reminder in reminders[:adds]:
+        manager.add(reminder)
+    add_us = (time.perf_counter() - start) * 1e6 / max(1, adds)
+
+    fired = 0
+    now = START
+    start = time.perf_counter()
+    for _ in range(ticks):
+        now += timedelta(seconds=1)
+        fired += len(manager.due_reminders(now))
+    tick_us = (time.perf_counter() - start) * 1e6 / max(1, ticks)
+    return TickStats(name, len(reminders), ticks, fired, tick_us, add_us)
+
+
+def measure_startup(size: int, horizon: timedelta = timedelta(hours=6)) -> StartupStats:
+    with tempfile.TemporaryDirectory() as folder:
+        memory = SpatialMemoryDB(str(Path(folder) / "reminders.db"))
+        try:
+            ReminderStore(memory).add_many(synthetic_reminders(size))
+            start = time.perf_counter()
+            manager = ReminderManager(store=ReminderStore(memory), horizon=horizon, now=START)
+            startup_ms = (time.perf_counter() - start) * 1000
+            return StartupStats(size, len(manager), startup_ms)
+        finally:
+            memory.close()
+
+
+def run_benchmark(
+    sizes: Sequence[int] = (1000, 10000, 100000), ticks: int = 3600, legacy_ticks: int = 200, adds: int = 100
+) -> ReminderBenchmarkReport:
+    report = ReminderBenchmarkReport(
+        environment={
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    for size in sizes:
+        report.stats.append(_measure("heap", ReminderManager(), synthetic_reminders(size), ticks, adds, False))
+        report.stats.append(
+            _measure("legacy", LegacyReminderManager(), synthetic_reminders(size), legacy_ticks, adds, True)
+        )
+        report.startup.append(measure_startup(size))
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark reminder scheduling")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated reminder counts")
+    parser.add_argument("--ticks", type=int, default=3600, help="One-second ticks for the heap manager")
+    parser.add_argument("--legacy-ticks", type=int, default=200, help="Ticks for the slower list manager")
+    parser.add_argument("--out", default="bench_reminder.json")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run_benchmark(sizes, ticks=args.ticks, legacy_ticks=args.legacy_ticks)
+    payload = json.dumps(asdict(report), ensure_ascii=False, indent=2)
+    Path(args.out).write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
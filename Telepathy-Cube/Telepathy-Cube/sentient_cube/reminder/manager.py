@@ -1,29 +1,179 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List
+from typing import Callable, Deque, List, Optional, Tuple
 
 from sentient_cube.models import Reminder
+from sentient_cube.reminder.store import LAST_ID, Cursor, ReminderStore
 
 
 class ReminderManager:
-    def __init__(self) -> None:
-        self.reminders: List[Reminder] = []
+    """Pending reminders in a min-heap keyed on ``remind_at``.
+
+    ``add`` is O(log n). ``due_reminders`` pops only the reminders that are
+    due: one-shots are retired to a short ``retired`` history, recurring
+    ones are pushed back at their next occurrence after now. A recurring
+    reminder missed many times (the device was off) fires once and then
+    skips straight to its next future slot. A tick with nothing due costs
+    one comparison however many reminders are pending.
+
+    With a ``store`` the heap only holds the window of reminders due within
+    ``horizon``: everything pending up to a ``(remind_at, id)`` cursor. The
+    window is paged in from the store at startup and slides forward as time
+    advances, so neither startup nor memory grows with the reminders ever
+    created. ``list`` then covers that window only. ``next_refill`` says
+    when the window should slide, and ``refill`` slides it without firing
+    anything.
+
+    ``on_change`` is called when an ``add`` moves ``next_due`` earlier,
+    so a deadline scheduler can re-arm.
+    """
+
+    def __init__(
+        self,
+        history: int = 20,
+        store: ReminderStore | None = None,
+        horizon: timedelta = timedelta(hours=6),
+        page_size: int = 512,
+        now: datetime | None = None,
+    ) -> None:
+        # The sequence number keeps equal times in insertion order and
+        # stops the heap from ever comparing two Reminder objects.
+        self._heap: List[Tuple[datetime, int, Reminder]] = []
+        self._seq = itertools.count()
+        self.retired: Deque[Reminder] = deque(maxlen=history)
+        self.store = store
+        self.horizon = horizon
+        self.page_size = page_size
+        self._cursor: Optional[Cursor] = None
+        # The scheduler thread ticks while voice commands add reminders.
+        self._lock = threading.RLock()
+        self.on_change: Optional[Callable[[], None]] = None
+        if store is not None:
+            self._page_in(now or datetime.now())
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
     def add(self, reminder: Reminder) -> None:
-        self.reminders.append(reminder)
-        self.reminders.sort(key=lambda item: item.remind_at)
+        with self._lock:
+            if self.store is not None:
+                self.store.add(reminder)
+                if not self._in_window(reminder):
+                    return
+            self._push(reminder)
+            moved = self._heap[0][2] is reminder
+        if moved and self.on_change is not None:
+            self.on_change()
+
+    def _push(self, reminder: Reminder) -> None:
+        heapq.heappush(self._heap, (reminder.remind_at, next(self._seq), reminder))
+
+    def _in_window(self, reminder: Reminder) -> bool:
+        return self._cursor is not None and (reminder.remind_at, reminder.id or 0) <= self._cursor
+
+    def _page_in(self, now: datetime) -> None:
+        """Load pending reminders up to ``now + horizon``, a page at a time.
+
+        Paging stops early once the cursor passes ``now``: everything due
+        is loaded and the rest follows on later ticks.
+        """
+        until = now + self.horizon
+        while self._cursor is None or self._cursor[0] < until:
+            page = self.store.pending(self._cursor, until, self.page_size)
+            for reminder in page:
+                self._push(reminder)
+            if len(page) < self.page_size:
+                self._cursor = (until, LAST_ID)
+                return
+            self._cursor = (page[-1].remind_at, int(page[-1].id))
+            if self._cursor[0] > now:
+                return
+
+    def next_due(self) -> Optional[datetime]:
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def next_refill(self) -> Optional[datetime]:
+        """When the loaded window should next slide forward; ``None`` without a store."""
+        with self._lock:
+            if self.store is None:
+                return None
+            return self._cursor[0] - self.horizon / 2
+
+    def refill(self, now: datetime | None = None) -> None:
+        """Page in reminders that are now within ``horizon``, if it is time to."""
+        with self._lock:
+            self._refill(now or datetime.now())
+
+    def _refill(self, current: datetime) -> None:
+        if self.store is not None and self._cursor[0] <= current + self.horizon / 2:
+            self._page_in(current)
 
     def due_reminders(self, now: datetime | None = None) -> List[Reminder]:
-        current = now or datetime.now()
-        due = [item for item in self.reminders if (not item.triggered and item.remind_at <= current)]
+        with self._lock:
+            return self._pop_due(now or datetime.now())
+
+    def _pop_due(self, current: datetime) -> List[Reminder]:
+        self._refill(current)
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= current:
+            due.append(heapq.heappop(heap)[2])
+        # Re-pushed only after the loop, so a repeat fires once per call.
         for item in due:
-            item.triggered = True
-            if item.repeat_daily:
-                item.remind_at = item.remind_at + timedelta(days=1)
+            rule = item.rule
+            following = rule.next_after(item.remind_at, current) if rule is not None else None
+            if following is not None:
+                item.remind_at = following
                 item.triggered = False
+                if self.store is None or self._in_window(item):
+                    self._push(item)
+            else:
+                item.triggered = True
+                self.retired.append(item)
+        if due and self.store is not None:
+            self.store.save_fired(due)
         return due
 
+    def upcoming(self, limit: int = 20) -> List[Reminder]:
+        """The ``limit`` earliest pending reminders in O(limit log limit).
+
+        Walks the heap best-first from the root: a node's children are
+        never earlier than the node, so only the frontier needs ordering.
+        With a store the answer comes from its index instead, so reminders
+        beyond the loaded window are listed too.
+        """
+        if self.store is not None:
+            return self.store.pending(None, datetime.max, limit)
+        with self._lock:
+            heap = self._heap
+            found: List[Reminder] = []
+            frontier = [(heap[0], 0)] if heap else []
+            while frontier and len(found) < limit:
+                entry, index = heapq.heappop(frontier)
+                found.append(entry[2])
+                for child in (2 * index + 1, 2 * index + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child], child))
+            return found
+
     def list(self) -> List[Reminder]:
-        return list(self.reminders)
+        """Pending reminders in the heap; with a store, only the loaded window."""
+        with self._lock:
+            return [entry[2] for entry in sorted(self._heap)]
+
+    def list_all(self) -> List[Reminder]:
+        """Every reminder, fired ones included, in time order.
 
+        With a store this reads the whole table. Without one, fired
+        one-shots are only kept in ``retired``, so older ones are missing.
+        """
+        if self.store is not None:
+            return self.store.all()
+        with self._lock:
+            return sorted([*self.retired, *self.list()], key=lambda item: item.remind_at)
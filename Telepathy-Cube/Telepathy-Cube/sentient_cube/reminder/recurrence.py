@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+MINUTELY = "minutely"
+HOURLY = "hourly"
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+
+_FIXED = {MINUTELY: timedelta(minutes=1), HOURLY: timedelta(hours=1), DAILY: timedelta(days=1)}
+_WEEK = timedelta(weeks=1)
+_TICK = timedelta(microseconds=1)
+_BYDAY = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+# Enough months to find a day-of-month slot under any interval (lcm with the
+# calendar's 12-month cycle); a rule that never lands ends instead of looping.
+_MONTH_PROBES = 48
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """A repeat rule evaluated lazily, one occurrence at a time.
+
+    Occurrences share the time of day of an ``anchor`` (normally the
+    reminder's current ``remind_at``) and are never before it. Weekly rules
+    fire on ``weekdays`` (0 = Monday) of every ``interval``-th week counted
+    from the anchor's week; monthly rules on ``monthday`` of every
+    ``interval``-th month, skipping months too short for it, as RRULE does.
+    ``next_after`` jumps straight to the first occurrence after a time, so
+    catching up after a long gap is O(1) and no schedule is expanded ahead.
+    """
+
+    freq: str
+    interval: int = 1
+    weekdays: Tuple[int, ...] = ()
+    monthday: Optional[int] = None
+    until: Optional[datetime] = None
+
+    @property
+    def period(self) -> Optional[timedelta]:
+        """Fixed spacing for minutely/hourly/daily rules, ``None`` otherwise."""
+        step = _FIXED.get(self.freq)
+        return None if step is None else step * self.interval
+
+    def next_after(self, anchor: datetime, after: datetime) -> Optional[datetime]:
+        """First occurrence strictly after ``after``, or ``None`` past ``until``."""
+        after = max(after, anchor - _TICK)
+        if self.freq in _FIXED:
+            found: Optional[datetime] = self._next_fixed(anchor, after)
+        elif self.freq == WEEKLY:
+            found = self._next_weekly(anchor, after)
+        elif self.freq == MONTHLY:
+            found = self._next_monthly(anchor, after)
+        else:
+            raise ValueError(f"unknown recurrence frequency: {self.freq}")
+        if found is not None and self.until is not None and found > self.until:
+            return None
+        return found
+
+    def occurrences(self, anchor: datetime, after: datetime) -> Iterator[datetime]:
+        """Successive occurrences after ``after``, generated on demand."""
+        current = self.next_after(anchor, after)
+        while current is not None:
+            yield current
+            current = self.next_after(anchor, current)
+
+    def _next_fixed(self, anchor: datetime, after: datetime) -> datetime:
+        period = self.period
+        if after < anchor:
+            return anchor
+        return anchor + ((after - anchor) // period + 1) * period
+
+    def _next_weekly(self, anchor: datetime, after: datetime) -> Optional[datetime]:
+        days = sorted(set(self.weekdays)) or [anchor.weekday()]
+        monday = anchor - timedelta(days=anchor.weekday())
+        week = max(0, (after - monday) // _WEEK)
+        week = -(-week // self.interval) * self.interval
+        for _ in range(2):
+            for day in days:
+                candidate = monday + timedelta(weeks=week, days=day)
+                if candidate > after:
+                    return candidate
+            week += self.interval
+        return None
+
+    def _next_monthly(self, anchor: datetime, after: datetime) -> Optional[datetime]:
+        day = self.monthday or anchor.day
+        origin = anchor.year * 12 + anchor.month - 1
+        month = max(0, after.year * 12 + after.month - 1 - origin)
+        month = -(-month // self.interval) * self.interval
+        for _ in range(_MONTH_PROBES):
+            year, index = divmod(origin + month, 12)
+            if day <= calendar.monthrange(year, index + 1)[1]:
+                candidate = anchor.replace(year=year, month=index + 1, day=day)
+                if candidate > after:
+                    return candidate
+            month += self.interval
+        return None
+
+    def to_rrule(self) -> str:
+        """Serialise as an RFC 5545 style ``FREQ=...;INTERVAL=...`` string."""
+        parts = [f"FREQ={self.freq.upper()}", f"INTERVAL={self.interval}"]
+        if self.weekdays:
+            parts.append("BYDAY=" + ",".join(_BYDAY[day] for day in sorted(set(self.weekdays))))
+        if self.monthday is not None:
+            parts.append(f"BYMONTHDAY={self.monthday}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%S')}")
+        return ";".join(parts)
+
+    @classmethod
+    def from_rrule(cls, text: str) -> "Recurrence":
+        fields = dict(part.split("=", 1) for part in text.split(";") if part)
+        return cls(
+            freq=fields["FREQ"].lower(),
+            interval=int(fields.get("INTERVAL", 1)),
+            weekdays=tuple(_BYDAY.index(day) for day in fields["BYDAY"].split(",")) if "BYDAY" in fields else (),
+            monthday=int(fields["BYMONTHDAY"]) if "BYMONTHDAY" in fields else None,
+            until=datetime.strptime(fields["UNTIL"], "%Y%m%dT%H%M%S") if "UNTIL" in fields else None,
+        )
+
+
+EVERY_DAY = Recurrence(DAILY)
+WORKDAYS = Recurrence(WEEKLY, weekdays=(0, 1, 2, 3, 4))
+WEEKENDS = Recurrence(WEEKLY, weekdays=(5, 6))
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sentient_cube.memory.spatial_memory import SpatialMemoryDB
+from sentient_cube.models import Reminder
+from sentient_cube.reminder.recurrence import Recurrence
+
+# Keyset cursor over pending reminders: (remind_at, id).
+Cursor = Tuple[datetime, int]
+
+# Sorts after every real id, so ``(t, LAST_ID)`` means "everything up to t".
+LAST_ID = 2**62
+
+
+def _stamp(moment: datetime) -> str:
+    # Fixed width keeps the TEXT column in chronological order.
+    return moment.isoformat(timespec="microseconds")
+
+
+class ReminderStore:
+    """Reminders persisted in the spatial memory database.
+
+    Pending reminders are served in ``(remind_at, id)`` order through a
+    partial index, so a page costs one index seek plus the rows returned,
+    however many reminders have already fired.
+    """
+
+    def __init__(self, memory: SpatialMemoryDB) -> None:
+        self.conn = memory.conn
+        self.lock = memory.lock
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self.lock:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS reminders (
+                    id INTEGER PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    remind_at TEXT NOT NULL,
+                    location TEXT NOT NULL DEFAULT '',
+                    repeat_daily INTEGER NOT NULL DEFAULT 0,
+                    triggered INTEGER NOT NULL DEFAULT 0,
+                    recurrence TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_reminders_pending
+                    ON reminders (remind_at, id) WHERE triggered = 0;
+                """
+            )
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(reminders)")}
+            if "recurrence" not in columns:
+                self.conn.execute("ALTER TABLE reminders ADD COLUMN recurrence TEXT")
+                self.conn.commit()
+
+    def add(self, reminder: Reminder) -> int:
+        self.add_many([reminder])
+        return int(reminder.id)
+
+    def add_many(self, reminders: Sequence[Reminder]) -> None:
+        """Insert in one transaction and assign each reminder its ``id``."""
+        with self.lock, self.conn:
+            for reminder in reminders:
+                cur = self.conn.execute(
+                    """
+                    INSERT INTO reminders (content, remind_at, location, repeat_daily, triggered, recurrence)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        reminder.content,
+                        _stamp(reminder.remind_at),
+                        reminder.location,
+                        int(reminder.repeat_daily),
+                        int(reminder.triggered),
+                        None if reminder.recurrence is None else reminder.recurrence.to_rrule(),
+                    ),
+                )
+                reminder.id = int(cur.lastrowid)
+
+    def pending(self, after: Optional[Cursor], until: datetime, limit: int) -> List[Reminder]:
+        """Pending reminders after ``after`` and due by ``until``, in cursor order."""
+        start = ("", 0) if after is None else (_stamp(after[0]), after[1])
+        with self.lock:
+            rows = self.conn.execute(
+                """
+                SELECT id, content, remind_at, location, repeat_daily, triggered, recurrence
+                FROM reminders
+                WHERE triggered = 0 AND (remind_at, id) > (?, ?) AND remind_at <= ?
+                ORDER BY remind_at, id
+                LIMIT ?
+                """,
+                (*start, _stamp(until), limit),
+            ).fetchall()
+        return [self._to_reminder(row) for row in rows]
+
+    def all(self) -> List[Reminder]:
+        """Every stored reminder, fired one-shots included, in time order."""
+        with self.lock:
+            rows = self.conn.execute(
+                """
+                SELECT id, content, remind_at, location, repeat_daily, triggered, recurrence
+                FROM reminders
+                ORDER BY remind_at, id
+                """
+            ).fetchall()
+        return [self._to_reminder(row) for row in rows]
+
+    @staticmethod
+    def _to_reminder(row) -> Reminder:
+        return Reminder(
+            content=row["content"],
+            remind_at=datetime.fromisoformat(row["remind_at"]),
+            location=row["location"],
+            repeat_daily=bool(row["repeat_daily"]),
+            triggered=bool(row["triggered"]),
+            recurrence=Recurrence.from_rrule(row["recurrence"]) if row["recurrence"] else None,
+            id=int(row["id"]),
+        )
+
+    def save_fired(self, reminders: Iterable[Reminder]) -> None:
+        """Persist trigger flags and rescheduled times after a tick, in one transaction."""
+        rows = [(_stamp(item.remind_at), int(item.triggered), item.id) for item in reminders if item.id is not None]
+        if not rows:
+            return
+        with self.lock, self.conn:
+            self.conn.executemany("UPDATE reminders SET remind_at = ?, triggered = ? WHERE id = ?", rows)
+
+    def count_pending(self) -> int:
+        with self.lock:
+            return int(self.conn.execute("SELECT COUNT(*) FROM reminders WHERE triggered = 0").fetchone()[0])
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# Returns the source's next deadline in epoch seconds, or ``None`` if it has none.
+DeadlineSource = Callable[[], Optional[float]]
+
+
+class DeadlineScheduler:
+    """Sleeps until the earliest of several deadlines, then runs ``on_deadline``.
+
+    Each source reports its next deadline (e.g. the next reminder or the
+    FOCUS idle timeout). The worker waits on a condition variable for
+    exactly the time left to the earliest one and never polls. ``poke``
+    wakes it early to re-read the sources when something may have moved a
+    deadline, such as a new reminder or a mode switch.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, DeadlineSource],
+        on_deadline: Callable[[], None],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.sources = sources
+        self.on_deadline = on_deadline
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self.wakeups = 0
+        self.fired = 0
+
+    def next_deadline(self) -> Optional[Tuple[str, float]]:
+        best: Optional[Tuple[str, float]] = None
+        for name, source in self.sources.items():
+            deadline = source()
+            if deadline is not None and (best is None or deadline < best[1]):
+                best = (name, deadline)
+        return best
+
+    def poke(self) -> None:
+        with self._cond:
+            self._dirty = True
+            self._cond.notify()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="deadline-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def run_once(self) -> bool:
+        """Wait for the next deadline or a poke; ``True`` if a deadline fired."""
+        with self._cond:
+            self._dirty = False
+            while not self._stopped:
+                upcoming = self.next_deadline()
+                timeout = None if upcoming is None else upcoming[1] - self.clock()
+                if timeout is not None and timeout <= 0:
+                    break
+                self._cond.wait(timeout)
+                self.wakeups += 1
+                if self._dirty:
+                    return False
+            else:
+                return False
+        self.on_deadline()
+        self.fired += 1
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self.run_once()
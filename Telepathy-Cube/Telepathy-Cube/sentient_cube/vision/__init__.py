@@ -1,6 +1,36 @@
 """Vision modules for object detection and scene scanning."""
 
-from .detector import Detection, ObjectDetector, YoloObjectDetector
-
-__all__ = ["Detection", "ObjectDetector", "YoloObjectDetector"]
+from .capture import FrameSource, OpenCVCamera
+from .detector import (
+    Detection,
+    DetectionBatch,
+    DetectionConfig,
+    ObjectDetector,
+    YoloObjectDetector,
+)
+from .image import FrameDiffGate, ImageInput, PreparedFrame
+from .multicam import CameraSource, MultiCameraRig
+from .tiling import TiledDetector
+from .tracker import ObjectTracker, TrackEvent, TrackEventType
+from .zones import ZoneMap, ZoneRegistry
 
+__all__ = [
+    "CameraSource",
+    "Detection",
+    "DetectionBatch",
+    "DetectionConfig",
+    "FrameDiffGate",
+    "FrameSource",
+    "ImageInput",
+    "MultiCameraRig",
+    "ObjectDetector",
+    "ObjectTracker",
+    "OpenCVCamera",
+    "PreparedFrame",
+    "TiledDetector",
+    "TrackEvent",
+    "TrackEventType",
+    "YoloObjectDetector",
+    "ZoneMap",
+    "ZoneRegistry",
+]
@@ -0,0 +1,232 @@
+"""Detector benchmark: cold start, latency percentiles, throughput and memory.
+
+Memory is reported two ways: ``peak_alloc_mb`` is the traced allocation
+peak of one untimed pass at that batch size, so it is per run;
+``process_peak_rss_mb`` is the process high-water mark, which only ever
+grows from one batch size to the next.
+
+Usage::
+
+    python -m sentient_cube.vision.benchmark --backend mock --out bench.json
+    python -m sentient_cube.vision.benchmark --backend yolo --model yolo11n.pt --batch-sizes 1,4,8
+    python -m sentient_cube.vision.benchmark --backend my_pkg.detectors:MyDetector --images corpus/
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from sentient_cube.vision.detector import MockObjectDetector, ObjectDetector, YoloObjectDetector
+from sentient_cube.vision.image import load_frame
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class BatchStats:
+    batch_size: int
+    batches: int
+    images: int
+    latency_ms: Dict[str, float]
+    per_image_ms: float
+    throughput_ips: Optional[float]
+    peak_alloc_mb: float
+    process_peak_rss_mb: Optional[float]
+
+
+@dataclass
+class BenchmarkReport:
+    backend: str
+    image_count: int
+    image_shape: List[int]
+    cold_start_s: float
+    batches: List[BatchStats] = field(default_factory=list)
+    environment: Dict[str, str] = field(default_factory=dict)
+
+
+def synthetic_scenes(count: int, width: int = 1280, height: int = 720, seed: int = 0) -> List[np.ndarray]:
+    """Fixed, seeded desk-like frames with a few small high-contrast objects."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(count):
+        base = rng.integers(90, 150, size=3, dtype=np.uint8)
+        frame = np.clip(
+            base + rng.normal(0, 8, size=(height, width, 3)), 0, 255
+        ).astype(np.uint8)
+        for _ in range(int(rng.integers(3, 9))):
+            w = int(rng.integers(width // 40, width // 8))
+            h = int(rng.integers(height // 40, height // 8))
+            x = int(rng.integers(0, width - w))
+            y = int(rng.integers(0, height - h))
+            frame[y : y + h, x : x + w] = rng.integers(0, 256, size=3, dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+
+def load_corpus(directory: str | Path, limit: int | None = None) -> List[np.ndarray]:
+    paths = sorted(
+        path for path in Path(directory).iterdir() if path.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp"}
+    )
+    return [load_frame(path) for path in paths[:limit]]
+
+
+def process_peak_rss_mb() -> Optional[float]:
+    """High-water RSS of the whole process so far, not of one run."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def traced_peak_mb(run: Callable[[], None]) -> float:
+    """Peak traced allocation (Python objects and NumPy buffers) during ``run``."""
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        run()
+        return tracemalloc.get_traced_memory()[1] / (1024.0 * 1024.0)
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1] / (1024.0 * 1024.0)
+    finally:
+        tracemalloc.stop()
+
+
+def _percentiles(samples_ms: Sequence[float]) -> Dict[str, float]:
+    values = np.asarray(samples_ms, dtype=np.float64)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "mean": float(values.mean()),
+        "max": float(values.max()),
+    }
+
+
+def run_benchmark(
+    factory: Callable[[], ObjectDetector],
+    images: Sequence[np.ndarray],
+    batch_sizes: Sequence[int] = (1, 4, 8),
+    rounds: int = 3,
+    warmup_batches: int = 1,
+    imgsz: int | None = None,
+    backend: str = "custom",
+) -> BenchmarkReport:
+    if not images:
+        raise ValueError("benchmark needs at least one image")
+
+    start = time.perf_counter()
+    detector = factory()
+    detector.detect(images[0], imgsz=imgsz)
+    cold_start = time.perf_counter() - start
+
+    report = BenchmarkReport(
+        backend=backend,
+        image_count=len(images),
+        image_shape=list(images[0].shape),
+        cold_start_s=cold_start,
+        environment={
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    for batch_size in batch_sizes:
+        chunks = [list(images[i : i + batch_size]) for i in range(0, len(images), batch_size)]
+        for chunk in chunks[:warmup_batches]:
+            detector.detect_batch(chunk, imgsz=imgsz)
+
+        samples_ms: List[float] = []
+        processed = 0
+        elapsed = 0.0
+        for _ in range(rounds):
+            for chunk in chunks:
+                t0 = time.perf_counter()
+                detector.detect_batch(chunk, imgsz=imgsz)
+                dt = time.perf_counter() - t0
+                samples_ms.append(dt * 1000.0)
+                elapsed += dt
+                processed += len(chunk)
+        # Traced separately: tracemalloc slows allocation and would skew the timings.
+        peak_alloc = traced_peak_mb(lambda: [detector.detect_batch(chunk, imgsz=imgsz) for chunk in chunks])
+        report.batches.append(
+            BatchStats(
+                batch_size=batch_size,
+                batches=len(samples_ms),
+                images=processed,
+                latency_ms=_percentiles(samples_ms),
+                per_image_ms=elapsed * 1000.0 / processed,
+                # None rather than inf, which json.dumps would write as invalid ``Infinity``.
+                throughput_ips=processed / elapsed if elapsed > 0 else None,
+                peak_alloc_mb=peak_alloc,
+                process_peak_rss_mb=process_peak_rss_mb(),
+            )
+        )
+    return report
+
+
+def write_report(report: BenchmarkReport, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(asdict(report), ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def resolve_backend(name: str, model_path: str) -> Callable[[], ObjectDetector]:
+    if name == "mock":
+        return MockObjectDetector
+    if name == "yolo":
+        return lambda: YoloObjectDetector(model_path)
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"unknown backend: {name} (use mock, yolo or module:Class)")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark an ObjectDetector backend")
+    parser.add_argument("--backend", default="mock", help="mock, yolo or module:Class")
+    parser.add_argument("--model", default="yolo11n.pt", help="Weights for the yolo backend")
+    parser.add_argument("--images", default="", help="Directory of images; synthetic scenes if empty")
+    parser.add_argument("--count", type=int, default=32, help="Number of synthetic scenes")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--batch-sizes", default="1,4,8")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--imgsz", type=int, default=0)
+    parser.add_argument("--out", default="bench_detector.json")
+    args = parser.parse_args()
+
+    if args.images:
+        images = load_corpus(args.images, limit=args.count)
+    else:
+        images = synthetic_scenes(args.count, width=args.width, height=args.height)
+    report = run_benchmark(
+        resolve_backend(args.backend, args.model),
+        images,
+        batch_sizes=[int(v) for v in args.batch_sizes.split(",") if v],
+        rounds=args.rounds,
+        imgsz=args.imgsz or None,
+        backend=args.backend,
+    )
+    write_report(report, args.out)
+    print(json.dumps(asdict(report), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
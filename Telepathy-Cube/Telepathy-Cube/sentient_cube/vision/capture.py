@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+class FrameSource:
+    """Base camera interface yielding decoded BGR frames."""
+
+    def read(self) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Write the next frame into ``out``, e.g. a shared-memory ring slot."""
+        frame = self.read()
+        if frame is None:
+            return False
+        np.copyto(out, frame)
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class OpenCVCamera(FrameSource):
+    """OpenCV camera capture that decodes into one reused frame buffer.
+
+    The array returned by ``read`` is overwritten by the next ``read``; copy it
+    if it has to outlive the current detection pass.
+    """
+
+    def __init__(self, device: int | str = 0, width: int | None = None, height: int | None = None) -> None:
+        try:
+            import cv2  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "opencv not installed. Install with `pip install opencv-python`."
+            ) from exc
+        self._cap = cv2.VideoCapture(device)
+        if width:
+            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self._frame: Optional[np.ndarray] = None
+
+    def read(self) -> Optional[np.ndarray]:
+        ok, frame = self._cap.read(self._frame)
+        if not ok:
+            return None
+        self._frame = frame
+        return frame
+
+    def read_into(self, out: np.ndarray) -> bool:
+        # cv2 decodes in place when ``out`` already has the frame's shape.
+        ok, frame = self._cap.read(out)
+        if not ok:
+            return False
+        if frame is not out:
+            np.copyto(out, frame)
+        return True
+
+    def close(self) -> None:
+        self._cap.release()
+
+
+class StaticFrameSource(FrameSource):
+    """Replays in-memory frames; used for local development and tests."""
+
+    def __init__(self, frames: list[np.ndarray], loop: bool = False) -> None:
+        self.frames = frames
+        self.loop = loop
+        self._index = 0
+
+    def read(self) -> Optional[np.ndarray]:
+        if self._index >= len(self.frames):
+            if not self.loop or not self.frames:
+                return None
+            self._index = 0
+        frame = self.frames[self._index]
+        self._index += 1
+        return frame
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from sentient_cube.vision.image import ImageInput, Letterbox, PreparedFrame, decode_image
 
 
 @dataclass
@@ -12,12 +17,152 @@ class Detection:
     bbox: tuple[int, int, int, int]
 
 
+@dataclass
+class DetectionConfig:
+    """Per-deployment filtering applied inside the detector backends.
+
+    ``classes`` is an optional label allowlist; ``class_thresholds`` overrides
+    ``min_confidence`` for individual labels.
+    """
+
+    min_confidence: float = 0.35
+    classes: Optional[FrozenSet[str]] = None
+    class_thresholds: Dict[str, float] = field(default_factory=dict)
+
+    def threshold(self, label: str) -> float:
+        return self.class_thresholds.get(label, self.min_confidence)
+
+    def floor(self) -> float:
+        """Lowest threshold any allowed class can pass, used as the NMS conf."""
+        thresholds = [
+            value
+            for label, value in self.class_thresholds.items()
+            if self.classes is None or label in self.classes
+        ]
+        # ``min_confidence`` only matters if some allowed class lacks an override.
+        if self.classes is None or not self.classes.issubset(self.class_thresholds):
+            thresholds.append(self.min_confidence)
+        return min(thresholds)
+
+    def accepts(self, detection: "Detection") -> bool:
+        if self.classes is not None and detection.label not in self.classes:
+            return False
+        return detection.confidence >= self.threshold(detection.label)
+
+    def filter(self, detections: Iterable["Detection"]) -> List["Detection"]:
+        return [det for det in detections if self.accepts(det)]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DetectionConfig":
+        classes = data.get("classes")
+        return cls(
+            min_confidence=float(data.get("min_confidence", 0.35)),
+            classes=frozenset(classes) if classes is not None else None,
+            class_thresholds={str(k): float(v) for k, v in data.get("class_thresholds", {}).items()},
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "DetectionConfig":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@dataclass
+class DetectionBatch:
+    """Columnar detections: one array per field instead of one object per box."""
+
+    boxes: np.ndarray
+    scores: np.ndarray
+    class_ids: np.ndarray
+    names: Dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.scores.shape[0])
+
+    @property
+    def labels(self) -> List[str]:
+        if not len(self):
+            return []
+        lookup = np.array(
+            [self.names.get(idx, str(idx)) for idx in range(int(self.class_ids.max()) + 1)],
+            dtype=object,
+        )
+        return lookup[self.class_ids].tolist()
+
+    def to_detections(self) -> List[Detection]:
+        boxes = self.boxes.astype(np.int64).tolist()
+        return [
+            Detection(label=label, confidence=conf, bbox=tuple(box))
+            for label, conf, box in zip(self.labels, self.scores.tolist(), boxes)
+        ]
+
+    @classmethod
+    def empty(cls, names: Dict[int, str] | None = None) -> "DetectionBatch":
+        return cls(
+            boxes=np.zeros((0, 4), dtype=np.float32),
+            scores=np.zeros(0, dtype=np.float32),
+            class_ids=np.zeros(0, dtype=np.int64),
+            names=dict(names or {}),
+        )
+
+    @classmethod
+    def from_detections(cls, detections: Sequence[Detection]) -> "DetectionBatch":
+        if not detections:
+            return cls.empty()
+        index: Dict[str, int] = {}
+        class_ids = [index.setdefault(det.label, len(index)) for det in detections]
+        return cls(
+            boxes=np.array([det.bbox for det in detections], dtype=np.float32),
+            scores=np.array([det.confidence for det in detections], dtype=np.float32),
+            class_ids=np.array(class_ids, dtype=np.int64),
+            names={idx: label for label, idx in index.items()},
+        )
+
+
+def as_model_input(image: ImageInput) -> Any:
+    """Normalise a detector argument into a path string or an ndarray."""
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, PreparedFrame):
+        return image.frame
+    if isinstance(image, (str, Path)):
+        return str(image)
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return decode_image(image)
+    raise TypeError(f"unsupported image input: {type(image).__name__}")
+
+
 class ObjectDetector:
-    """Base detector interface."""
+    """Base detector interface.
+
+    ``image`` may be a file path, a decoded BGR ``np.ndarray`` frame, an
+    encoded image held in ``bytes``/``bytearray``/``memoryview``, or a
+    ``PreparedFrame`` whose decode is shared with other consumers. ``imgsz``
+    overrides the model input size for this call when the backend supports it.
+    Backends drop boxes rejected by ``config`` before returning them, e.g.
+    with ``self.config.filter(detections)``.
+    """
+
+    # Model input size, which callers also use as the decode size for encoded images.
+    imgsz: Optional[int] = 640
+
+    def __init__(self, config: DetectionConfig | None = None) -> None:
+        self.config = config or DetectionConfig()
 
-    def detect(self, image_path: str | Path) -> List[Detection]:
+    def configure(self, config: DetectionConfig) -> None:
+        self.config = config
+
+    def detect(self, image: ImageInput, imgsz: int | None = None) -> List[Detection]:
         raise NotImplementedError
 
+    def detect_arrays(self, image: ImageInput, imgsz: int | None = None) -> DetectionBatch:
+        return DetectionBatch.from_detections(self.detect(image, imgsz=imgsz))
+
+    def detect_batch(self, images: Sequence[ImageInput], imgsz: int | None = None) -> List[List[Detection]]:
+        return [self.detect(image, imgsz=imgsz) for image in images]
+
+    def warmup(self, imgsz: int = 640) -> None:
+        self.detect(np.zeros((imgsz, imgsz, 3), dtype=np.uint8), imgsz=imgsz)
+
 
 class YoloObjectDetector(ObjectDetector):
     """YOLOv8 detector.
@@ -27,39 +172,92 @@ class YoloObjectDetector(ObjectDetector):
     - model file, e.g. yolo11n.pt or fine-tuned weights
     """
 
-    def __init__(self, model_path: str = "yolo11n.pt") -> None:
+    def __init__(self, model_path: str = "yolo11n.pt", config: DetectionConfig | None = None) -> None:
         try:
             from ultralytics import YOLO  # type: ignore
         except Exception as exc:  # pragma: no cover - optional dependency
             raise RuntimeError(
                 "ultralytics not installed. Install with `pip install ultralytics`."
             ) from exc
+        super().__init__(config)
         self.model = YOLO(model_path)
+        self.configure(self.config)
+
+    def configure(self, config: DetectionConfig) -> None:
+        self.config = config
+        names: Dict[int, str] = dict(self.model.names)
+        self._class_ids: Optional[List[int]] = None
+        if config.classes is not None:
+            self._class_ids = sorted(idx for idx, label in names.items() if label in config.classes)
+        size = max(names, default=-1) + 1
+        self._thresholds = np.full(size, config.min_confidence, dtype=np.float32)
+        for idx, label in names.items():
+            self._thresholds[idx] = config.threshold(label)
+
+    def detect(self, image: ImageInput, imgsz: int | None = None) -> List[Detection]:
+        return self.detect_arrays(image, imgsz=imgsz).to_detections()
+
+    def detect_arrays(self, image: ImageInput, imgsz: int | None = None) -> DetectionBatch:
+        return self._detect_many([image], imgsz)[0]
+
+    def detect_batch(self, images: Sequence[ImageInput], imgsz: int | None = None) -> List[List[Detection]]:
+        return [batch.to_detections() for batch in self._detect_many(images, imgsz)]
+
+    def _detect_many(self, images: Sequence[ImageInput], imgsz: int | None) -> List[DetectionBatch]:
+        if not images:
+            return []
+        size = imgsz or self.imgsz
+        sources: list = []
+        letterboxes: List[Optional[Letterbox]] = []
+        for image in images:
+            if isinstance(image, PreparedFrame):
+                # Reuse the frame's cached letterbox; YOLO sees an input already at imgsz.
+                box = image.letterbox(size)
+                sources.append(box.image)
+                letterboxes.append(box)
+            else:
+                sources.append(as_model_input(image))
+                letterboxes.append(None)
+        results = self._predict(sources if len(sources) > 1 else sources[0], size)
+        batches = []
+        for result, box in zip(results, letterboxes):
+            batch = self._to_batch(result)
+            if box is not None:
+                batch.boxes = box.to_source(batch.boxes)
+            batches.append(batch)
+        return batches
 
-    def detect(self, image_path: str | Path) -> List[Detection]:
-        results = self.model.predict(str(image_path), verbose=False)
-        detections: List[Detection] = []
+    def _predict(self, source: Any, imgsz: int | None) -> list:
+        # Allowlist and the lowest threshold go into NMS so rejected classes never become boxes.
+        options: Dict[str, Any] = {"conf": self.config.floor()}
+        if self._class_ids is not None:
+            options["classes"] = self._class_ids
+        if imgsz:
+            options["imgsz"] = imgsz
+        return self.model.predict(source, verbose=False, **options)
 
-        for result in results:
-            names = result.names
-            for box in result.boxes:
-                cls_idx = int(box.cls.item())
-                conf = float(box.conf.item())
-                x1, y1, x2, y2 = [int(v) for v in box.xyxy[0].tolist()]
-                label = str(names.get(cls_idx, cls_idx))
-                detections.append(
-                    Detection(label=label, confidence=conf, bbox=(x1, y1, x2, y2))
-                )
-        return detections
+    def _to_batch(self, result: Any) -> DetectionBatch:
+        # One device->host transfer per column instead of per-box .item() calls.
+        boxes = result.boxes.xyxy.cpu().numpy().reshape(-1, 4)
+        scores = result.boxes.conf.cpu().numpy()
+        class_ids = result.boxes.cls.cpu().numpy().astype(np.int64)
+        keep = scores >= self._thresholds[class_ids]
+        return DetectionBatch(
+            boxes=boxes[keep],
+            scores=scores[keep],
+            class_ids=class_ids[keep],
+            names=dict(result.names),
+        )
 
 
 class MockObjectDetector(ObjectDetector):
     """Deterministic detector for local development and tests."""
 
-    def __init__(self, fixtures: Sequence[Detection] | None = None) -> None:
+    def __init__(self, fixtures: Sequence[Detection] | None = None, config: DetectionConfig | None = None) -> None:
+        super().__init__(config)
         self.fixtures = list(fixtures or [])
 
-    def detect(self, image_path: str | Path) -> List[Detection]:
-        del image_path
-        return list(self.fixtures)
+    def detect(self, image: ImageInput, imgsz: int | None = None) -> List[Detection]:
+        del image, imgsz
+        return self.config.filter(self.fixtures)
 
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import ObjectDetector
+
+FREE = 0
+WRITING = 1
+READY = 2
+
+# Per-slot header columns.
+_SEQ, _STATE, _READERS, _STAMP_NS = range(4)
+
+
+@dataclass
+class RingHandle:
+    """Picklable description of a ring, passed to worker processes at spawn."""
+
+    name: str
+    slots: int
+    shape: Tuple[int, ...]
+    dtype: str
+    lock: Any
+
+
+class FrameLease:
+    """A read-only view of one slot; the slot is reclaimed on ``release``."""
+
+    def __init__(self, ring: "SharedFrameRing", slot: int, seq: int, timestamp_ns: int) -> None:
+        self.ring = ring
+        self.slot = slot
+        self.seq = seq
+        self.timestamp_ns = timestamp_ns
+        self.frame = ring.frame_view(slot)
+        self.frame.flags.writeable = False
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self.ring._release(self.slot)
+
+    def __enter__(self) -> "FrameLease":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+class SharedFrameRing:
+    """Fixed-slot ring buffer of camera frames in ``multiprocessing.shared_memory``.
+
+    Only ``(slot, seq)`` pairs travel between processes. The producer writes
+    a frame straight into a slot view and publishes it. A consumer leases the
+    slot, reads it as a NumPy view with no copy, and releases it. A slot is
+    reused only when it is free or holds an unread frame that no reader has
+    leased. A consumer holding a stale ``seq`` gets ``None`` instead of a
+    half-overwritten frame.
+    """
+
+    def __init__(self, handle: RingHandle, create: bool) -> None:
+        self.handle = handle
+        self.slots = handle.slots
+        self.shape = tuple(handle.shape)
+        self.dtype = np.dtype(handle.dtype)
+        self._lock = handle.lock
+        self._owner = create
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        header_bytes = self.slots * 4 * 8
+        if create:
+            size = header_bytes + self.slots * frame_bytes
+            self._shm = shared_memory.SharedMemory(name=handle.name, create=True, size=size)
+        else:
+            self._shm = _attach(handle.name)
+        self._header = np.ndarray((self.slots, 4), dtype=np.int64, buffer=self._shm.buf)
+        self._frames = np.ndarray(
+            (self.slots, *self.shape), dtype=self.dtype, buffer=self._shm.buf, offset=header_bytes
+        )
+        if create:
+            self._header[:] = 0
+
+    @classmethod
+    def create(
+        cls,
+        shape: Tuple[int, ...],
+        slots: int = 4,
+        dtype: str = "uint8",
+        name: str | None = None,
+        lock: Any = None,
+    ) -> "SharedFrameRing":
+        shm_name = name or f"sentient_ring_{multiprocessing.current_process().pid}_{time.monotonic_ns()}"
+        handle = RingHandle(
+            name=shm_name, slots=slots, shape=tuple(shape), dtype=dtype, lock=lock or multiprocessing.Lock()
+        )
+        return cls(handle, create=True)
+
+    @classmethod
+    def attach(cls, handle: RingHandle) -> "SharedFrameRing":
+        return cls(handle, create=False)
+
+    def frame_view(self, slot: int) -> np.ndarray:
+        return self._frames[slot]
+
+    def acquire_write(self) -> Optional[int]:
+        """Reserve a slot for writing; ``None`` if every slot is leased."""
+        reserved = self._reserve()
+        return None if reserved is None else reserved[0]
+
+    def _reserve(self) -> Optional[Tuple[int, int]]:
+        with self._lock:
+            states = self._header[:, _STATE]
+            free = np.flatnonzero(states == FREE)
+            if free.size:
+                slot = int(free[0])
+            else:
+                # Drop the oldest frame nobody has started reading.
+                reclaimable = np.flatnonzero((states == READY) & (self._header[:, _READERS] == 0))
+                if not reclaimable.size:
+                    return None
+                slot = int(reclaimable[np.argmin(self._header[reclaimable, _SEQ])])
+            previous = int(self._header[slot, _STATE])
+            self._header[slot, _STATE] = WRITING
+            return slot, previous
+
+    def publish(self, slot: int, timestamp_ns: int | None = None) -> Tuple[int, int]:
+        with self._lock:
+            seq = int(self._header[:, _SEQ].max()) + 1
+            self._header[slot, _SEQ] = seq
+            self._header[slot, _STAMP_NS] = timestamp_ns if timestamp_ns is not None else time.time_ns()
+            self._header[slot, _STATE] = READY
+        return slot, seq
+
+    def write(self, frame: np.ndarray, timestamp_ns: int | None = None) -> Optional[Tuple[int, int]]:
+        slot = self.acquire_write()
+        if slot is None:
+            return None
+        np.copyto(self._frames[slot], frame)
+        return self.publish(slot, timestamp_ns)
+
+    def capture(self, camera: FrameSource) -> Optional[Tuple[int, int]]:
+        """Have ``camera`` decode straight into a free slot and publish it."""
+        reserved = self._reserve()
+        if reserved is None:
+            return None
+        slot, previous = reserved
+        if not camera.read_into(self._frames[slot]):
+            # A failed read leaves the slot untouched, so an unread frame stays valid.
+            with self._lock:
+                self._header[slot, _STATE] = previous
+            return None
+        return self.publish(slot)
+
+    def lease(self, slot: int, seq: int) -> Optional[FrameLease]:
+        with self._lock:
+            header = self._header[slot]
+            if header[_STATE] != READY or header[_SEQ] != seq:
+                return None
+            header[_READERS] += 1
+            timestamp_ns = int(header[_STAMP_NS])
+        return FrameLease(self, slot, seq, timestamp_ns)
+
+    def _release(self, slot: int) -> None:
+        with self._lock:
+            header = self._header[slot]
+            header[_READERS] -= 1
+            if header[_READERS] <= 0:
+                header[_READERS] = 0
+                header[_STATE] = FREE
+
+    def close(self) -> None:
+        # Views must go before the mapping can be closed.
+        del self._header, self._frames
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedFrameRing":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13 registers attachments with the resource tracker.
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - tracker internals differ by platform
+            pass
+        return shm
+
+
+def detection_worker(
+    handle: RingHandle,
+    requests: Any,
+    results: Any,
+    detector_factory: Callable[[], ObjectDetector],
+) -> None:
+    """Process target: detect on ring frames named by ``(slot, seq)`` requests.
+
+    A ``None`` request stops the worker. Each result is
+    ``(seq, timestamp_ns, [Detection, ...])``, or ``(seq, timestamp_ns, None)``
+    when the frame was overwritten before the worker got to it.
+    """
+    ring = SharedFrameRing.attach(handle)
+    detector = detector_factory()
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            slot, seq = request
+            lease = ring.lease(slot, seq)
+            if lease is None:
+                results.put((seq, 0, None))
+                continue
+            stamp = lease.timestamp_ns
+            with lease:
+                detections = detector.detect(lease.frame)
+            # Drop the view so the mapping can be closed on exit.
+            del lease
+            results.put((seq, stamp, detections))
+    finally:
+        ring.close()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sentient_cube.vision.detector import DetectionConfig, ObjectDetector
+from sentient_cube.vision.image import ImageInput
+
+
+@dataclass
+class SwapResult:
+    swapped: bool
+    detector: str
+    warmup_s: float = 0.0
+    error: str = ""
+
+
+class DetectorSwapper:
+    """Replaces a live detector without a restart.
+
+    The replacement is built and warmed on a background thread while the old
+    model keeps serving. The switch itself happens under ``frame_lock``,
+    which callers hold for the length of one frame, so an in-flight
+    detection always finishes on the model it started with. If loading or
+    warm-up fails the old model simply stays in place.
+    """
+
+    def __init__(
+        self,
+        get_detector: Callable[[], ObjectDetector],
+        set_detector: Callable[[ObjectDetector], None],
+        frame_lock: threading.RLock,
+    ) -> None:
+        self._get = get_detector
+        self._set = set_detector
+        self.frame_lock = frame_lock
+        self.previous: Optional[ObjectDetector] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detector-swap")
+
+    def swap(
+        self,
+        factory: Callable[[], ObjectDetector],
+        warmup_image: ImageInput | None = None,
+        warmup_imgsz: int = 640,
+        config: DetectionConfig | None = None,
+    ) -> "Future[SwapResult]":
+        return self._executor.submit(self._swap, factory, warmup_image, warmup_imgsz, config)
+
+    def rollback(self) -> bool:
+        """Switch back to the detector that the last successful swap replaced."""
+        if self.previous is None:
+            return False
+        with self.frame_lock:
+            current = self._get()
+            self._set(self.previous)
+            self.previous = current
+        return True
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _swap(
+        self,
+        factory: Callable[[], ObjectDetector],
+        warmup_image: ImageInput | None,
+        warmup_imgsz: int,
+        config: DetectionConfig | None,
+    ) -> SwapResult:
+        start = time.perf_counter()
+        try:
+            candidate = factory()
+            candidate.configure(config or self._get().config)
+            if warmup_image is not None:
+                candidate.detect(warmup_image, imgsz=warmup_imgsz)
+            else:
+                candidate.warmup(imgsz=warmup_imgsz)
+        except Exception as exc:
+            return SwapResult(
+                swapped=False,
+                detector=type(self._get()).__name__,
+                warmup_s=time.perf_counter() - start,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+        warmup_s = time.perf_counter() - start
+        with self.frame_lock:
+            self.previous = self._get()
+            self._set(candidate)
+        return SwapResult(swapped=True, detector=type(candidate).__name__, warmup_s=warmup_s)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Paths, decoded HxWx3 BGR frames, encoded (JPEG/PNG) buffers, or a PreparedFrame.
+ImageInput = Union[str, Path, np.ndarray, bytes, bytearray, memoryview, "PreparedFrame"]
+
+LETTERBOX_FILL = 114
+
+
+def decode_image(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """Decode an encoded image buffer in memory, without a temp file."""
+    try:
+        import cv2  # type: ignore
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "opencv not installed. Install with `pip install opencv-python`."
+        ) from exc
+    # np.frombuffer wraps the caller's buffer instead of copying it.
+    frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise ValueError("could not decode image buffer")
+    return frame
+
+
+def decode_reduced(
+    source: str | Path | bytes | bytearray | memoryview,
+    target_size: int | None = None,
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Decode to BGR, letting JPEG DCT scaling skip pixels the model never sees.
+
+    Returns the frame and the original ``(width, height)``. With Pillow, a
+    JPEG is decoded at the smallest 1/2, 1/4 or 1/8 scale whose long side is
+    still at least ``target_size``; other formats, or no Pillow, fall back to
+    a full-size decode.
+    """
+    try:
+        from PIL import Image  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        Image = None
+    if Image is None:
+        data = np.fromfile(str(source), dtype=np.uint8) if isinstance(source, (str, Path)) else source
+        frame = decode_image(data)
+        return frame, (frame.shape[1], frame.shape[0])
+
+    handle = str(source) if isinstance(source, (str, Path)) else io.BytesIO(source)
+    with Image.open(handle) as img:
+        size = img.size
+        if target_size and img.format == "JPEG":
+            ratio = target_size / max(size)
+            img.draft("RGB", (max(1, int(size[0] * ratio)), max(1, int(size[1] * ratio))))
+        rgb = np.asarray(img.convert("RGB"))
+    return np.ascontiguousarray(rgb[:, :, ::-1]), size
+
+
+def resize(frame: np.ndarray, width: int, height: int) -> np.ndarray:
+    if frame.shape[1] == width and frame.shape[0] == height:
+        return frame
+    try:
+        import cv2  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        cv2 = None
+    if cv2 is not None:
+        shrinking = width < frame.shape[1]
+        return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+    rows = (np.arange(height) * frame.shape[0] / height).astype(np.intp)
+    cols = (np.arange(width) * frame.shape[1] / width).astype(np.intp)
+    return frame[rows[:, None], cols]
+
+
+@dataclass
+class Letterbox:
+    """A square model input plus the mapping back to source pixels."""
+
+    image: np.ndarray
+    scale: float
+    pad: Tuple[int, int]
+
+    @property
+    def size(self) -> int:
+        return int(self.image.shape[0])
+
+    def to_source(self, boxes: np.ndarray) -> np.ndarray:
+        """Map (N, 4) xyxy boxes from letterbox to source coordinates."""
+        left, top = self.pad
+        offset = np.array([left, top, left, top], dtype=np.float32)
+        return (np.asarray(boxes, dtype=np.float32) - offset) / self.scale
+
+
+def letterbox(frame: np.ndarray, size: int) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+    height, width = frame.shape[:2]
+    ratio = min(size / width, size / height)
+    new_w, new_h = max(1, round(width * ratio)), max(1, round(height * ratio))
+    left, top = (size - new_w) // 2, (size - new_h) // 2
+    canvas = np.full((size, size, 3), LETTERBOX_FILL, dtype=np.uint8)
+    canvas[top : top + new_h, left : left + new_w] = resize(frame, new_w, new_h)
+    return canvas, ratio, (left, top)
+
+
+class PreparedFrame:
+    """One decode per camera frame, shared by every consumer of that frame.
+
+    The detector takes the cached letterbox, the tiler crops ``frame`` and the
+    frame-diff gate compares ``gray``. ``decode_size`` lets JPEG sources be
+    decoded at reduced resolution; ``to_source`` maps boxes on ``frame`` back
+    to source pixels.
+    """
+
+    def __init__(self, source: ImageInput, decode_size: int | None = None) -> None:
+        if isinstance(source, PreparedFrame):
+            raise TypeError("source is already a PreparedFrame")
+        self.source = source
+        self.decode_size = decode_size
+        self._frame: Optional[np.ndarray] = None
+        self._source_size: Optional[Tuple[int, int]] = None
+        self._letterboxes: Dict[int, Letterbox] = {}
+        self._gray: Dict[int, np.ndarray] = {}
+
+    @property
+    def frame(self) -> np.ndarray:
+        if self._frame is None:
+            if isinstance(self.source, np.ndarray):
+                self._frame = self.source
+                self._source_size = (self.source.shape[1], self.source.shape[0])
+            else:
+                self._frame, self._source_size = decode_reduced(self.source, self.decode_size)
+        return self._frame
+
+    @property
+    def source_size(self) -> Tuple[int, int]:
+        if self._source_size is None:
+            self.frame
+        return self._source_size  # type: ignore[return-value]
+
+    @property
+    def decode_scale(self) -> float:
+        """Decoded pixels per source pixel (1.0 unless JPEG draft kicked in)."""
+        return self.frame.shape[1] / self.source_size[0]
+
+    def to_source(self, boxes: np.ndarray) -> np.ndarray:
+        return np.asarray(boxes, dtype=np.float32) / self.decode_scale
+
+    def letterbox(self, size: int = 640) -> Letterbox:
+        cached = self._letterboxes.get(size)
+        if cached is None:
+            image, ratio, pad = letterbox(self.frame, size)
+            cached = Letterbox(image=image, scale=ratio * self.decode_scale, pad=pad)
+            self._letterboxes[size] = cached
+        return cached
+
+    def gray(self, size: int = 64) -> np.ndarray:
+        """Small float32 luminance thumbnail, e.g. for change detection."""
+        cached = self._gray.get(size)
+        if cached is None:
+            small = resize(self.frame, size, size).astype(np.float32)
+            cached = small @ np.array([0.114, 0.587, 0.299], dtype=np.float32)
+            self._gray[size] = cached
+        return cached
+
+
+def load_frame(image: ImageInput) -> np.ndarray:
+    """Return ``image`` as a decoded ndarray frame, decoding it if needed."""
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, PreparedFrame):
+        return image.frame
+    if isinstance(image, (str, Path)):
+        return decode_image(np.fromfile(str(image), dtype=np.uint8))
+    return decode_image(image)
+
+
+def prepare(image: ImageInput, decode_size: int | None = None) -> PreparedFrame:
+    return image if isinstance(image, PreparedFrame) else PreparedFrame(image, decode_size=decode_size)
+
+
+class FrameDiffGate:
+    """Lets a frame through only when the scene changed since the last one.
+
+    Compares small grayscale thumbnails from the shared PreparedFrame, so the
+    gate costs no extra decode.
+    """
+
+    def __init__(self, threshold: float = 6.0, size: int = 64) -> None:
+        self.threshold = threshold
+        self.size = size
+        self._last: Optional[np.ndarray] = None
+
+    def changed(self, frame: PreparedFrame) -> bool:
+        current = frame.gray(self.size)
+        if self._last is not None and float(np.abs(current - self._last).mean()) < self.threshold:
+            return False
+        self._last = current
+        return True
+
+    def reset(self) -> None:
+        self._last = None
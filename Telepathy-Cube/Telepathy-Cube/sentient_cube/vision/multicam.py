@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.detector import ObjectDetector
+from sentient_cube.vision.tracker import ObjectTracker, TrackEvent, TrackEventType
+from sentient_cube.vision.zones import ZoneMap
+
+
+@dataclass
+class CameraSource:
+    """One camera with its own detector and tracker, e.g. gimbal or overview."""
+
+    name: str
+    camera: FrameSource
+    detector: ObjectDetector
+    location_hint: str = "桌面区域"
+    tracker: ObjectTracker = field(default_factory=ObjectTracker)
+    zone_map: Optional[ZoneMap] = None
+
+
+@dataclass
+class CameraEvent:
+    camera: str
+    timestamp: float
+    location: str
+    event: TrackEvent
+
+
+@dataclass
+class RigStep:
+    fused: List[CameraEvent]
+    captured: List[str]
+    dropped: List[str]
+
+
+def fuse_events(events: Sequence[CameraEvent], window_s: float = 0.5) -> List[CameraEvent]:
+    """Merge sightings of the same object name from different cameras.
+
+    Events with the same label whose timestamps fall within ``window_s`` of
+    the first one in a cluster collapse into the most confident sighting.
+    ``left`` only survives when no other camera reported a sighting in that
+    cluster.
+    """
+    by_label: Dict[str, List[CameraEvent]] = {}
+    for item in events:
+        by_label.setdefault(item.event.label, []).append(item)
+
+    fused: List[CameraEvent] = []
+    for items in by_label.values():
+        items.sort(key=lambda item: item.timestamp)
+        stamps = np.array([item.timestamp for item in items])
+        start = 0
+        while start < len(items):
+            end = int(np.searchsorted(stamps, stamps[start] + window_s, side="right"))
+            cluster = items[start:end]
+            seen = [item for item in cluster if item.event.kind != TrackEventType.LEFT]
+            pool = seen or cluster
+            fused.append(max(pool, key=lambda item: item.event.confidence))
+            start = end
+    fused.sort(key=lambda item: item.timestamp)
+    return fused
+
+
+class MultiCameraRig:
+    """Captures from several cameras in parallel and fuses their detections.
+
+    Each source has its own single-thread worker, so adding a camera adds a
+    parallel lane rather than serial latency. A step grabs every camera at
+    once, drops frames more than ``sync_tolerance_s`` older than the newest
+    one, then runs each source's detector and tracker on its own worker.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[CameraSource],
+        sync_tolerance_s: float = 0.1,
+        fusion_window_s: float = 0.5,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.sources = list(sources)
+        self.sync_tolerance_s = sync_tolerance_s
+        self.fusion_window_s = fusion_window_s
+        self.clock = clock
+        self._workers = {
+            source.name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"camera-{source.name}")
+            for source in self.sources
+        }
+
+    def step(self) -> RigStep:
+        grabs = {
+            source.name: self._workers[source.name].submit(self._grab, source) for source in self.sources
+        }
+        frames = {name: future.result() for name, future in grabs.items()}
+        stamps = [grab[1] for grab in frames.values() if grab is not None]
+        if not stamps:
+            return RigStep(fused=[], captured=[], dropped=[source.name for source in self.sources])
+
+        newest = max(stamps)
+        aligned = {
+            name: grab
+            for name, grab in frames.items()
+            if grab is not None and newest - grab[1] <= self.sync_tolerance_s
+        }
+        by_name = {source.name: source for source in self.sources}
+        jobs = {
+            name: self._workers[name].submit(self._detect, by_name[name], frame, stamp)
+            for name, (frame, stamp) in aligned.items()
+        }
+        events: List[CameraEvent] = []
+        for future in jobs.values():
+            events.extend(future.result())
+        return RigStep(
+            fused=fuse_events(events, self.fusion_window_s),
+            captured=list(aligned),
+            dropped=[source.name for source in self.sources if source.name not in aligned],
+        )
+
+    def is_tracking(self, label: str) -> bool:
+        """Whether any camera still holds a live track for ``label``."""
+        return any(track.label == label for source in self.sources for track in source.tracker.tracks)
+
+    def close(self) -> None:
+        for worker in self._workers.values():
+            worker.shutdown(wait=True)
+
+    def _grab(self, source: CameraSource) -> Optional[tuple]:
+        frame = source.camera.read()
+        if frame is None:
+            return None
+        return frame, self.clock()
+
+    @staticmethod
+    def _detect(source: CameraSource, frame: np.ndarray, stamp: float) -> List[CameraEvent]:
+        zone_map = source.zone_map
+        scale = None if zone_map is None else zone_map.frame_scale((frame.shape[1], frame.shape[0]))
+        events = source.tracker.update(source.detector.detect(frame))
+        if zone_map is None or scale is None:
+            locations = [source.location_hint] * len(events)
+        else:
+            locations = zone_map.zones_for([event.bbox for event in events], source.location_hint, scale)
+        return [
+            CameraEvent(camera=source.name, timestamp=stamp, location=location, event=event)
+            for event, location in zip(events, locations)
+        ]
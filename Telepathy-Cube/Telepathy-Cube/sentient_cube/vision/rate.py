@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from sentient_cube.control.state_machine import DualBrainStateMachine
+from sentient_cube.models import Mode
+from sentient_cube.vision.capture import FrameSource
+from sentient_cube.vision.image import FrameDiffGate, PreparedFrame
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sentient_cube.core import SentientCubeCore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateProfile:
+    fps: float
+    imgsz: int
+
+
+@dataclass
+class RateBudget:
+    """Hard limits the controller scales detection down to respect."""
+
+    max_cpu_load: float = 0.75
+    max_latency_ms: float = 250.0
+    min_fps: float = 0.2
+    min_imgsz: int = 256
+
+
+DEFAULT_PROFILES: Dict[Mode, RateProfile] = {
+    Mode.AMBIENT: RateProfile(fps=0.5, imgsz=320),
+    Mode.FOCUS: RateProfile(fps=4.0, imgsz=640),
+}
+BURST_PROFILE = RateProfile(fps=12.0, imgsz=640)
+
+
+def system_cpu_load() -> float:
+    """One-minute load average per core; 0.0 where the OS does not expose it."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):  # pragma: no cover - Windows
+        return 0.0
+
+
+class DetectionRateController:
+    """Chooses detection fps and input size from the brain mode and system load.
+
+    AMBIENT trickles, FOCUS runs steadily, and ``trigger_burst`` (a find
+    request) runs at full rate for a few seconds. The chosen profile is then
+    scaled down whenever CPU load or the smoothed detection latency exceeds
+    the budget.
+    """
+
+    def __init__(
+        self,
+        state_machine: DualBrainStateMachine,
+        profiles: Dict[Mode, RateProfile] | None = None,
+        burst: RateProfile = BURST_PROFILE,
+        budget: RateBudget | None = None,
+        cpu_load: Callable[[], float] = system_cpu_load,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.state_machine = state_machine
+        self.profiles = dict(profiles or DEFAULT_PROFILES)
+        self.burst = burst
+        self.budget = budget or RateBudget()
+        self.cpu_load = cpu_load
+        self.clock = clock
+        self.latency_ms: Optional[float] = None
+        self._burst_until = 0.0
+        self._last_frame_at: Optional[float] = None
+        # Each notify bumps the generation, so a waiter that snapshotted it
+        # earlier sees a wake-up even if it arrived before the wait began.
+        self._cond = threading.Condition()
+        self._generation = 0
+
+    def trigger_burst(self, seconds: float = 3.0) -> None:
+        self._burst_until = max(self._burst_until, self.clock() + seconds)
+        self.notify()
+
+    def notify(self) -> None:
+        """Wake a waiting detection loop, e.g. after a mode switch."""
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+
+    @property
+    def generation(self) -> int:
+        with self._cond:
+            return self._generation
+
+    def wait(self, timeout: float, since: Optional[int] = None) -> bool:
+        """Sleep up to ``timeout``; ``True`` if notified after generation ``since``."""
+        with self._cond:
+            start = self._generation if since is None else since
+            return self._cond.wait_for(lambda: self._generation != start, timeout)
+
+    def record_latency(self, seconds: float, smoothing: float = 0.3) -> None:
+        sample = seconds * 1000.0
+        if self.latency_ms is None:
+            self.latency_ms = sample
+        else:
+            self.latency_ms = (1.0 - smoothing) * self.latency_ms + smoothing * sample
+
+    def current(self) -> RateProfile:
+        if self.clock() < self._burst_until:
+            base = self.burst
+        else:
+            base = self.profiles[self.state_machine.mode]
+
+        scale = 1.0
+        load = self.cpu_load()
+        if load > self.budget.max_cpu_load:
+            scale *= self.budget.max_cpu_load / load
+        if self.latency_ms is not None and self.latency_ms > self.budget.max_latency_ms:
+            scale *= self.budget.max_latency_ms / self.latency_ms
+        if scale >= 1.0:
+            return base
+
+        # Cost grows with pixel count, so input size shrinks by sqrt(scale).
+        imgsz = int(base.imgsz * scale ** 0.5) // 32 * 32
+        return replace(
+            base,
+            fps=max(self.budget.min_fps, base.fps * scale),
+            imgsz=max(self.budget.min_imgsz, imgsz),
+        )
+
+    def mark_frame(self) -> None:
+        self._last_frame_at = self.clock()
+
+    def next_delay(self) -> float:
+        if self._last_frame_at is None:
+            return 0.0
+        interval = 1.0 / self.current().fps
+        return max(0.0, self._last_frame_at + interval - self.clock())
+
+
+class DetectionLoop:
+    """Background camera -> detection loop paced by a DetectionRateController.
+
+    ``use_gate=False`` runs detection on every frame; otherwise ``gate`` (a
+    default ``FrameDiffGate`` if omitted) skips frames that barely changed.
+    A failing frame is logged and kept in ``last_error``; the loop goes on.
+    """
+
+    def __init__(
+        self,
+        core: "SentientCubeCore",
+        camera: FrameSource,
+        controller: DetectionRateController | None = None,
+        location_hint: str = "桌面区域",
+        gate: FrameDiffGate | None = None,
+        use_gate: bool = True,
+    ) -> None:
+        self.core = core
+        self.camera = camera
+        self.controller = controller or core.rate_controller
+        self.location_hint = location_hint
+        self.gate = (gate or FrameDiffGate()) if use_gate else None
+        self.last_error: Exception | None = None
+        self.running = False
+        self.thread: threading.Thread | None = None
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        profile = self.controller.current()
+        self.controller.mark_frame()
+        frame = self.camera.read()
+        if frame is None:
+            return None
+        prepared = PreparedFrame(frame)
+        if self.gate is not None and not self.gate.changed(prepared):
+            return {"detections": [], "count": 0, "events": [], "recorded": 0, "skipped": True}
+        start = time.perf_counter()
+        result = self.core.detect_and_remember(prepared, location_hint=self.location_hint, imgsz=profile.imgsz)
+        self.controller.record_latency(time.perf_counter() - start)
+        return result
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.running = False
+        self.controller.notify()
+        if self.thread:
+            self.thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while self.running:
+            seen = self.controller.generation
+            self.controller.wait(self.controller.next_delay(), since=seen)
+            if not self.running:
+                break
+            try:
+                self.run_once()
+            except Exception as exc:
+                # One bad frame or camera glitch must not end the loop.
+                self.last_error = exc
+                logger.exception("detection loop frame failed")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+
+from sentient_cube.vision.boxes import nms
+from sentient_cube.vision.detector import Detection, DetectionConfig, ObjectDetector
+from sentient_cube.vision.image import ImageInput, PreparedFrame, load_frame
+
+Region = tuple[int, int, int, int]
+
+
+def tile_windows(width: int, height: int, tile: int, overlap: float = 0.2) -> List[Region]:
+    """Cover a ``width`` x ``height`` frame with overlapping square tiles."""
+    stride = max(1, int(tile * (1.0 - overlap)))
+
+    def starts(length: int) -> List[int]:
+        if length <= tile:
+            return [0]
+        points = list(range(0, length - tile, stride))
+        points.append(length - tile)
+        return points
+
+    return [
+        (x, y, min(width, x + tile), min(height, y + tile))
+        for y in starts(height)
+        for x in starts(width)
+    ]
+
+
+def merge_detections(detections: Sequence[Detection], iou_threshold: float = 0.5) -> List[Detection]:
+    """Collapse duplicates from overlapping crops with per-label NMS."""
+    if not detections:
+        return []
+    boxes = np.array([det.bbox for det in detections], dtype=np.float64)
+    scores = np.array([det.confidence for det in detections], dtype=np.float64)
+    _, classes = np.unique([det.label for det in detections], return_inverse=True)
+    keep = nms(boxes, scores, iou_threshold=iou_threshold, classes=classes)
+    return [detections[i] for i in keep]
+
+
+class TiledDetector(ObjectDetector):
+    """Runs a wrapped detector on overlapping tiles or on selected regions.
+
+    Small desk objects survive a small model input size because each crop is
+    only a fraction of the frame. Crops are views into the frame, and boxes
+    are shifted back to frame coordinates before the merge.
+    """
+
+    def __init__(
+        self,
+        detector: ObjectDetector,
+        tile_size: int = 640,
+        overlap: float = 0.2,
+        iou_threshold: float = 0.5,
+        imgsz: int | None = None,
+    ) -> None:
+        self.detector = detector
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.iou_threshold = iou_threshold
+        self.imgsz = imgsz
+
+    @property
+    def config(self) -> DetectionConfig:  # type: ignore[override]
+        # The wrapped detector filters every crop with its own config.
+        return self.detector.config
+
+    def configure(self, config: DetectionConfig) -> None:
+        self.detector.configure(config)
+
+    def detect(self, image: ImageInput, imgsz: int | None = None) -> List[Detection]:
+        frame = load_frame(image)
+        height, width = frame.shape[:2]
+        windows = tile_windows(width, height, self.tile_size, self.overlap)
+        return self._run(frame, windows, self._scale(image), imgsz)
+
+    def detect_regions(
+        self,
+        image: ImageInput,
+        regions: Sequence[Region],
+        imgsz: int | None = None,
+    ) -> List[Detection]:
+        """Detect inside ``regions`` given in source-image coordinates."""
+        frame = load_frame(image)
+        scale = self._scale(image)
+        windows = [tuple(int(v * scale) for v in region) for region in regions]
+        return self._run(frame, windows, scale, imgsz)
+
+    @staticmethod
+    def _scale(image: ImageInput) -> float:
+        return image.decode_scale if isinstance(image, PreparedFrame) else 1.0
+
+    def _run(self, frame: np.ndarray, regions: Sequence[Region], scale: float, imgsz: int | None) -> List[Detection]:
+        size = imgsz or self.imgsz
+        windows = [(x1, y1, x2, y2) for x1, y1, x2, y2 in regions if x2 > x1 and y2 > y1]
+        crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in windows]
+        found: List[Detection] = []
+        for (x1, y1, _, _), detections in zip(windows, self.detector.detect_batch(crops, imgsz=size)):
+            for det in detections:
+                bx1, by1, bx2, by2 = det.bbox
+                found.append(
+                    Detection(
+                        label=det.label,
+                        confidence=det.confidence,
+                        bbox=(
+                            int((bx1 + x1) / scale),
+                            int((by1 + y1) / scale),
+                            int((bx2 + x1) / scale),
+                            int((by2 + y1) / scale),
+                        ),
+                    )
+                )
+        if len(windows) <= 1:
+            return found
+        return merge_detections(found, self.iou_threshold)
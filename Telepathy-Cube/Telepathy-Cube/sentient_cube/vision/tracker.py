@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Sequence
+
+import numpy as np
+
+from sentient_cube.vision.boxes import iou_matrix
+from sentient_cube.vision.detector import Detection
+
+BBox = tuple[int, int, int, int]
+
+
+class TrackEventType(str, Enum):
+    APPEARED = "appeared"
+    MOVED = "moved"
+    LEFT = "left"
+
+
+@dataclass
+class TrackEvent:
+    kind: TrackEventType
+    track_id: int
+    label: str
+    confidence: float
+    bbox: BBox
+
+
+@dataclass
+class Track:
+    track_id: int
+    label: str
+    confidence: float
+    bbox: BBox
+    reported_bbox: BBox | None = None
+    hits: int = 1
+    misses: int = 0
+
+
+# Constant-velocity model over (cx, cy, area, aspect), as in SORT.
+_F = np.eye(7)
+_F[0, 4] = _F[1, 5] = _F[2, 6] = 1.0
+_H = np.eye(4, 7)
+_Q = np.diag([1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 0.0001])
+_R = np.diag([1.0, 1.0, 10.0, 10.0])
+_P0 = np.diag([10.0, 10.0, 10.0, 10.0, 1e4, 1e4, 1e4])
+
+
+def _to_measurements(boxes: np.ndarray) -> np.ndarray:
+    w = boxes[:, 2] - boxes[:, 0]
+    h = boxes[:, 3] - boxes[:, 1]
+    return np.stack(
+        [boxes[:, 0] + w / 2.0, boxes[:, 1] + h / 2.0, w * h, w / np.maximum(h, 1e-6)],
+        axis=1,
+    )
+
+
+def _to_boxes(states: np.ndarray) -> np.ndarray:
+    area = np.maximum(states[:, 2], 0.0)
+    w = np.sqrt(area * np.maximum(states[:, 3], 1e-6))
+    h = area / np.maximum(w, 1e-6)
+    return np.stack(
+        [states[:, 0] - w / 2.0, states[:, 1] - h / 2.0, states[:, 0] + w / 2.0, states[:, 1] + h / 2.0],
+        axis=1,
+    )
+
+
+class ObjectTracker:
+    """SORT-style multi-object tracker that reports track state changes only.
+
+    Each confirmed track emits ``appeared`` once, ``moved`` whenever its box
+    drifts away from the last reported box, and ``left`` after ``max_age``
+    consecutive frames without a matching detection. Detections that miss the
+    IoU gate fall back to the nearest same-label track within ``max_jump``
+    box diagonals, so an object picked up and put down keeps its ID.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_age: int = 3,
+        min_hits: int = 1,
+        move_iou: float = 0.5,
+        max_jump: float = 3.0,
+    ) -> None:
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age
+        self.min_hits = min_hits
+        self.move_iou = move_iou
+        self.max_jump = max_jump
+        self._next_id = 1
+        self._tracks: List[Track] = []
+        self._x = np.zeros((0, 7))
+        self._p = np.zeros((0, 7, 7))
+
+    @property
+    def tracks(self) -> List[Track]:
+        return [track for track in self._tracks if track.reported_bbox is not None]
+
+    def reset(self) -> None:
+        self._tracks = []
+        self._x = np.zeros((0, 7))
+        self._p = np.zeros((0, 7, 7))
+
+    def update(self, detections: Sequence[Detection]) -> List[TrackEvent]:
+        self._predict()
+        boxes = np.array([det.bbox for det in detections], dtype=float).reshape(-1, 4)
+        matches, jumps, unmatched_dets = self._associate(detections, boxes)
+
+        events: List[TrackEvent] = []
+        matched_tracks = set()
+        if matches:
+            track_idx = np.array([t for t, _ in matches])
+            det_idx = np.array([d for _, d in matches])
+            self._correct(track_idx, _to_measurements(boxes[det_idx]))
+        if jumps:
+            # A relocated object restarts its motion model at the new spot.
+            track_idx = np.array([t for t, _ in jumps])
+            det_idx = np.array([d for _, d in jumps])
+            self._x[track_idx] = 0.0
+            self._x[track_idx, :4] = _to_measurements(boxes[det_idx])
+            self._p[track_idx] = _P0
+        for t, d in matches + jumps:
+            matched_tracks.add(t)
+            track = self._tracks[t]
+            det = detections[d]
+            track.bbox = det.bbox
+            track.confidence = det.confidence
+            track.hits += 1
+            track.misses = 0
+            event = self._state_change(track)
+            if event is not None:
+                events.append(event)
+
+        keep = np.ones(len(self._tracks), dtype=bool)
+        for idx, track in enumerate(self._tracks):
+            if idx in matched_tracks:
+                continue
+            track.misses += 1
+            if track.misses > self.max_age:
+                keep[idx] = False
+                if track.reported_bbox is not None:
+                    events.append(self._event(TrackEventType.LEFT, track))
+        self._tracks = [track for idx, track in enumerate(self._tracks) if keep[idx]]
+        self._x = self._x[keep]
+        self._p = self._p[keep]
+
+        if unmatched_dets:
+            self._spawn([detections[d] for d in unmatched_dets], boxes[unmatched_dets])
+            for track in self._tracks[-len(unmatched_dets):]:
+                event = self._state_change(track)
+                if event is not None:
+                    events.append(event)
+        return events
+
+    def _predict(self) -> None:
+        if not self._tracks:
+            return
+        shrinking = self._x[:, 2] + self._x[:, 6] <= 0
+        self._x[shrinking, 6] = 0.0
+        self._x = self._x @ _F.T
+        self._p = _F @ self._p @ _F.T + _Q
+
+    def _correct(self, idx: np.ndarray, z: np.ndarray) -> None:
+        x = self._x[idx]
+        p = self._p[idx]
+        s = _H @ p @ _H.T + _R
+        k = p @ _H.T @ np.linalg.inv(s)
+        residual = z - x @ _H.T
+        self._x[idx] = x + np.einsum("nij,nj->ni", k, residual)
+        self._p[idx] = (np.eye(7) - k @ _H) @ p
+
+    def _associate(self, detections: Sequence[Detection], boxes: np.ndarray) -> tuple[list, list, list]:
+        if not self._tracks:
+            return [], [], list(range(len(detections)))
+        predicted = _to_boxes(self._x)
+        iou = iou_matrix(predicted, boxes)
+        track_labels = np.array([track.label for track in self._tracks], dtype=object)
+        det_labels = np.array([det.label for det in detections], dtype=object)
+        iou[track_labels[:, None] != det_labels[None, :]] = 0.0
+
+        matches: list = []
+        used_tracks: set = set()
+        used_dets: set = set()
+        self._greedy(-iou, -self.iou_threshold, matches, used_tracks, used_dets)
+
+        centers_t = (predicted[:, :2] + predicted[:, 2:]) / 2.0
+        centers_d = (boxes[:, :2] + boxes[:, 2:]) / 2.0
+        diag = np.hypot(predicted[:, 2] - predicted[:, 0], predicted[:, 3] - predicted[:, 1])
+        dist = np.linalg.norm(centers_t[:, None, :] - centers_d[None, :, :], axis=2) / np.maximum(diag, 1.0)[:, None]
+        dist[track_labels[:, None] != det_labels[None, :]] = np.inf
+        jumps: list = []
+        self._greedy(dist, self.max_jump, jumps, used_tracks, used_dets)
+
+        unmatched = [d for d in range(len(detections)) if d not in used_dets]
+        return matches, jumps, unmatched
+
+    @staticmethod
+    def _greedy(cost: np.ndarray, limit: float, matches: list, used_tracks: set, used_dets: set) -> None:
+        for flat in np.argsort(cost, axis=None, kind="stable"):
+            t, d = divmod(int(flat), cost.shape[1])
+            if cost[t, d] > limit:
+                break
+            if t in used_tracks or d in used_dets:
+                continue
+            used_tracks.add(t)
+            used_dets.add(d)
+            matches.append((t, d))
+
+    def _spawn(self, detections: Sequence[Detection], boxes: np.ndarray) -> None:
+        x = np.zeros((len(detections), 7))
+        x[:, :4] = _to_measurements(boxes)
+        self._x = np.concatenate([self._x, x])
+        self._p = np.concatenate([self._p, np.repeat(_P0[None], len(detections), axis=0)])
+        for det in detections:
+            self._tracks.append(
+                Track(track_id=self._next_id, label=det.label, confidence=det.confidence, bbox=det.bbox)
+            )
+            self._next_id += 1
+
+    def _state_change(self, track: Track) -> TrackEvent | None:
+        if track.reported_bbox is None:
+            if track.hits < self.min_hits:
+                return None
+            track.reported_bbox = track.bbox
+            return self._event(TrackEventType.APPEARED, track)
+        overlap = iou_matrix(
+            np.array([track.reported_bbox], dtype=float), np.array([track.bbox], dtype=float)
+        )[0, 0]
+        if overlap < self.move_iou:
+            track.reported_bbox = track.bbox
+            return self._event(TrackEventType.MOVED, track)
+        return None
+
+    @staticmethod
+    def _event(kind: TrackEventType, track: Track) -> TrackEvent:
+        return TrackEvent(
+            kind=kind,
+            track_id=track.track_id,
+            label=track.label,
+            confidence=track.confidence,
+            bbox=track.bbox,
+        )
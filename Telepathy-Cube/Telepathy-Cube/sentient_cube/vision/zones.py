@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+BBox = Tuple[int, int, int, int]
+Point = Tuple[float, float]
+
+NO_ZONE = -1
+# Relative difference in x and y scale still treated as the same aspect ratio.
+ASPECT_TOLERANCE = 0.01
+
+logger = logging.getLogger(__name__)
+
+
+def _points_in_polygon(x: np.ndarray, y: np.ndarray, polygon: Sequence[Point]) -> np.ndarray:
+    """Even-odd ray casting over whole coordinate arrays at once."""
+    poly = np.asarray(polygon, dtype=np.float64)
+    inside = np.zeros(x.shape, dtype=bool)
+    px, py = poly[:, 0], poly[:, 1]
+    qx, qy = np.roll(px, 1), np.roll(py, 1)
+    for x0, y0, x1, y1 in zip(px, py, qx, qy):
+        if y0 == y1:
+            continue
+        crosses = (y0 > y) != (y1 > y)
+        x_at = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+        inside ^= crosses & (x < x_at)
+    return inside
+
+
+def _apply_homography(homography: np.ndarray, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    h = np.asarray(homography, dtype=np.float64)
+    w = h[2, 0] * x + h[2, 1] * y + h[2, 2]
+    w = np.where(np.abs(w) < 1e-12, 1e-12, w)
+    return (h[0, 0] * x + h[0, 1] * y + h[0, 2]) / w, (h[1, 0] * x + h[1, 1] * y + h[1, 2]) / w
+
+
+@dataclass
+class ZoneMap:
+    """Calibrated pixel→zone lookup for one camera pose.
+
+    ``labels`` is a precomputed raster of zone indices (``-1`` outside every
+    zone) sampled every ``stride`` pixels of a ``size`` = (width, height)
+    frame. Resolving a box is one clip and one gather, so a whole frame's
+    detections cost the same as a fixed ``location_hint``.
+    """
+
+    labels: np.ndarray
+    names: List[str]
+    size: Tuple[int, int]
+    stride: int = 4
+    _warned: Set[Tuple[int, int]] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_polygons(
+        cls,
+        size: Tuple[int, int],
+        zones: Dict[str, Sequence[Point]],
+        stride: int = 4,
+        homography: Sequence[Sequence[float]] | None = None,
+    ) -> "ZoneMap":
+        """Rasterise named polygons once at calibration time.
+
+        Polygons are in frame pixels, or in desk-plane coordinates when
+        ``homography`` (pixel → plane, 3x3) is given. Earlier zones win where
+        polygons overlap.
+        """
+        width, height = size
+        xs = np.arange(0, width, stride, dtype=np.float64) + stride / 2.0
+        ys = np.arange(0, height, stride, dtype=np.float64) + stride / 2.0
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        if homography is not None:
+            grid_x, grid_y = _apply_homography(np.asarray(homography), grid_x, grid_y)
+
+        labels = np.full(grid_x.shape, NO_ZONE, dtype=np.int16)
+        names = list(zones)
+        for index, name in enumerate(names):
+            inside = _points_in_polygon(grid_x, grid_y, zones[name])
+            labels[inside & (labels == NO_ZONE)] = index
+        return cls(labels=labels, names=names, size=(int(width), int(height)), stride=stride)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ZoneMap":
+        return cls.from_polygons(
+            size=tuple(data["size"]),
+            zones={str(name): [tuple(point) for point in polygon] for name, polygon in data["zones"].items()},
+            stride=int(data.get("stride", 4)),
+            homography=data.get("homography"),
+        )
+
+    def lookup(self, points: np.ndarray) -> np.ndarray:
+        """Zone index for each (x, y) pixel in ``points``; ``-1`` if none."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        rows, cols = self.labels.shape
+        col = np.clip((points[:, 0] // self.stride).astype(np.int64), 0, cols - 1)
+        row = np.clip((points[:, 1] // self.stride).astype(np.int64), 0, rows - 1)
+        return self.labels[row, col]
+
+    def zones_for(
+        self,
+        boxes: Sequence[BBox],
+        fallback: str,
+        scale: Tuple[float, float] = (1.0, 1.0),
+    ) -> List[str]:
+        """Name the zone under each box centre, or ``fallback`` outside all zones.
+
+        ``scale`` takes box pixels onto the map, see ``frame_scale``.
+        """
+        if not len(boxes):
+            return []
+        arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        centres = np.stack([(arr[:, 0] + arr[:, 2]) / 2.0, (arr[:, 1] + arr[:, 3]) / 2.0], axis=1)
+        centres *= np.asarray(scale, dtype=np.float64)
+        lookup = np.array([*self.names, fallback], dtype=object)
+        # -1 indexes the trailing fallback entry.
+        return lookup[self.lookup(centres)].tolist()
+
+    def zone_of(self, bbox: BBox, fallback: str) -> str:
+        return self.zones_for([bbox], fallback)[0]
+
+    def frame_scale(self, size: Tuple[int, int]) -> Optional[Tuple[float, float]]:
+        """Factors taking pixels of a ``size`` frame onto this map.
+
+        A frame at another resolution with the calibrated aspect ratio is
+        scaled. A different aspect ratio is a different field of view, so
+        this returns ``None`` and warns once per size.
+        """
+        width, height = int(size[0]), int(size[1])
+        scale_x, scale_y = self.size[0] / width, self.size[1] / height
+        if abs(scale_x - scale_y) <= ASPECT_TOLERANCE * max(scale_x, scale_y):
+            return scale_x, scale_y
+        if (width, height) not in self._warned:
+            self._warned.add((width, height))
+            logger.warning(
+                "zone map is calibrated for %dx%d frames, got %dx%d; using the location hint",
+                self.size[0], self.size[1], width, height,
+            )
+        return None
+
+
+@dataclass
+class ZoneRegistry:
+    """Zone maps keyed by ``(camera, pose)``, e.g. ``("gimbal", "home")``.
+
+    A pose without its own map falls back to the camera's ``default`` pose.
+    Poses calibrated with ``gimbal`` angles can be found again from the
+    gimbal's position with ``pose_at``.
+    """
+
+    maps: Dict[Tuple[str, str], ZoneMap] = field(default_factory=dict)
+    poses: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    def add(
+        self,
+        camera: str,
+        zone_map: ZoneMap,
+        pose: str = "default",
+        gimbal: Tuple[float, float] | None = None,
+    ) -> None:
+        self.maps[(camera, pose)] = zone_map
+        if gimbal is not None:
+            self.poses[pose] = (float(gimbal[0]), float(gimbal[1]))
+
+    def pose_at(self, pan: float, tilt: float, tolerance_deg: float = 2.0) -> Optional[str]:
+        """The calibrated pose nearest the gimbal angles, or ``None`` if none is within tolerance."""
+        best: Optional[str] = None
+        best_dist = tolerance_deg
+        for pose, (pose_pan, pose_tilt) in self.poses.items():
+            dist = max(abs(pan - pose_pan), abs(tilt - pose_tilt))
+            if dist <= best_dist:
+                best, best_dist = pose, dist
+        return best
+
+    def get(self, camera: str, pose: str = "default") -> Optional[ZoneMap]:
+        return self.maps.get((camera, pose)) or self.maps.get((camera, "default"))
+
+    def __len__(self) -> int:
+        return len(self.maps)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ZoneRegistry":
+        registry = cls()
+        for entry in data.get("maps", []):
+            gimbal = entry.get("gimbal")
+            registry.add(
+                str(entry.get("camera", "main")),
+                ZoneMap.from_dict(entry),
+                pose=str(entry.get("pose", "default")),
+                gimbal=tuple(gimbal) if gimbal is not None else None,
+            )
+        return registry
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "ZoneRegistry":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
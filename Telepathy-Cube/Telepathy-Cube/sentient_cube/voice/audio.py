@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+
+# Transcribes one speech segment of mono int16 PCM at the given sample rate.
+AsrCallback = Callable[[np.ndarray, int], str]
+
+
+class AudioSource:
+    """Base microphone interface yielding fixed-size mono int16 frames."""
+
+    sample_rate: int = 16000
+    frame_len: int = 320
+    # Live sources cannot wait: a frame that finds the ring full is dropped.
+    live: bool = True
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Fill ``out`` (``frame_len`` samples) with the next frame."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class WavFileSource(AudioSource):
+    """Replays a 16-bit PCM WAV file in place of the microphone.
+
+    Multi-channel files are averaged to mono; the last partial frame is
+    zero-padded. With ``realtime`` each read sleeps for one frame period.
+    """
+
+    def __init__(self, path: str, frame_ms: int = 20, realtime: bool = False) -> None:
+        with wave.open(path, "rb") as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("only 16-bit PCM WAV is supported")
+            self.sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        if channels > 1:
+            pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
+        self.samples = pcm
+        self.frame_len = self.sample_rate * frame_ms // 1000
+        self.realtime = realtime
+        self.live = realtime
+        self._pos = 0
+
+    def read_into(self, out: np.ndarray) -> bool:
+        if self._pos >= len(self.samples):
+            return False
+        chunk = self.samples[self._pos : self._pos + self.frame_len]
+        out[: len(chunk)] = chunk
+        out[len(chunk) :] = 0
+        self._pos += self.frame_len
+        if self.realtime:
+            time.sleep(self.frame_len / self.sample_rate)
+        return True
+
+
+class SoundDeviceSource(AudioSource):
+    """Microphone capture through ``sounddevice``."""
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20, device: int | str | None = None) -> None:
+        try:
+            import sounddevice  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "sounddevice not installed. Install with `pip install sounddevice`."
+            ) from exc
+        self.sample_rate = sample_rate
+        self.frame_len = sample_rate * frame_ms // 1000
+        self._stream = sounddevice.InputStream(
+            samplerate=sample_rate, channels=1, dtype="int16", blocksize=self.frame_len, device=device
+        )
+        self._stream.start()
+
+    def read_into(self, out: np.ndarray) -> bool:  # pragma: no cover - needs a microphone
+        data, _ = self._stream.read(self.frame_len)
+        out[:] = data[:, 0]
+        return True
+
+    def close(self) -> None:  # pragma: no cover - needs a microphone
+        self._stream.stop()
+        self._stream.close()
+
+
+class PcmRing:
+    """Single-producer, single-consumer ring of fixed-size PCM frames.
+
+    The producer only advances ``_head`` and the consumer only advances
+    ``_tail``, so neither side takes a lock. Frames are written in place
+    (``acquire_write``/``commit``) and read as memoryviews of their slot
+    (``peek``/``release``), so samples are never copied in between. The
+    producer never touches slots the reader has not released.
+    """
+
+    def __init__(self, slots: int, frame_len: int) -> None:
+        self.slots = slots
+        self.frame_len = frame_len
+        self._frames = np.zeros((slots, frame_len), dtype=np.int16)
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def full(self) -> bool:
+        return self._head - self._tail >= self.slots
+
+    def acquire_write(self) -> Optional[np.ndarray]:
+        if self.full():
+            return None
+        return self._frames[self._head % self.slots]
+
+    def commit(self) -> None:
+        self._head += 1
+
+    def push(self, samples: np.ndarray) -> bool:
+        """Copying write for callers that already hold a frame."""
+        slot = self.acquire_write()
+        if slot is None:
+            return False
+        slot[:] = samples
+        self.commit()
+        return True
+
+    def peek(self, max_frames: int | None = None) -> memoryview:
+        """Unread frames as one ``(n, frame_len)`` view, up to the wrap point."""
+        start = self._tail % self.slots
+        count = min(self._head - self._tail, self.slots - start)
+        if max_frames is not None:
+            count = min(count, max_frames)
+        return memoryview(self._frames[start : start + count])
+
+    def release(self, count: int) -> None:
+        self._tail += count
+
+
+@dataclass
+class VadConfig:
+    threshold_db: float = -45.0
+    margin_db: float = 10.0
+    max_zcr: float = 0.35
+    hangover_frames: int = 15
+    min_speech_frames: int = 5
+    preroll_frames: int = 5
+    noise_alpha: float = 0.05
+
+
+class EnergyVAD:
+    """Energy and zero-crossing voice activity detector.
+
+    Frames are classified a batch at a time with array operations. A frame
+    is speech when its level clears both ``threshold_db`` and the tracked
+    noise floor by ``margin_db``, and its zero-crossing rate is below
+    ``max_zcr`` (broadband hiss crosses zero far more often than voice).
+    The noise floor follows non-speech frames with an exponential average.
+    """
+
+    def __init__(self, config: VadConfig | None = None) -> None:
+        self.config = config or VadConfig()
+        self.noise_db: Optional[float] = None
+
+    @staticmethod
+    def features(frames: np.ndarray) -> tuple:
+        samples = frames.astype(np.float32)
+        rms = np.sqrt(np.mean(samples * samples, axis=1)) + 1e-3
+        level_db = 20.0 * np.log10(rms / 32768.0)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frames.shape[1] - 1)
+        return level_db, zcr
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        cfg = self.config
+        level_db, zcr = self.features(frames)
+        floor = self.noise_db if self.noise_db is not None else float(np.min(level_db, initial=cfg.threshold_db))
+        threshold = max(cfg.threshold_db, floor + cfg.margin_db)
+        speech = (level_db > threshold) & (zcr < cfg.max_zcr)
+        quiet = level_db[~speech]
+        if quiet.size:
+            # Per-frame EMA collapsed into one weighted mean over the batch.
+            weights = (1.0 - cfg.noise_alpha) ** np.arange(quiet.size - 1, -1, -1, dtype=np.float64)
+            decay = (1.0 - cfg.noise_alpha) ** quiet.size
+            floor = decay * floor + cfg.noise_alpha * float(np.dot(weights, quiet))
+        self.noise_db = floor
+        return speech
+
+
+@dataclass
+class SpeechSegment:
+    start_s: float
+    end_s: float
+    text: str
+
+
+@dataclass
+class FrontEndStats:
+    frames: int = 0
+    speech_frames: int = 0
+    asr_calls: int = 0
+    asr_seconds: float = 0.0
+    dropped: int = 0
+    segments: List[SpeechSegment] = field(default_factory=list)
+
+
+class AudioFrontEnd:
+    """Capture → ring → VAD → ASR, calling the recogniser only on speech.
+
+    A capture thread fills a ``PcmRing`` straight from the source. The
+    consumer classifies whatever is queued in one VAD batch and gathers
+    speech frames, with a short pre-roll and a hangover so word onsets and
+    pauses are kept. When a segment ends the PCM is handed to ``asr`` and
+    the transcript to ``on_text``; silence never reaches the recogniser.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        asr: AsrCallback,
+        vad: EnergyVAD | None = None,
+        on_text: Callable[[str], None] | None = None,
+        ring_slots: int = 256,
+    ) -> None:
+        self.source = source
+        self.asr = asr
+        self.vad = vad or EnergyVAD()
+        self.on_text = on_text
+        self.ring = PcmRing(ring_slots, source.frame_len)
+        self.stats = FrontEndStats()
+        self._scratch = np.zeros(source.frame_len, dtype=np.int16)
+        self._speech: List[np.ndarray] = []
+        self._preroll: List[np.ndarray] = []
+        self._voiced = 0
+        self._silence = 0
+        self._start = 0
+
+    def pump(self) -> bool:
+        """Capture one frame into the ring; ``False`` once the source ends.
+
+        When the ring is full a live source's frame is read and dropped,
+        while a file source simply waits for the consumer.
+        """
+        slot = self.ring.acquire_write()
+        if slot is None:
+            if not self.source.live:
+                return True
+            self.stats.dropped += 1
+            return self.source.read_into(self._scratch)
+        if not self.source.read_into(slot):
+            return False
+        self.ring.commit()
+        return True
+
+    def drain(self, max_frames: int | None = None) -> int:
+        """Run the VAD over queued frames and transcribe finished segments."""
+        done = 0
+        while len(self.ring):
+            view = self.ring.peek(None if max_frames is None else max_frames - done)
+            frames = np.asarray(view)
+            if not len(frames):
+                break
+            for frame, voiced in zip(frames, self.vad.classify(frames)):
+                self._step(frame, bool(voiced))
+            self.ring.release(len(frames))
+            done += len(frames)
+            if max_frames is not None and done >= max_frames:
+                break
+        return done
+
+    def flush(self) -> None:
+        if self._voiced >= self.vad.config.min_speech_frames:
+            self._emit()
+        self._reset_segment()
+
+    def run(self, sleep: Callable[[float], None] = time.sleep) -> List[SpeechSegment]:
+        """Process the whole source with capture on its own thread."""
+        finished = threading.Event()
+
+        period = self.source.frame_len / self.source.sample_rate
+
+        def capture() -> None:
+            try:
+                while self.pump():
+                    if self.ring.full() and not self.source.live:
+                        sleep(period / 4)
+            finally:
+                finished.set()
+
+        thread = threading.Thread(target=capture, name="audio-capture", daemon=True)
+        thread.start()
+        while not (finished.is_set() and not len(self.ring)):
+            if not self.drain():
+                sleep(period / 2)
+        thread.join()
+        self.flush()
+        return self.stats.segments
+
+    def _step(self, frame: np.ndarray, voiced: bool) -> None:
+        cfg = self.vad.config
+        index = self.stats.frames
+        self.stats.frames += 1
+        if voiced:
+            self.stats.speech_frames += 1
+        if not self._speech:
+            if not voiced:
+                self._preroll.append(frame.copy())
+                if len(self._preroll) > cfg.preroll_frames:
+                    self._preroll.pop(0)
+                return
+            self._start = index - len(self._preroll)
+            self._speech = self._preroll
+            self._preroll = []
+        # Copy out of the ring: the slot is reused once released.
+        self._speech.append(frame.copy())
+        if voiced:
+            self._voiced += 1
+            self._silence = 0
+            return
+        self._silence += 1
+        if self._silence > cfg.hangover_frames:
+            self.flush()
+
+    def _emit(self) -> None:
+        rate = self.source.sample_rate
+        pcm = np.concatenate(self._speech[: len(self._speech) - self._silence])
+        started = time.perf_counter()
+        text = self.asr(pcm, rate)
+        self.stats.asr_seconds += time.perf_counter() - started
+        self.stats.asr_calls += 1
+        frame_s = self.source.frame_len / rate
+        segment = SpeechSegment(self._start * frame_s, self._start * frame_s + len(pcm) / rate, text)
+        self.stats.segments.append(segment)
+        if text and self.on_text is not None:
+            self.on_text(text)
+
+    def _reset_segment(self) -> None:
+        self._speech = []
+        self._voiced = 0
+        self._silence = 0
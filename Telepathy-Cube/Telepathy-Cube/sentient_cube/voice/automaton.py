@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, List, Sequence, Tuple
+
+Match = Tuple[int, int, int]
+
+
+class AhoCorasick:
+    """Multi-keyword matcher compiled once into a full transition table.
+
+    Failure links are folded into every state's transitions at build time,
+    so a scan is one dict lookup per character with no backtracking.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.patterns = list(patterns)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("empty keyword")
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # BFS order guarantees the failure state's table is already complete.
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state].extend(outputs[fail[state]])
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._outputs: List[Tuple[int, ...]] = [tuple(out) for out in outputs]
+        self._lengths = [len(pattern) for pattern in self.patterns]
+
+    def find_all(self, text: str) -> List[Match]:
+        """Every (start, end, pattern_index) occurrence, ordered by end offset."""
+        return self.scan(text)[1]
+
+    def scan(self, text: str, state: int = 0, offset: int = 0) -> Tuple[int, List[Match]]:
+        """Resume from ``state`` with ``text`` starting at ``offset``.
+
+        Returns the new state and the matches ending inside ``text``, so a
+        growing stream can be fed chunk by chunk without rescanning.
+        """
+        delta = self._delta
+        outputs = self._outputs
+        lengths = self._lengths
+        found: List[Match] = []
+        for end, char in enumerate(text, offset + 1):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    found.append((end - lengths[index], end, index))
+        return state, found
+
+    def scan_states(self, text: str, state: int = 0, offset: int = 0) -> Tuple[List[int], List[Match]]:
+        """Like ``scan`` but also returns the state after every character."""
+        delta = self._delta
+        outputs = self._outputs
+        lengths = self._lengths
+        states: List[int] = []
+        found: List[Match] = []
+        for end, char in enumerate(text, offset + 1):
+            state = delta[state].get(char, 0)
+            states.append(state)
+            if outputs[state]:
+                for index in outputs[state]:
+                    found.append((end - lengths[index], end, index))
+        return states, found
@@ -0,0 +1,224 @@
+"""Intent parser benchmark: rule-table automaton vs. the original keyword chain.
+
+The reminder time parser is compared the same way against its original
+regex-per-call version. Besides the end-to-end comparisons, the report
+scans the corpus against growing synthetic keyword sets, since an ``in``
+chain costs one pass per keyword while the automaton costs one pass in
+total.
+
+Usage::
+
+    python -m sentient_cube.voice.benchmark --count 100000 --out bench_intent.json
+    python -m sentient_cube.voice.benchmark --corpus utterances.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sentient_cube.models import Intent, IntentType, Mode
+from sentient_cube.voice.automaton import AhoCorasick
+from sentient_cube.voice.intent import default_engine
+from sentient_cube.voice.time_parser import parse_reminder_time
+
+ITEMS = ["钥匙", "手机", "身份证", "药盒", "眼镜", "钱包", "耳机", "充电器", "遥控器", "水杯"]
+TIMES = ["明天9点", "后天8点30分", "今晚7点", "10分钟后", "下午3点", "明天早上6点"]
+TASKS = ["带身份证", "吃药", "开会", "给妈妈打电话", "取快递", "浇花"]
+CHATTER = ["今天天气怎么样", "你好呀", "讲个笑话", "我有点累了", "播放音乐", "晚安", "谢谢你"]
+
+
+def legacy_parse_intent(text: str) -> Intent:
+    """The original ``in``/``str.replace`` chain, kept as the reference."""
+    raw = (text or "").strip()
+    if not raw:
+        return Intent(intent_type=IntentType.CHAT, raw_text=raw)
+    if "在哪" in raw or "哪里" in raw:
+        item = (
+            raw.replace("我的", "")
+            .replace("在哪", "")
+            .replace("哪里", "")
+            .replace("？", "")
+            .replace("?", "")
+            .strip()
+        )
+        return Intent(intent_type=IntentType.FIND, item=item, raw_text=raw)
+    if "提醒" in raw:
+        parts = raw.split("提醒")
+        time_text = (parts[0] or "").strip()
+        content = "提醒".join(parts[1:]).strip() or "事项"
+        return Intent(intent_type=IntentType.REMINDER, time_text=time_text, content=content, raw_text=raw)
+    if "左脑" in raw:
+        return Intent(intent_type=IntentType.MODE, mode=Mode.FOCUS, raw_text=raw)
+    if "右脑" in raw or "ambient" in raw.lower():
+        return Intent(intent_type=IntentType.MODE, mode=Mode.AMBIENT, raw_text=raw)
+    return Intent(intent_type=IntentType.CHAT, content=raw, raw_text=raw)
+
+
+def legacy_parse_reminder_time(time_text: str) -> datetime:
+    """The original time parser, kept as the reference."""
+    now = datetime.now()
+    target = now
+    text = (time_text or "").strip()
+    if "后天" in text:
+        target = target + timedelta(days=2)
+    elif "明天" in text:
+        target = target + timedelta(days=1)
+    hour_match = re.search(r"(\d{1,2})\s*点", text)
+    minute_match = re.search(r"(\d{1,2})\s*分", text)
+    hour = int(hour_match.group(1)) if hour_match else 9
+    minute = int(minute_match.group(1)) if minute_match else 0
+    target = target.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target = target + timedelta(days=1)
+    return target
+
+
+def synthetic_utterances(count: int, seed: int = 0) -> List[str]:
+    """Seeded mix of find, reminder, mode and chat utterances."""
+    rng = random.Random(seed)
+    templates: List[Callable[[], str]] = [
+        lambda: f"我的{rng.choice(ITEMS)}在哪？",
+        lambda: f"{rng.choice(ITEMS)}放哪里了?",
+        lambda: f"{rng.choice(TIMES)}提醒我{rng.choice(TASKS)}",
+        lambda: f"切换到{rng.choice(['左脑', '右脑'])}模式",
+        lambda: "switch to Ambient",
+        lambda: rng.choice(CHATTER) + "，" + rng.choice(CHATTER),
+    ]
+    return [rng.choice(templates)() for _ in range(count)]
+
+
+def synthetic_time_texts(count: int, seed: int = 0) -> List[str]:
+    """Seeded reminder time phrases, drawn from a realistic, repetitive mix."""
+    rng = random.Random(seed)
+    templates: List[Callable[[], str]] = [
+        lambda: f"{rng.choice(['今天', '明天', '后天'])}{rng.randint(6, 11)}点",
+        lambda: f"明天{rng.randint(1, 11)}点{rng.choice([15, 30, 45])}分",
+        lambda: f"下午{rng.randint(1, 6)}点半",
+        lambda: f"{rng.choice(['十', '二十', '三十', '45'])}分钟后",
+        lambda: f"每天早上{rng.randint(6, 9)}点",
+        lambda: f"下周{rng.choice('一二三四五六日')}上午{rng.randint(8, 11)}点",
+    ]
+    return [rng.choice(templates)() for _ in range(count)]
+
+
+@dataclass
+class ParserStats:
+    name: str
+    total_s: float
+    per_utterance_us: float
+    throughput_ups: Optional[float]
+
+
+@dataclass
+class ScalingStats:
+    keywords: int
+    chain_us: float
+    automaton_us: float
+
+
+@dataclass
+class IntentBenchmarkReport:
+    utterances: int
+    mismatches: int
+    parsers: List[ParserStats] = field(default_factory=list)
+    time_parsers: List[ParserStats] = field(default_factory=list)
+    scaling: List[ScalingStats] = field(default_factory=list)
+    environment: Dict[str, str] = field(default_factory=dict)
+
+
+def _time(name: str, parse: Callable[[str], object], corpus: Sequence[str], rounds: int) -> ParserStats:
+    per_us = _per_utterance_us(parse, corpus, rounds)
+    return ParserStats(
+        name=name,
+        total_s=per_us * len(corpus) / 1e6,
+        per_utterance_us=per_us,
+        throughput_ups=1e6 / per_us if per_us > 0 else None,
+    )
+
+
+def _per_utterance_us(scan: Callable[[str], object], corpus: Sequence[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in corpus:
+            scan(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(corpus)
+
+
+def keyword_scaling(
+    corpus: Sequence[str], sizes: Sequence[int] = (4, 16, 64, 256), rounds: int = 3, seed: int = 0
+) -> List[ScalingStats]:
+    rng = random.Random(seed)
+    alphabet = [chr(0x4E00 + offset) for offset in range(3000)]
+    stats = []
+    for size in sizes:
+        keywords = [*ITEMS, *("".join(rng.choice(alphabet) for _ in range(2)) for _ in range(size))][:size]
+        automaton = AhoCorasick(keywords)
+        stats.append(
+            ScalingStats(
+                keywords=size,
+                chain_us=_per_utterance_us(lambda text: [k for k in keywords if k in text], corpus, rounds),
+                automaton_us=_per_utterance_us(automaton.find_all, corpus, rounds),
+            )
+        )
+    return stats
+
+
+def run_benchmark(
+    corpus: Sequence[str], rounds: int = 3, scaling_sizes: Sequence[int] = (4, 16, 64, 256)
+) -> IntentBenchmarkReport:
+    if not corpus:
+        raise ValueError("benchmark needs at least one utterance")
+    engine = default_engine()
+    times = synthetic_time_texts(len(corpus))
+    mismatches = sum(1 for text in corpus if engine.parse(text) != legacy_parse_intent(text))
+    return IntentBenchmarkReport(
+        utterances=len(corpus),
+        mismatches=mismatches,
+        parsers=[
+            _time("legacy", legacy_parse_intent, corpus, rounds),
+            _time("automaton", engine.parse, corpus, rounds),
+        ],
+        time_parsers=[
+            _time("legacy", legacy_parse_reminder_time, times, rounds),
+            _time("cached", parse_reminder_time, times, rounds),
+        ],
+        scaling=keyword_scaling(corpus, scaling_sizes, rounds),
+        environment={
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark intent parsing")
+    parser.add_argument("--corpus", default="", help="UTF-8 file with one utterance per line")
+    parser.add_argument("--count", type=int, default=100000, help="Synthetic utterances if no corpus")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--out", default="bench_intent.json")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = [line for line in Path(args.corpus).read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        corpus = synthetic_utterances(args.count)
+    report = run_benchmark(corpus, rounds=args.rounds)
+    payload = json.dumps(asdict(report), ensure_ascii=False, indent=2)
+    Path(args.out).write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sentient_cube.models import Intent, IntentType, Mode
+from sentient_cube.voice.automaton import AhoCorasick, Match
+
+DEFAULT_RULES_PATH = Path(__file__).with_name("intent_rules.json")
+
+# Lower-cases ASCII only, so match offsets still index the original text.
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def lower_ascii(text: str) -> str:
+    lowered = text.lower()
+    return lowered if len(lowered) == len(text) else text.translate(_ASCII_LOWER)
+
+
+@dataclass(frozen=True)
+class IntentRule:
+    """One row of the shared rule table; earlier rows win.
+
+    ``slot`` selects extraction: ``item`` removes every trigger and ``strip``
+    keyword from the utterance, ``split`` cuts it at the first trigger into
+    time text and content.
+    """
+
+    intent: IntentType
+    triggers: Tuple[str, ...]
+    strip: Tuple[str, ...] = ()
+    slot: str = ""
+    mode: Optional[Mode] = None
+    default_content: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntentRule":
+        mode = data.get("mode")
+        return cls(
+            intent=IntentType(data["intent"]),
+            triggers=tuple(keyword.lower() for keyword in data["triggers"]),
+            strip=tuple(keyword.lower() for keyword in data.get("strip", ())),
+            slot=str(data.get("slot", "")),
+            mode=Mode(mode) if mode else None,
+            default_content=str(data.get("default_content", "")),
+        )
+
+
+class IntentEngine:
+    """Table-driven intent parser over a single Aho-Corasick pass."""
+
+    def __init__(self, rules: Sequence[IntentRule]) -> None:
+        self.rules = list(rules)
+        keywords: List[str] = []
+        for rule in self.rules:
+            for keyword in (*rule.triggers, *rule.strip):
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        self.automaton = AhoCorasick(keywords)
+        # Per keyword: the highest-priority rule it triggers (len(rules) if none).
+        self._rank = [
+            min((i for i, rule in enumerate(self.rules) if keyword in rule.triggers), default=len(self.rules))
+            for keyword in keywords
+        ]
+        # Per rule: keyword indexes that mark its trigger spans and its removable spans.
+        self._trigger_ids = [
+            frozenset(k for k, keyword in enumerate(keywords) if keyword in rule.triggers) for rule in self.rules
+        ]
+        self._remove_ids = [
+            frozenset(k for k, keyword in enumerate(keywords) if keyword in rule.triggers or keyword in rule.strip)
+            for rule in self.rules
+        ]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntentEngine":
+        return cls([IntentRule.from_dict(rule) for rule in data["rules"]])
+
+    @classmethod
+    def from_file(cls, path: str | Path = DEFAULT_RULES_PATH) -> "IntentEngine":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def parse(self, text: str) -> Intent:
+        raw = (text or "").strip()
+        if not raw:
+            return Intent(intent_type=IntentType.CHAT, raw_text=raw)
+        return self.from_matches(raw, self.automaton.find_all(lower_ascii(raw)))
+
+    def best_rule(self, matches: Sequence[Match]) -> Optional[int]:
+        """Index of the winning rule among ``matches``, or ``None`` for chat."""
+        rank = self._rank
+        best = min((rank[keyword] for _, _, keyword in matches), default=len(self.rules))
+        return None if best == len(self.rules) else best
+
+    def from_matches(self, raw: str, matches: Sequence[Match]) -> Intent:
+        """Build the intent for stripped text ``raw`` from its keyword matches."""
+        if not raw:
+            return Intent(intent_type=IntentType.CHAT, raw_text=raw)
+        best = self.best_rule(matches)
+        if best is None:
+            return Intent(intent_type=IntentType.CHAT, content=raw, raw_text=raw)
+
+        rule = self.rules[best]
+        if rule.slot == "item":
+            remove = self._remove_ids[best]
+            pieces = []
+            cursor = 0
+            for start, end in sorted((s, e) for s, e, keyword in matches if keyword in remove):
+                if start > cursor:
+                    pieces.append(raw[cursor:start])
+                cursor = max(cursor, end)
+            pieces.append(raw[cursor:])
+            return Intent(intent_type=rule.intent, item="".join(pieces).strip(), mode=rule.mode, raw_text=raw)
+        if rule.slot == "split":
+            triggers = self._trigger_ids[best]
+            start, end = min((s, e) for s, e, keyword in matches if keyword in triggers)
+            return Intent(
+                intent_type=rule.intent,
+                time_text=raw[:start].strip(),
+                content=raw[end:].strip() or rule.default_content,
+                mode=rule.mode,
+                raw_text=raw,
+            )
+        return Intent(intent_type=rule.intent, mode=rule.mode, raw_text=raw)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence, Set
+
+from sentient_cube.models import Intent
+from sentient_cube.voice.automaton import AhoCorasick, Match
+from sentient_cube.voice.rules import IntentEngine, lower_ascii
+
+
+class StreamEventType(str, Enum):
+    PREFETCH = "prefetch"
+    PROVISIONAL = "provisional"
+    FINAL = "final"
+
+
+@dataclass
+class StreamEvent:
+    kind: StreamEventType
+    intent: Optional[Intent] = None
+    item: str = ""
+
+
+class _Track:
+    """Per-character automaton states, so revised partials rewind instead of rescanning."""
+
+    def __init__(self, automaton: AhoCorasick) -> None:
+        self.automaton = automaton
+        self.states: List[int] = []
+        self.matches: List[Match] = []
+
+    def rewind(self, length: int) -> None:
+        del self.states[length:]
+        self.matches = [match for match in self.matches if match[1] <= length]
+
+    def extend(self, chunk: str) -> List[Match]:
+        state = self.states[-1] if self.states else 0
+        states, found = self.automaton.scan_states(chunk, state, offset=len(self.states))
+        self.states.extend(states)
+        self.matches.extend(found)
+        return found
+
+
+class StreamingIntentRecognizer:
+    """Recognises intents on growing partial ASR transcripts.
+
+    Each ``update`` only scans the characters that are new since the last
+    partial; when the recogniser revises earlier characters, the automaton
+    rewinds to the common prefix. A ``prefetch`` event fires the first time
+    a known item name appears, and a ``provisional`` intent fires once the
+    top-priority rule matches, since nothing said later can outrank it.
+    ``finish`` returns the final intent at the endpoint.
+    """
+
+    def __init__(self, engine: IntentEngine, vocabulary: Sequence[str] = ()) -> None:
+        self.engine = engine
+        self.vocabulary = [name for name in dict.fromkeys(vocabulary) if name]
+        self._keywords = _Track(engine.automaton)
+        self._items = _Track(AhoCorasick([lower_ascii(name) for name in self.vocabulary])) if self.vocabulary else None
+        self.text = ""
+        self._prefetched: Set[str] = set()
+        self._provisional: Optional[Intent] = None
+
+    def reset(self) -> None:
+        self._keywords.rewind(0)
+        if self._items is not None:
+            self._items.rewind(0)
+        self.text = ""
+        self._prefetched = set()
+        self._provisional = None
+
+    def update(self, partial: str) -> List[StreamEvent]:
+        common = 0
+        limit = min(len(partial), len(self.text))
+        while common < limit and partial[common] == self.text[common]:
+            common += 1
+        chunk = lower_ascii(partial[common:])
+        self._keywords.rewind(common)
+        self._keywords.extend(chunk)
+        events: List[StreamEvent] = []
+        if self._items is not None:
+            self._items.rewind(common)
+            for _, _, index in self._items.extend(chunk):
+                name = self.vocabulary[index]
+                if name not in self._prefetched:
+                    self._prefetched.add(name)
+                    events.append(StreamEvent(StreamEventType.PREFETCH, item=name))
+        self.text = partial
+
+        if self.engine.best_rule(self._keywords.matches) == 0:
+            intent = self._intent()
+            previous = self._provisional
+            # raw_text grows with every partial; only a changed reading is news.
+            if previous is None or (intent.intent_type, intent.item, intent.mode) != (
+                previous.intent_type,
+                previous.item,
+                previous.mode,
+            ):
+                self._provisional = intent
+                events.append(StreamEvent(StreamEventType.PROVISIONAL, intent=intent, item=intent.item))
+        return events
+
+    def finish(self) -> StreamEvent:
+        intent = self._intent()
+        self.reset()
+        return StreamEvent(StreamEventType.FINAL, intent=intent, item=intent.item)
+
+    def _intent(self) -> Intent:
+        raw = self.text.strip()
+        lead = len(self.text) - len(self.text.lstrip())
+        matches = [
+            (start - lead, end - lead, keyword)
+            for start, end, keyword in self._keywords.matches
+            if start >= lead and end - lead <= len(raw)
+        ]
+        return self.engine.from_matches(raw, matches)
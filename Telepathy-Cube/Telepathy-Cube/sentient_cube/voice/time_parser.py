@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from sentient_cube.reminder.recurrence import DAILY, HOURLY, MINUTELY, MONTHLY, WEEKENDS, WEEKLY, WORKDAYS, Recurrence
+
+_CN_DIGITS = {"零": 0, "〇": 0, "一": 1, "二": 2, "两": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+_NUM = r"(?:\d+|[零〇一二两三四五六七八九十百]+)"
+
+_DAYS = {"今天": 0, "今晚": 0, "今早": 0, "明天": 1, "明早": 1, "明晚": 1, "后天": 2, "大后天": 3}
+_DAY_PERIODS = {"今晚": "晚上", "今早": "早上", "明早": "早上", "明晚": "晚上"}
+_WEEKDAYS = {"一": 0, "二": 1, "三": 2, "四": 3, "五": 4, "六": 5, "日": 6, "天": 6}
+_UNIT_MINUTES = {"分钟": 1, "分": 1, "小时": 60, "钟头": 60, "天": 1440}
+_WEEK_DAY_CHARS = set(_WEEKDAYS) | set("1234567")
+_EVERY_UNITS = {"分钟": MINUTELY, "小时": HOURLY, "钟头": HOURLY, "天": DAILY}
+# Hour used when only a period of day is given.
+_PERIOD_DEFAULT_HOUR = {
+    "凌晨": 6, "早上": 8, "早晨": 8, "上午": 9, "中午": 12, "下午": 15, "傍晚": 18, "晚上": 20, "夜里": 22,
+}
+_AFTERNOON = {"下午", "傍晚", "晚上", "夜里"}
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(days=7)
+
+# One alternation scanned once per utterance; earlier branches win at a position.
+_TOKENS = re.compile(
+    rf"""
+    (?P<rel>(?P<rel_n>{_NUM})?\s*(?:个)?(?P<rel_half>半)?\s*(?P<rel_unit>分钟|分|小时|钟头|天)\s*(?:以后|之后|后))
+  | (?P<repeat>每天|每日|天天)
+  | (?P<workdays>(?:每个?)?工作日)
+  | (?P<weekends>每个?周末)
+  | (?P<weekly>每个?(?:周|星期|礼拜)(?P<weekly_days>[一二三四五六日天1-7](?:[、,，和]?(?:周|星期|礼拜)?[一二三四五六日天1-7])*))
+  | (?P<every>每隔?\s*(?P<every_n>{_NUM})?\s*个?(?P<every_half>半)?\s*(?P<every_unit>分钟|小时|钟头|天))
+  | (?P<monthly>每个?月\s*(?P<month_day>{_NUM})\s*[号日])
+  | (?P<day>大后天|后天|明天|明早|明晚|今天|今晚|今早)
+  | (?P<week>(?P<week_next>下个?|这个?|本)?(?:周|星期|礼拜)(?P<wd>[一二三四五六日天1-7]))
+  | (?P<period>凌晨|早上|早晨|上午|中午|下午|傍晚|晚上|夜里)
+  | (?P<clock>(?P<hour>{_NUM})\s*(?:点钟?|时|[:：])\s*
+        (?:(?P<half>半)|(?P<quarter>[一三13])刻|(?P<minute>{_NUM})\s*分?)?)
+    """,
+    re.VERBOSE,
+)
+
+
+def cn_number(text: str) -> int:
+    """Parse ``"35"``, ``"二十"``, ``"十五"``, ``"一百二十"`` and similar."""
+    if text.isdigit():
+        return int(text)
+    total = 0
+    current = 0
+    for char in text:
+        if char == "百":
+            total += (current or 1) * 100
+            current = 0
+        elif char == "十":
+            total += (current or 1) * 10
+            current = 0
+        else:
+            current = current * 10 + _CN_DIGITS[char]
+    return total + current
+
+
+@dataclass(frozen=True)
+class TimeSpec:
+    """What a time expression says, independent of the current time.
+
+    ``offset`` is the precomputed distance from today's midnight for
+    absolute expressions, so resolving against ``now`` is one addition.
+    ``understood`` is false when a rule or clock time was recognised but its
+    numbers are impossible, such as "每月35号", "每隔0小时" or "25点".
+    """
+
+    day_offset: int = 0
+    weekday: Optional[int] = None
+    next_week: bool = False
+    period: str = ""
+    hour: Optional[int] = None
+    minute: int = 0
+    relative_minutes: Optional[float] = None
+    repeat_daily: bool = False
+    recurrence: Optional[Recurrence] = None
+    offset: timedelta = timedelta(0)
+    understood: bool = True
+
+
+@lru_cache(maxsize=1024)
+def parse_time_spec(text: str) -> TimeSpec:
+    fields: Dict[str, Any] = {}
+    relative_days: Optional[int] = None
+    for match in _TOKENS.finditer(text or ""):
+        if match.group("rel"):
+            count = cn_number(match.group("rel_n")) if match.group("rel_n") else 0
+            if match.group("rel_half"):
+                count += 0.5
+            elif match.group("rel_unit") == "天":
+                relative_days = count
+            fields["relative_minutes"] = count * _UNIT_MINUTES[match.group("rel_unit")]
+        elif match.group("repeat"):
+            fields["repeat_daily"] = True
+        elif match.group("workdays"):
+            fields["recurrence"] = WORKDAYS
+        elif match.group("weekends"):
+            fields["recurrence"] = WEEKENDS
+        elif match.group("weekly"):
+            picked = [char for char in match.group("weekly_days") if char in _WEEK_DAY_CHARS]
+            days = [int(char) - 1 if char.isdigit() else _WEEKDAYS[char] for char in picked]
+            fields["recurrence"] = Recurrence(WEEKLY, weekdays=tuple(sorted(set(days))))
+        elif match.group("every"):
+            unit = match.group("every_unit")
+            if match.group("every_half"):
+                # "每隔半小时", "每隔一个半小时": whole minutes only.
+                count = cn_number(match.group("every_n")) if match.group("every_n") else 0
+                minutes = (count + 0.5) * _UNIT_MINUTES[unit]
+                freq, interval = MINUTELY, int(minutes) if minutes == int(minutes) else 0
+            else:
+                freq = _EVERY_UNITS[unit]
+                interval = cn_number(match.group("every_n")) if match.group("every_n") else 1
+            if interval >= 1:
+                fields["recurrence"] = Recurrence(freq, interval=interval)
+            else:
+                fields["understood"] = False
+        elif match.group("monthly"):
+            day = cn_number(match.group("month_day"))
+            if 1 <= day <= 31:
+                fields["recurrence"] = Recurrence(MONTHLY, monthday=day)
+            else:
+                fields["understood"] = False
+        elif match.group("day"):
+            word = match.group("day")
+            fields["day_offset"] = _DAYS[word]
+            if word in _DAY_PERIODS:
+                fields["period"] = _DAY_PERIODS[word]
+        elif match.group("week"):
+            wd = match.group("wd")
+            fields["weekday"] = int(wd) - 1 if wd.isdigit() else _WEEKDAYS[wd]
+            fields["next_week"] = (match.group("week_next") or "").startswith("下")
+        elif match.group("period"):
+            fields["period"] = match.group("period")
+        else:
+            fields["hour"] = cn_number(match.group("hour"))
+            if match.group("half"):
+                fields["minute"] = 30
+            elif match.group("quarter"):
+                fields["minute"] = 15 * cn_number(match.group("quarter"))
+            elif match.group("minute"):
+                fields["minute"] = cn_number(match.group("minute"))
+            minute = fields.get("minute", 0)
+            if fields["hour"] > 24 or minute >= 60 or (fields["hour"] == 24 and minute):
+                # "25点", "8点60分": not a time of day, so not rolled into the next hour or day.
+                fields["understood"] = False
+    if relative_days is not None and ("hour" in fields or "period" in fields):
+        # "三天后上午9点": whole days move the date, and the spoken time still applies.
+        del fields["relative_minutes"]
+        fields["day_offset"] = fields.get("day_offset", 0) + relative_days
+    hour = fields.get("hour")
+    period = fields.get("period", "")
+    if hour is None:
+        hour = _PERIOD_DEFAULT_HOUR.get(period, 9)
+    elif period in _AFTERNOON and hour < 12:
+        hour += 12
+    elif period in ("晚上", "夜里") and hour == 12:
+        hour = 24
+    elif period == "中午" and hour < 11:
+        hour += 12
+    day_offset = fields.get("day_offset", 0)
+    return TimeSpec(**fields, offset=timedelta(days=day_offset, hours=hour, minutes=fields.get("minute", 0)))
+
+
+def resolve(spec: TimeSpec, now: datetime) -> Optional[datetime]:
+    """Turn a parsed spec into the next matching moment after ``now``.
+
+    Returns ``None`` when the spec was not understood or its rule never fires.
+    """
+    if not spec.understood:
+        return None
+    if spec.relative_minutes is not None:
+        return (now + timedelta(minutes=spec.relative_minutes)).replace(microsecond=0)
+    rule = spec.recurrence
+    if rule is not None and rule.period is not None and rule.freq != DAILY:
+        # "Every N hours" starts one interval from now; "every N days" keeps the spoken time.
+        return (now + rule.period).replace(microsecond=0)
+
+    midnight = datetime(now.year, now.month, now.day, tzinfo=now.tzinfo)
+    if rule is not None:
+        # Weekday and month-day rules pick their own first day at the spoken time.
+        return rule.next_after(midnight + spec.offset - timedelta(days=spec.day_offset), now)
+    if spec.weekday is None:
+        target = midnight + spec.offset
+        return target + _ONE_DAY if target <= now else target
+
+    ahead = (spec.weekday - now.weekday()) % 7 + (7 if spec.next_week else 0)
+    # Weekday expressions ignore day_offset.
+    target = midnight + spec.offset + timedelta(days=ahead - spec.day_offset)
+    return target + _ONE_WEEK if target <= now else target
+
+
+def parse_reminder_time(time_text: str, now: datetime | None = None) -> Optional[datetime]:
+    return resolve(parse_time_spec((time_text or "").strip()), now or datetime.now())
@@ -0,0 +1,112 @@
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+from sentient_cube.voice.audio import AudioFrontEnd, EnergyVAD, PcmRing, VadConfig, WavFileSource
+
+RATE = 16000
+
+
+def _voice(seconds, rng):
+    t = np.arange(int(seconds * RATE)) / RATE
+    tone = sum(np.sin(2 * np.pi * f * t) / k for k, f in enumerate((180, 360, 540), start=1))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    return 6000 * tone * envelope + rng.normal(0, 30, t.size)
+
+
+def _write_wav(path: Path, parts, channels=1):
+    pcm = np.clip(np.concatenate(parts), -32768, 32767).astype("<i2")
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1).ravel()
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(pcm.tobytes())
+
+
+def _silence(seconds, rng, level=30):
+    return rng.normal(0, level, int(seconds * RATE))
+
+
+def test_ring_reads_are_views_of_the_slots():
+    ring = PcmRing(slots=4, frame_len=8)
+    for value in range(3):
+        assert ring.push(np.full(8, value, dtype=np.int16))
+    view = ring.peek()
+    frames = np.asarray(view)
+    assert frames.shape == (3, 8) and frames[:, 0].tolist() == [0, 1, 2]
+    assert np.shares_memory(frames, ring._frames)
+    ring.release(2)
+    assert ring.push(np.full(8, 3, dtype=np.int16))
+    assert ring.push(np.full(8, 4, dtype=np.int16))
+    assert ring.push(np.full(8, 5, dtype=np.int16))
+    assert ring.full() and not ring.push(np.zeros(8, dtype=np.int16))
+    # The view stops at the wrap point; the rest comes on the next peek.
+    assert np.asarray(ring.peek())[:, 0].tolist() == [2, 3]
+    ring.release(2)
+    assert np.asarray(ring.peek())[:, 0].tolist() == [4, 5]
+
+
+def test_vad_rejects_silence_and_hiss():
+    rng = np.random.default_rng(0)
+    frames = np.stack(
+        [
+            _silence(0.02, rng),
+            rng.normal(0, 4000, 320),
+            _voice(0.02, rng),
+        ]
+    ).astype(np.int16)
+    assert EnergyVAD().classify(frames).tolist() == [False, False, True]
+
+
+def test_asr_only_sees_speech_segments(tmp_path: Path):
+    rng = np.random.default_rng(1)
+    path = tmp_path / "utterances.wav"
+    _write_wav(
+        path,
+        [_silence(1.0, rng), _voice(0.6, rng), _silence(1.0, rng), _voice(0.8, rng), _silence(0.5, rng)],
+        channels=2,
+    )
+    heard = []
+
+    def asr(pcm, rate):
+        heard.append(len(pcm) / rate)
+        return f"segment {len(heard)}"
+
+    front_end = AudioFrontEnd(WavFileSource(str(path)), asr, ring_slots=16)
+    segments = front_end.run()
+
+    assert [segment.text for segment in segments] == ["segment 1", "segment 2"]
+    assert abs(segments[0].start_s - 0.9) < 0.05 and abs(segments[1].start_s - 2.5) < 0.05
+    assert abs(sum(heard) - 1.6) < 0.05
+    assert front_end.stats.frames == 195
+    assert front_end.stats.dropped == 0
+
+
+def test_short_clicks_never_reach_the_recogniser(tmp_path: Path):
+    rng = np.random.default_rng(2)
+    path = tmp_path / "click.wav"
+    _write_wav(path, [_silence(0.5, rng), _voice(0.04, rng), _silence(0.5, rng)])
+    calls = []
+    vad = EnergyVAD(VadConfig(min_speech_frames=5))
+    front_end = AudioFrontEnd(WavFileSource(str(path)), lambda pcm, rate: calls.append(pcm) or "", vad)
+    assert front_end.run() == []
+    assert calls == []
+
+
+def test_core_listens_to_transcripts(tmp_path: Path):
+    rng = np.random.default_rng(3)
+    path = tmp_path / "ask.wav"
+    _write_wav(path, [_silence(0.5, rng), _voice(0.8, rng), _silence(0.5, rng)])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        core.memory.add_object(ObjectMemory(name="钥匙", location="桌面右侧", confidence=0.9))
+        results = core.listen(AudioFrontEnd(WavFileSource(str(path)), lambda pcm, rate: "我的钥匙在哪？"))
+        assert [result["intent"] for result in results] == ["find"]
+        assert core.laser_target == "钥匙"
+    finally:
+        core.close()
@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sentient_cube.vision.benchmark import run_benchmark, synthetic_scenes, write_report
+from sentient_cube.vision.detector import MockObjectDetector
+
+
+def test_synthetic_scenes_are_reproducible():
+    a = synthetic_scenes(2, width=64, height=48, seed=7)
+    b = synthetic_scenes(2, width=64, height=48, seed=7)
+    assert a[0].shape == (48, 64, 3)
+    assert all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def test_benchmark_reports_percentiles_per_batch_size(tmp_path: Path):
+    images = synthetic_scenes(5, width=64, height=48)
+    report = run_benchmark(MockObjectDetector, images, batch_sizes=(1, 2), rounds=2, backend="mock")
+    assert [stats.batch_size for stats in report.batches] == [1, 2]
+    assert report.batches[0].images == 10
+    assert report.batches[1].batches == 6
+    assert set(report.batches[0].latency_ms) >= {"p50", "p95", "p99"}
+
+    out = tmp_path / "bench.json"
+    write_report(report, out)
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload["backend"] == "mock"
+    assert payload["batches"][1]["throughput_ips"] > 0
+    assert payload["batches"][0]["peak_alloc_mb"] >= 0
+    assert "process_peak_rss_mb" in payload["batches"][0]
+
+
+def test_benchmark_report_is_strict_json(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("sentient_cube.vision.benchmark.time.perf_counter", lambda: 0.0)
+    report = run_benchmark(MockObjectDetector, synthetic_scenes(1, width=8, height=8), batch_sizes=(1,), rounds=1)
+    out = tmp_path / "bench.json"
+    write_report(report, out)
+    payload = json.loads(out.read_text(encoding="utf-8"), parse_constant=lambda name: pytest.fail(name))
+    assert payload["batches"][0]["throughput_ips"] is None
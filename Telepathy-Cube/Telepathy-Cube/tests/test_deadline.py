@@ -0,0 +1,117 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sentient_cube.control.state_machine import DualBrainStateMachine
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import Mode, Reminder
+from sentient_cube.reminder.manager import ReminderManager
+from sentient_cube.reminder.store import ReminderStore
+from sentient_cube.system.deadline import DeadlineScheduler
+
+
+def test_sleeps_until_the_earliest_deadline():
+    start = time.time()
+    deadlines = {"late": start + 5.0, "soon": start + 0.1}
+    fired = threading.Event()
+
+    def on_deadline():
+        deadlines["soon"] = None
+        fired.set()
+
+    scheduler = DeadlineScheduler(
+        {name: (lambda name=name: deadlines[name]) for name in deadlines}, on_deadline
+    )
+    assert scheduler.next_deadline() == ("soon", start + 0.1)
+    scheduler.start()
+    try:
+        assert fired.wait(2.0)
+        assert time.time() - start >= 0.1
+        # One timed wait, no polling in between.
+        assert scheduler.wakeups <= 2
+    finally:
+        scheduler.stop()
+
+
+def test_poke_rearms_for_a_new_earlier_deadline():
+    deadline = [None]
+    fired = []
+
+    def on_deadline():
+        fired.append(time.time())
+        deadline[0] = None
+
+    scheduler = DeadlineScheduler({"only": lambda: deadline[0]}, on_deadline)
+    scheduler.start()
+    try:
+        time.sleep(0.05)
+        target = time.time() + 0.1
+        deadline[0] = target
+        scheduler.poke()
+        time.sleep(0.3)
+        assert len(fired) == 1
+        assert 0 <= fired[0] - target < 0.1
+    finally:
+        scheduler.stop()
+
+
+def test_idle_deadline_follows_mode():
+    machine = DualBrainStateMachine(idle_timeout_seconds=30)
+    assert machine.idle_deadline() is None
+    machine.switch(Mode.FOCUS)
+    assert machine.idle_deadline() == machine.changed_at + timedelta(seconds=30)
+
+
+def test_core_fires_reminders_and_idle_timeout_on_time(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    core.state_machine.idle_timeout = timedelta(seconds=0.3)
+    ticks = []
+    try:
+        core.start_scheduler(on_tick=ticks.append)
+        due_at = datetime.now() + timedelta(seconds=0.15)
+        core.reminder_manager.add(Reminder(content="喝水", remind_at=due_at))
+        time.sleep(0.3)
+        assert ticks and "提醒：喝水" in ticks[0]["last_message"]
+        assert ticks[0]["mode"] == Mode.FOCUS.value
+        time.sleep(0.4)
+        assert ticks[-1]["mode"] == Mode.AMBIENT.value
+        assert len(ticks) == 2
+    finally:
+        core.close()
+    assert core.scheduler is None
+
+
+def test_scheduler_flushes_the_last_utterances(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    core.utterances.flush_interval_s = 0.1
+    ticks = []
+    try:
+        core.start_scheduler(on_tick=ticks.append)
+        core.process_text("钥匙放在抽屉里了")
+        assert core.utterances.flush_due_in() is not None
+        time.sleep(0.3)
+        # Flushed by the scheduler, not by a later read.
+        assert core.utterances.flush_due_in() is None
+        assert ticks == []
+        assert core.memory.conn.execute("SELECT COUNT(*) FROM utterances").fetchone()[0] == 1
+    finally:
+        core.close()
+
+
+def test_window_refills_without_reporting_a_tick(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    core.reminder_manager = ReminderManager(store=ReminderStore(core.memory), horizon=timedelta(seconds=0.4))
+    ticks = []
+    try:
+        core.reminder_manager.add(Reminder(content="喝水", remind_at=datetime.now() + timedelta(seconds=0.6)))
+        assert len(core.reminder_manager) == 0
+        core.start_scheduler(on_tick=ticks.append)
+        time.sleep(0.45)
+        # The refill deadline passed and paged the reminder in, silently.
+        assert len(core.reminder_manager) == 1
+        assert core.scheduler.fired >= 1 and ticks == []
+        time.sleep(0.35)
+        assert len(ticks) == 1 and "提醒：喝水" in ticks[0]["last_message"]
+    finally:
+        core.close()
@@ -1,4 +1,19 @@
-from sentient_cube.vision.detector import Detection, MockObjectDetector
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.capture import StaticFrameSource
+from sentient_cube.vision.detector import (
+    Detection,
+    DetectionBatch,
+    DetectionConfig,
+    MockObjectDetector,
+    ObjectDetector,
+    YoloObjectDetector,
+    as_model_input,
+)
 
 
 def test_mock_detector_returns_fixtures():
@@ -12,3 +27,124 @@ def test_mock_detector_returns_fixtures():
     assert len(out) == 2
     assert out[0].label == "钥匙"
 
+
+
+def test_as_model_input_passes_frames_through_without_copy():
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    assert as_model_input(frame) is frame
+    assert as_model_input(Path("desk.jpg")) == "desk.jpg"
+    with pytest.raises(TypeError):
+        as_model_input(42)
+
+
+def test_core_detects_from_in_memory_camera(tmp_path: Path):
+    detector = MockObjectDetector(fixtures=[Detection(label="钥匙", confidence=0.9, bbox=(1, 1, 20, 20))])
+    camera = StaticFrameSource([np.zeros((48, 64, 3), dtype=np.uint8)])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector)
+    try:
+        assert core.detect_from_camera(camera)["recorded"] == 1
+        assert core.detect_from_camera(camera)["count"] == 0
+    finally:
+        core.close()
+
+
+class _FakeTensor:
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float32)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+
+class _FakeBoxes:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = _FakeTensor(xyxy)
+        self.conf = _FakeTensor(conf)
+        self.cls = _FakeTensor(cls)
+
+
+class _FakeResult:
+    names = {0: "person", 1: "钥匙"}
+
+    def __init__(self):
+        self.boxes = _FakeBoxes([[1.7, 2.2, 30.9, 40.1], [5, 5, 9, 9]], [0.9, 0.4], [1, 0])
+
+
+class _FakeModel:
+    names = _FakeResult.names
+
+    def __init__(self):
+        self.options = {}
+
+    def predict(self, source, verbose=False, **options):
+        self.options = options
+        return [_FakeResult()]
+
+
+def _fake_yolo(config=None):
+    detector = YoloObjectDetector.__new__(YoloObjectDetector)
+    detector.model = _FakeModel()
+    detector.configure(config or DetectionConfig())
+    return detector
+
+
+def test_yolo_postprocessing_is_columnar():
+    detector = _fake_yolo()
+    batch = detector.detect_arrays(np.zeros((8, 8, 3), dtype=np.uint8))
+    assert len(batch) == 2
+    assert batch.labels == ["钥匙", "person"]
+    out = detector.detect(np.zeros((8, 8, 3), dtype=np.uint8))
+    assert out[0] == Detection(label="钥匙", confidence=pytest.approx(0.9), bbox=(1, 2, 30, 40))
+
+
+def test_yolo_pushes_allowlist_and_thresholds_into_predict():
+    config = DetectionConfig(min_confidence=0.5, classes=frozenset({"钥匙"}), class_thresholds={"钥匙": 0.95})
+    detector = _fake_yolo(config)
+    out = detector.detect("desk.jpg")
+    assert detector.model.options["classes"] == [1]
+    # Every allowed class has its own threshold, so min_confidence plays no part.
+    assert detector.model.options["conf"] == pytest.approx(0.95)
+    assert out == []
+    assert DetectionConfig(min_confidence=0.5, class_thresholds={"钥匙": 0.95}).floor() == pytest.approx(0.5)
+
+
+def test_mock_detector_applies_config():
+    detector = MockObjectDetector(
+        fixtures=[
+            Detection(label="钥匙", confidence=0.3, bbox=(0, 0, 1, 1)),
+            Detection(label="person", confidence=0.99, bbox=(0, 0, 1, 1)),
+        ],
+        config=DetectionConfig.from_dict({"classes": ["钥匙"], "class_thresholds": {"钥匙": 0.25}}),
+    )
+    assert [det.label for det in detector.detect("desk.jpg")] == ["钥匙"]
+
+
+class _RawDetector(ObjectDetector):
+    def detect(self, image, imgsz=None):
+        return self.config.filter(
+            [
+                Detection(label="钥匙", confidence=0.2, bbox=(0, 0, 1, 1)),
+                Detection(label="手机", confidence=0.8, bbox=(0, 0, 1, 1)),
+            ]
+        )
+
+
+def test_custom_detector_gets_its_own_default_config():
+    detector = _RawDetector()
+    assert [det.label for det in detector.detect("desk.jpg")] == ["手机"]
+    detector.configure(DetectionConfig(min_confidence=0.1))
+    assert len(detector.detect("desk.jpg")) == 2
+    # Configuring one instance leaves the others on the default.
+    assert _RawDetector().config == DetectionConfig()
+    assert MockObjectDetector().config is not MockObjectDetector().config
+
+
+def test_detection_batch_round_trip():
+    fixtures = [
+        Detection(label="钥匙", confidence=0.5, bbox=(1, 2, 3, 4)),
+        Detection(label="手机", confidence=0.75, bbox=(5, 6, 7, 8)),
+    ]
+    assert DetectionBatch.from_detections(fixtures).to_detections() == fixtures
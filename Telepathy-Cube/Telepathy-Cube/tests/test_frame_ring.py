@@ -0,0 +1,68 @@
+import multiprocessing
+
+import numpy as np
+
+from sentient_cube.vision.capture import StaticFrameSource
+from sentient_cube.vision.detector import MockObjectDetector
+from sentient_cube.vision.frame_ring import SharedFrameRing, detection_worker
+
+
+def test_frames_round_trip_as_views():
+    with SharedFrameRing.create(shape=(4, 6, 3), slots=2) as ring:
+        frame = np.arange(72, dtype=np.uint8).reshape(4, 6, 3)
+        slot, seq = ring.write(frame, timestamp_ns=123)
+        reader = SharedFrameRing.attach(ring.handle)
+        try:
+            lease = reader.lease(slot, seq)
+            assert lease is not None
+            assert np.array_equal(lease.frame, frame)
+            assert lease.timestamp_ns == 123
+            assert not lease.frame.flags.writeable
+            lease.release()
+            del lease
+        finally:
+            reader.close()
+
+
+def test_capture_writes_camera_frames_into_slots():
+    camera = StaticFrameSource([np.full((2, 2, 3), 9, dtype=np.uint8)])
+    with SharedFrameRing.create(shape=(2, 2, 3), slots=1) as ring:
+        slot, seq = ring.capture(camera)
+        assert ring.capture(camera) is None
+        with ring.lease(slot, seq) as lease:
+            assert int(lease.frame.sum()) == 9 * 12
+        del lease
+        assert ring.acquire_write() == slot
+        assert ring.lease(slot, seq) is None
+
+
+def test_leased_slots_are_never_overwritten():
+    with SharedFrameRing.create(shape=(2, 2, 3), slots=2) as ring:
+        first = ring.write(np.full((2, 2, 3), 1, dtype=np.uint8))
+        second = ring.write(np.full((2, 2, 3), 2, dtype=np.uint8))
+        lease = ring.lease(*second)
+        # The oldest unread frame is reclaimed; its stale seq no longer resolves.
+        third = ring.write(np.full((2, 2, 3), 3, dtype=np.uint8))
+        assert third[0] == first[0]
+        assert ring.lease(*first) is None
+        assert ring.acquire_write() == third[0]
+        assert ring.lease(*third) is None
+        assert int(lease.frame[0, 0, 0]) == 2
+        lease.release()
+        del lease
+
+
+def test_detection_worker_process_reads_ring():
+    ctx = multiprocessing.get_context("spawn")
+    with SharedFrameRing.create(shape=(8, 8, 3), slots=2, lock=ctx.Lock()) as ring:
+        requests, results = ctx.Queue(), ctx.Queue()
+        worker = ctx.Process(target=detection_worker, args=(ring.handle, requests, results, MockObjectDetector))
+        worker.start()
+        try:
+            requests.put(ring.write(np.zeros((8, 8, 3), dtype=np.uint8), timestamp_ns=7))
+            seq, stamp, detections = results.get(timeout=30)
+            assert (seq, stamp, detections) == (1, 7, [])
+        finally:
+            requests.put(None)
+            worker.join(timeout=30)
+        assert worker.exitcode == 0
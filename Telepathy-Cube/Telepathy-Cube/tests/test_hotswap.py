@@ -0,0 +1,72 @@
+import threading
+from pathlib import Path
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.detector import Detection, DetectionConfig, MockObjectDetector, ObjectDetector
+
+
+class BlockingDetector(ObjectDetector):
+    """Holds a detection open until released, to simulate an in-flight frame."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def detect(self, image, imgsz=None):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return [Detection(label="旧模型", confidence=0.9, bbox=(0, 0, 10, 10))]
+
+
+class BrokenDetector(ObjectDetector):
+    def detect(self, image, imgsz=None):
+        raise RuntimeError("bad weights")
+
+
+def _new_model():
+    return MockObjectDetector(fixtures=[Detection(label="新模型", confidence=0.9, bbox=(0, 0, 10, 10))])
+
+
+def test_swap_waits_for_in_flight_frame(tmp_path: Path):
+    old = BlockingDetector()
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=old)
+    try:
+        results = []
+        worker = threading.Thread(target=lambda: results.append(core.detect_and_remember("frame.jpg")))
+        worker.start()
+        assert old.started.wait(timeout=5)
+        future = core.hot_swap_detector(_new_model)
+        old.release.set()
+        worker.join(timeout=5)
+        assert future.result(timeout=5).swapped
+        assert results[0]["detections"][0]["label"] == "旧模型"
+        assert core.detect_and_remember("frame.jpg")["detections"][0]["label"] == "新模型"
+    finally:
+        core.close()
+
+
+def test_failed_warmup_keeps_old_model(tmp_path: Path):
+    old = MockObjectDetector()
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=old)
+    try:
+        result = core.hot_swap_detector(BrokenDetector).result(timeout=5)
+        assert not result.swapped
+        assert "bad weights" in result.error
+        assert core.detector is old
+    finally:
+        core.close()
+
+
+def test_swap_carries_config_and_supports_rollback(tmp_path: Path):
+    config = DetectionConfig(min_confidence=0.95)
+    old = MockObjectDetector(config=config)
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=old)
+    try:
+        assert core.hot_swap_detector(_new_model).result(timeout=5).swapped
+        assert core.detector.config is config
+        assert core.detect_and_remember("frame.jpg")["count"] == 0
+        assert core.detector_swapper.rollback()
+        assert core.detector is old
+    finally:
+        core.close()
@@ -0,0 +1,96 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.detector import Detection, ObjectDetector
+from sentient_cube.vision.image import FrameDiffGate, PreparedFrame, letterbox
+from sentient_cube.vision.tiling import TiledDetector
+
+
+def test_letterbox_maps_boxes_back_to_source():
+    frame = PreparedFrame(np.zeros((480, 960, 3), dtype=np.uint8))
+    box = frame.letterbox(320)
+    assert box.image.shape == (320, 320, 3)
+    assert box.pad == (0, 80)
+    assert frame.letterbox(320) is box
+    restored = box.to_source(np.array([[0, 80, 320, 240]], dtype=np.float32))
+    assert restored.tolist() == [[0, 0, 960, 480]]
+
+
+def test_letterbox_keeps_aspect_ratio():
+    canvas, ratio, pad = letterbox(np.full((100, 200, 3), 255, dtype=np.uint8), 64)
+    assert ratio == pytest.approx(0.32)
+    assert pad == (0, 16)
+    assert canvas[0, 0, 0] == 114
+    assert canvas[32, 32, 0] == 255
+
+
+def test_jpeg_is_decoded_at_reduced_size():
+    Image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    Image.new("RGB", (1280, 960), (10, 200, 30)).save(buf, format="JPEG")
+    frame = PreparedFrame(buf.getvalue(), decode_size=160)
+    assert frame.source_size == (1280, 960)
+    assert frame.frame.shape == (120, 160, 3)
+    assert frame.decode_scale == pytest.approx(0.125)
+    # BGR channel order like cv2.
+    assert frame.frame[0, 0, 1] > 150 and frame.frame[0, 0, 2] < 60
+
+
+def test_frame_diff_gate_skips_static_scenes():
+    gate = FrameDiffGate(threshold=2.0)
+    still = np.full((48, 64, 3), 100, dtype=np.uint8)
+    assert gate.changed(PreparedFrame(still))
+    assert not gate.changed(PreparedFrame(still.copy()))
+    moved = still.copy()
+    moved[:, :32] = 250
+    assert gate.changed(PreparedFrame(moved))
+
+
+class _CornerDetector(ObjectDetector):
+    def detect(self, image, imgsz=None):
+        return [Detection(label="钥匙", confidence=0.9, bbox=(0, 0, 10, 10))]
+
+
+def _jpeg(width, height):
+    Image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (10, 200, 30)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def test_tiler_reports_source_coordinates_for_reduced_frames():
+    frame = PreparedFrame(_jpeg(200, 100), decode_size=50)
+    assert frame.decode_scale == pytest.approx(0.25)
+    out = TiledDetector(_CornerDetector()).detect_regions(frame, [(40, 20, 200, 100)])
+    assert out[0].bbox == (40, 20, 80, 60)
+
+
+class _FrameRecorder(ObjectDetector):
+    imgsz = 160
+
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    def detect(self, image, imgsz=None):
+        self.frames.append(image)
+        return []
+
+
+def test_core_decodes_encoded_images_at_detector_size(tmp_path: Path):
+    detector = _FrameRecorder()
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector)
+    try:
+        core.detect_and_remember(_jpeg(1280, 960))
+        frame = detector.frames[0]
+        assert isinstance(frame, PreparedFrame)
+        assert frame.frame.shape == (120, 160, 3)
+        assert frame.source_size == (1280, 960)
+        core.detect_and_remember(_jpeg(1280, 960), imgsz=640)
+        assert detector.frames[1].frame.shape == (480, 640, 3)
+    finally:
+        core.close()
@@ -0,0 +1,44 @@
+from sentient_cube.models import IntentType, Mode
+from sentient_cube.voice.automaton import AhoCorasick
+from sentient_cube.voice.benchmark import legacy_parse_intent, run_benchmark, synthetic_utterances
+from sentient_cube.voice.rules import IntentEngine
+
+
+def test_automaton_reports_overlapping_matches():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert automaton.find_all("ushers") == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+    assert automaton.find_all("在哪里") == []
+
+
+def test_engine_matches_legacy_on_corpus():
+    engine = IntentEngine.from_file()
+    corpus = synthetic_utterances(2000, seed=3) + ["", "  ", "提醒", "我的在哪", "哪里在哪?", "提醒我提醒你", "AMBIENT 右脑"]
+    for text in corpus:
+        assert engine.parse(text) == legacy_parse_intent(text), text
+
+
+def test_bare_mode_word_is_chat():
+    engine = IntentEngine.from_file()
+    assert engine.parse("切换模式").intent_type == IntentType.CHAT
+
+
+def test_custom_rule_table_extracts_slots_from_offsets():
+    engine = IntentEngine.from_dict(
+        {
+            "rules": [
+                {"intent": "find", "triggers": ["找一下", "where is"], "strip": ["帮我", "my "], "slot": "item"},
+                {"intent": "mode", "triggers": ["专注"], "mode": "focus"},
+            ]
+        }
+    )
+    assert engine.parse("帮我找一下眼镜").item == "眼镜"
+    assert engine.parse("Where is my Wallet").item == "Wallet"
+    focus = engine.parse("进入专注")
+    assert (focus.intent_type, focus.mode) == (IntentType.MODE, Mode.FOCUS)
+
+
+def test_benchmark_report_has_both_parsers():
+    report = run_benchmark(synthetic_utterances(200), rounds=1, scaling_sizes=(4, 64))
+    assert report.mismatches == 0
+    assert [stats.name for stats in report.parsers] == ["legacy", "automaton"]
+    assert [stats.keywords for stats in report.scaling] == [4, 64]
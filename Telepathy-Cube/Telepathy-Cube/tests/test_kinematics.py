@@ -0,0 +1,70 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+
+
+def _exact(u, v, size=(1280, 720), hfov=70.0):
+    fx = (size[0] / 2.0) / math.tan(math.radians(hfov) / 2.0)
+    return (
+        math.degrees(math.atan((u - size[0] / 2.0) / fx)),
+        -math.degrees(math.atan((v - size[1] / 2.0) / fx)),
+    )
+
+
+def test_lut_interpolation_matches_pinhole_model():
+    solver = PointingSolver.from_pinhole()
+    points = np.array([[640.0, 360.0], [100.0, 50.0], [1203.0, 701.0], [333.3, 444.4]])
+    solved = solver.solve(points)
+    expected = np.array([_exact(u, v) for u, v in points])
+    assert np.allclose(solved, expected, atol=0.05)
+    assert np.allclose(solved[0], [0.0, 0.0])
+
+
+def test_relative_solver_adds_capture_pose_and_clips():
+    solver = PointingSolver.from_pinhole(relative=True)
+    pan, tilt = solver.aim((1180, 340, 1200, 380), pose=(30.0, -10.0))
+    expected_pan, expected_tilt = _exact(1190, 360)
+    assert pan == pytest.approx(30.0 + expected_pan, abs=0.05)
+    assert tilt == pytest.approx(-10.0 + expected_tilt, abs=0.05)
+    assert solver.aim((1270, 0, 1280, 10), pose=(85.0, 44.0)) == (90.0, 45.0)
+
+
+def test_samples_fit_recovers_offset_mount():
+    truth = PointingSolver.from_pinhole(mount_offset=(12.0, -6.0))
+    rng = np.random.default_rng(0)
+    pixels = rng.uniform([0, 0], [1280, 720], size=(20, 2))
+    fitted = PointingSolver.from_samples(pixels, truth.solve(pixels), size=(1280, 720))
+    probe = np.array([[640.0, 360.0], [200.0, 600.0]])
+    assert np.allclose(fitted.solve(probe), truth.solve(probe), atol=0.5)
+    with pytest.raises(ValueError):
+        PointingSolver.from_samples(pixels[:3], truth.solve(pixels[:3]), size=(1280, 720))
+
+
+def test_batch_solve_matches_single_boxes():
+    solver = PointingSolver.from_pinhole()
+    boxes = [(i, i, i + 20, i + 20) for i in range(0, 700, 7)]
+    angles = solver.solve_boxes(boxes)
+    assert angles.shape == (100, 2)
+    assert np.allclose(angles, [solver.aim(box) for box in boxes])
+
+
+def test_find_object_aims_at_remembered_box(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        core.memory.add_object(
+            ObjectMemory(name="钥匙", location="桌面", confidence=0.9, bbox=(100, 40, 140, 80), camera="main")
+        )
+        core.find_object("钥匙")
+        state = core.hardware.get_state()
+        expected = _exact(120, 60)
+        assert state.pan_angle == pytest.approx(expected[0], abs=0.05)
+        assert state.tilt_angle == pytest.approx(expected[1], abs=0.05)
+        assert state.laser_on
+    finally:
+        core.close()
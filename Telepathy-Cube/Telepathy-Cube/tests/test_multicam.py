@@ -0,0 +1,160 @@
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.capture import StaticFrameSource
+from sentient_cube.vision.detector import Detection, MockObjectDetector, ObjectDetector
+from sentient_cube.vision.multicam import CameraEvent, CameraSource, MultiCameraRig, fuse_events
+from sentient_cube.vision.tracker import TrackEvent, TrackEventType
+from sentient_cube.vision.zones import ZoneMap
+
+
+class SlowDetector(ObjectDetector):
+    def __init__(self, label: str, confidence: float) -> None:
+        super().__init__()
+        self.label = label
+        self.confidence = confidence
+
+    def detect(self, image, imgsz=None):
+        time.sleep(0.2)
+        return [Detection(label=self.label, confidence=self.confidence, bbox=(0, 0, 10, 10))]
+
+
+def _frames():
+    return StaticFrameSource([np.zeros((8, 8, 3), dtype=np.uint8)], loop=True)
+
+
+def _event(camera, stamp, label, confidence, kind=TrackEventType.APPEARED):
+    return CameraEvent(
+        camera=camera,
+        timestamp=stamp,
+        location=camera,
+        event=TrackEvent(kind=kind, track_id=1, label=label, confidence=confidence, bbox=(0, 0, 1, 1)),
+    )
+
+
+def test_fusion_keeps_best_sighting_per_name_and_window():
+    fused = fuse_events(
+        [
+            _event("gimbal", 10.0, "钥匙", 0.6),
+            _event("overview", 10.1, "钥匙", 0.9),
+            _event("overview", 12.0, "钥匙", 0.5),
+            _event("gimbal", 10.0, "手机", 0.7, kind=TrackEventType.LEFT),
+        ],
+        window_s=0.5,
+    )
+    keys = [item for item in fused if item.event.label == "钥匙"]
+    assert [item.camera for item in keys] == ["overview", "overview"]
+    assert keys[0].event.confidence == 0.9
+
+
+def test_cameras_run_in_parallel_and_write_one_batch(tmp_path: Path):
+    rig = MultiCameraRig(
+        [
+            CameraSource("gimbal", _frames(), SlowDetector("钥匙", 0.6), location_hint="桌面"),
+            CameraSource("overview", _frames(), SlowDetector("钥匙", 0.9), location_hint="书桌全景"),
+            CameraSource("side", _frames(), SlowDetector("手机", 0.8), location_hint="桌角"),
+        ]
+    )
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector())
+    try:
+        start = time.perf_counter()
+        result = core.detect_multi(rig)
+        assert time.perf_counter() - start < 0.5
+        assert result["recorded"] == 2
+        assert core.memory.latest_object("钥匙").location == "书桌全景"
+        assert core.detect_multi(rig)["recorded"] == 0
+    finally:
+        rig.close()
+        core.close()
+
+
+def test_laser_stays_on_while_another_camera_tracks_the_object(tmp_path: Path):
+    key = Detection(label="钥匙", confidence=0.9, bbox=(0, 0, 10, 10))
+    gimbal = MockObjectDetector(fixtures=[key])
+    overview = MockObjectDetector(fixtures=[key])
+    rig = MultiCameraRig([CameraSource("gimbal", _frames(), gimbal), CameraSource("overview", _frames(), overview)])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector())
+    try:
+        core.detect_multi(rig)
+        core.hardware.set_laser(True)
+        core.laser_target = "钥匙"
+        gimbal.fixtures = []
+        for _ in range(5):
+            core.detect_multi(rig)
+        assert core.laser_target == "钥匙"
+        assert core.hardware.get_state().laser_on
+
+        overview.fixtures = []
+        events = [event for _ in range(5) for event in core.detect_multi(rig)["events"]]
+        assert {"camera": "overview", "event": "left", "label": "钥匙"} in events
+        assert core.laser_target is None
+        assert not core.hardware.get_state().laser_on
+    finally:
+        rig.close()
+        core.close()
+
+
+def test_stale_frames_are_dropped():
+    stamps = iter([100.0, 100.5])
+    rig = MultiCameraRig(
+        [
+            CameraSource("a", _frames(), MockObjectDetector()),
+            CameraSource("b", _frames(), MockObjectDetector()),
+        ],
+        sync_tolerance_s=0.1,
+        clock=lambda: next(stamps),
+    )
+    try:
+        step = rig.step()
+        assert step.captured == ["b"]
+        assert step.dropped == ["a"]
+    finally:
+        rig.close()
+
+
+def test_only_gimbal_boxes_aim_the_laser(tmp_path: Path):
+    key = Detection(label="钥匙", confidence=0.9, bbox=(300, 200, 340, 240))
+    overview = MockObjectDetector(fixtures=[key])
+    rig = MultiCameraRig([CameraSource("overview", _frames(), overview, location_hint="书桌全景")])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector(fixtures=[key]))
+    core.gimbal_camera = "gimbal"
+    try:
+        core.detect_multi(rig)
+        stored = core.memory.latest_object("钥匙")
+        assert (stored.camera, stored.pose) == ("overview", None)
+        result = core.find_object("钥匙")
+        # The overview box means nothing to the gimbal's calibration: answer with the zone only.
+        assert result["found"] and "书桌全景" in result["message"]
+        state = core.hardware.get_state()
+        assert (state.pan_angle, state.tilt_angle, state.laser_on) == (0.0, 0.0, False)
+        assert core.laser_target is None
+
+        core.detect_and_remember(np.zeros((480, 640, 3), dtype=np.uint8), camera="gimbal")
+        assert core.memory.latest_object("钥匙").camera == "gimbal"
+        core.find_object("钥匙")
+        state = core.hardware.get_state()
+        assert state.laser_on and (state.pan_angle, state.tilt_angle) != (0.0, 0.0)
+    finally:
+        rig.close()
+        core.close()
+
+
+def test_misconfigured_zone_map_does_not_fail_the_rig(tmp_path: Path):
+    key = Detection(label="钥匙", confidence=0.9, bbox=(0, 0, 4, 4))
+    wrong = ZoneMap.from_polygons((640, 480), {"抽屉": [(0, 0), (640, 0), (640, 480), (0, 480)]})
+    rig = MultiCameraRig(
+        [
+            CameraSource("gimbal", _frames(), MockObjectDetector(fixtures=[key]), location_hint="桌面", zone_map=wrong),
+            CameraSource("side", _frames(), MockObjectDetector(fixtures=[Detection("手机", 0.8, (0, 0, 4, 4))])),
+        ]
+    )
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector())
+    try:
+        assert core.detect_multi(rig)["recorded"] == 2
+        assert core.memory.latest_object("钥匙").location == "桌面"
+    finally:
+        rig.close()
+        core.close()
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+
+from sentient_cube.control.hardware import MockHardwareController
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import Mode, ObjectMemory
+
+TEXTS = [
+    "我的钥匙在哪？",
+    "明天9点提醒带身份证",
+    "手机在哪里",
+    "切换到右脑模式",
+    "我的钥匙在哪？",
+    "你好",
+]
+
+
+class CountingHardware(MockHardwareController):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def set_mode(self, mode: Mode) -> None:
+        self.calls += 1
+        super().set_mode(mode)
+
+    def move_gimbal(self, pan: float, tilt: float) -> None:
+        self.calls += 1
+        super().move_gimbal(pan, tilt)
+
+    def set_laser(self, enabled: bool) -> None:
+        self.calls += 1
+        super().set_laser(enabled)
+
+
+def _core(path: Path) -> SentientCubeCore:
+    core = SentientCubeCore(db_path=str(path))
+    core.hardware = CountingHardware()
+    core.memory.add_object(
+        ObjectMemory(name="钥匙", location="桌面右侧", confidence=0.9, bbox=(100, 100, 140, 140), camera="main")
+    )
+    return core
+
+
+def _strip(results):
+    # Each core stamps its own rows and reminders; compare everything else.
+    for item in results:
+        item["result"].pop("remind_at", None)
+        item["result"].get("memory", {}).pop("timestamp", None)
+    return results
+
+
+@pytest.mark.parametrize(
+    ("prelude", "texts"),
+    [
+        ([], TEXTS),
+        # The laser is already on the keys; the AMBIENT switch must still turn it off.
+        (["钥匙在哪"], ["切换到右脑模式", "切换到左脑模式"]),
+    ],
+)
+def test_batch_matches_sequential_results_and_final_state(tmp_path: Path, prelude, texts):
+    sequential = _core(tmp_path / "a.db")
+    batched = _core(tmp_path / "b.db")
+    try:
+        for text in prelude:
+            sequential.process_text(text)
+            batched.process_text(text)
+        expected = _strip([sequential.process_text(text) for text in texts])
+        queries = []
+        batched.memory.latest_object = lambda name: queries.append(name)  # type: ignore[assignment]
+        got = _strip(batched.process_many(texts))
+
+        assert got == expected
+        assert queries == []
+        assert batched.state_machine.mode == sequential.state_machine.mode
+        assert batched.hardware.get_state() == sequential.hardware.get_state()
+        assert batched.laser_target == sequential.laser_target
+        assert batched.last_message == sequential.last_message
+        assert batched.hardware.calls < sequential.hardware.calls
+    finally:
+        sequential.close()
+        batched.close()
+
+
+def test_batch_ends_pointing_at_last_found_object(tmp_path: Path):
+    core = _core(tmp_path / "memory.db")
+    try:
+        results = core.process_many(["切换到右脑模式", "钥匙在哪"])
+        assert results[1]["result"]["found"]
+        assert core.state_machine.mode == Mode.FOCUS
+        assert core.laser_target == "钥匙"
+        assert core.hardware.get_state().laser_on
+        assert core.hardware.calls == 3
+    finally:
+        core.close()
+
+
+def test_bulk_latest_lookup(tmp_path: Path):
+    core = _core(tmp_path / "memory.db")
+    try:
+        core.memory.add_object(ObjectMemory(name="钥匙", location="抽屉", confidence=0.8))
+        found = core.memory.latest_objects(["钥匙", "手机", "钥匙"])
+        assert list(found) == ["钥匙"]
+        assert found["钥匙"].location == "抽屉"
+    finally:
+        core.close()
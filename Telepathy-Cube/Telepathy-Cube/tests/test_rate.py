@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.control.state_machine import DualBrainStateMachine
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import Mode
+from sentient_cube.vision.capture import StaticFrameSource
+from sentient_cube.vision.detector import MockObjectDetector
+from sentient_cube.vision.rate import DetectionLoop, DetectionRateController, RateBudget, RateProfile
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(load=0.1, clock=None):
+    sm = DualBrainStateMachine()
+    controller = DetectionRateController(
+        sm,
+        profiles={Mode.AMBIENT: RateProfile(0.5, 320), Mode.FOCUS: RateProfile(4.0, 640)},
+        burst=RateProfile(12.0, 640),
+        budget=RateBudget(max_cpu_load=0.5, max_latency_ms=100.0),
+        cpu_load=lambda: load,
+        clock=clock or FakeClock(),
+    )
+    return sm, controller
+
+
+def test_profile_follows_mode_and_burst():
+    clock = FakeClock()
+    sm, controller = _controller(clock=clock)
+    assert controller.current() == RateProfile(0.5, 320)
+    sm.switch(Mode.FOCUS)
+    assert controller.current() == RateProfile(4.0, 640)
+    controller.trigger_burst(seconds=2.0)
+    assert controller.current().fps == 12.0
+    clock.now += 3.0
+    assert controller.current().fps == 4.0
+
+
+def test_budgets_scale_rate_and_input_size_down():
+    sm, controller = _controller(load=1.0)
+    sm.switch(Mode.FOCUS)
+    profile = controller.current()
+    assert profile.fps == 2.0
+    assert profile.imgsz == 448
+
+    _, controller = _controller()
+    controller.record_latency(0.4)
+    assert controller.current().fps == 0.2
+
+
+def test_next_delay_respects_fps():
+    clock = FakeClock()
+    _, controller = _controller(clock=clock)
+    assert controller.next_delay() == 0.0
+    controller.mark_frame()
+    clock.now += 0.5
+    assert controller.next_delay() == 1.5
+
+
+def test_notify_before_wait_is_not_lost():
+    _, controller = _controller()
+    seen = controller.generation
+    controller.notify()
+    # The wake-up landed between the snapshot and the wait: it must return at once.
+    assert controller.wait(5.0, since=seen)
+    assert not controller.wait(0.0)
+
+
+def test_loop_runs_detection_at_profile_size(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector())
+    try:
+        loop = DetectionLoop(core, StaticFrameSource([np.zeros((8, 8, 3), dtype=np.uint8)]))
+        assert loop.run_once()["count"] == 0
+        assert loop.controller.latency_ms is not None
+        assert loop.run_once() is None
+    finally:
+        core.close()
+
+
+class _FlakyCore:
+    def __init__(self, core):
+        self.core = core
+        self.rate_controller = core.rate_controller
+        self.calls = 0
+
+    def detect_and_remember(self, frame, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise ValueError("bad frame")
+        return self.core.detect_and_remember(frame, **kwargs)
+
+
+def test_loop_can_run_ungated_and_survives_a_failing_frame(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=MockObjectDetector())
+    try:
+        still = np.zeros((8, 8, 3), dtype=np.uint8)
+        flaky = _FlakyCore(core)
+        loop = DetectionLoop(flaky, StaticFrameSource([still], loop=True), use_gate=False)
+        assert loop.gate is None
+        core.rate_controller.trigger_burst()
+        loop.start()
+        try:
+            for _ in range(200):
+                if flaky.calls >= 3:
+                    break
+                core.rate_controller.notify()
+                loop.thread.join(timeout=0.01)
+        finally:
+            loop.stop()
+        # Identical frames still reach the detector, and the first failure did not stop the thread.
+        assert flaky.calls >= 3
+        assert isinstance(loop.last_error, ValueError)
+    finally:
+        core.close()
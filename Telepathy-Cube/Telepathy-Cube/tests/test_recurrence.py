@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import Reminder
+from sentient_cube.reminder.manager import ReminderManager
+from sentient_cube.reminder.recurrence import DAILY, HOURLY, MINUTELY, MONTHLY, WEEKLY, WORKDAYS, Recurrence
+from sentient_cube.voice.time_parser import parse_time_spec, resolve
+
+ANCHOR = datetime(2026, 10, 19, 8, 0)  # a Monday
+
+
+def _brute_force(rule, anchor, after, limit=400000):
+    """Reference: walk the series one occurrence at a time."""
+    current = anchor
+    for _ in range(limit):
+        if current > after:
+            return current
+        current = rule.next_after(anchor, current)
+        if current is None:
+            return None
+    raise AssertionError("no occurrence found")
+
+
+def test_fixed_period_rules_jump_in_one_step():
+    rule = Recurrence(HOURLY, interval=3)
+    assert rule.next_after(ANCHOR, ANCHOR) == ANCHOR + timedelta(hours=3)
+    assert rule.next_after(ANCHOR, ANCHOR - timedelta(days=1)) == ANCHOR
+    far = ANCHOR + timedelta(days=3650, minutes=1)
+    assert rule.next_after(ANCHOR, far) == ANCHOR + timedelta(hours=3 * 29201)
+    minutely = Recurrence(MINUTELY, interval=1)
+    fifty_years = timedelta(days=365 * 50)
+    # Stepping would take 26 million iterations; the closed form lands on the slot directly.
+    assert minutely.next_after(ANCHOR, ANCHOR + fifty_years) == ANCHOR + fifty_years + timedelta(minutes=1)
+
+
+def test_weekly_rules_follow_weekdays_and_interval():
+    assert WORKDAYS.next_after(ANCHOR, datetime(2026, 10, 23, 9, 0)) == datetime(2026, 10, 26, 8, 0)
+    fortnightly = Recurrence(WEEKLY, interval=2, weekdays=(2,))
+    occurrences = fortnightly.occurrences(ANCHOR, ANCHOR)
+    assert [next(occurrences) for _ in range(3)] == [
+        datetime(2026, 10, 21, 8, 0),
+        datetime(2026, 11, 4, 8, 0),
+        datetime(2026, 11, 18, 8, 0),
+    ]
+    later = datetime(2027, 6, 1, 12, 0)
+    assert fortnightly.next_after(ANCHOR, later) == _brute_force(fortnightly, ANCHOR, later)
+
+
+def test_monthly_rules_skip_short_months():
+    rule = Recurrence(MONTHLY, monthday=31)
+    occurrences = rule.occurrences(datetime(2026, 1, 31, 9, 0), datetime(2026, 1, 31, 9, 0))
+    months = [next(occurrences).month for _ in range(6)]
+    assert months == [3, 5, 7, 8, 10, 12]
+    quarterly = Recurrence(MONTHLY, interval=3)
+    assert quarterly.next_after(datetime(2026, 1, 15, 9, 0), datetime(2026, 2, 1)) == datetime(2026, 4, 15, 9, 0)
+
+
+def test_until_ends_the_series_and_rrule_round_trips():
+    rule = Recurrence(WEEKLY, interval=2, weekdays=(0, 4), until=datetime(2026, 11, 1))
+    assert Recurrence.from_rrule(rule.to_rrule()) == rule
+    assert rule.to_rrule() == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR;UNTIL=20261101T000000"
+    assert list(rule.occurrences(ANCHOR, ANCHOR)) == [datetime(2026, 10, 23, 8, 0)]
+
+
+def test_missed_week_fires_once_then_skips_ahead():
+    manager = ReminderManager()
+    daily = Reminder(content="吃药", remind_at=ANCHOR, repeat_daily=True)
+    hourly = Reminder(content="喝水", remind_at=ANCHOR, recurrence=Recurrence(HOURLY, interval=2))
+    manager.add(daily)
+    manager.add(hourly)
+    back_on = ANCHOR + timedelta(days=7, hours=3)
+    assert {item.content for item in manager.due_reminders(back_on)} == {"吃药", "喝水"}
+    assert daily.remind_at == ANCHOR + timedelta(days=8)
+    assert hourly.remind_at == ANCHOR + timedelta(days=7, hours=4)
+    assert manager.due_reminders(back_on + timedelta(minutes=30)) == []
+    assert len(manager) == 2
+
+
+def test_spoken_rules_reach_the_store(tmp_path: Path):
+    now = datetime(2026, 10, 19, 10, 0)
+    assert resolve(parse_time_spec("工作日早上8点"), now) == datetime(2026, 10, 20, 8, 0)
+    assert resolve(parse_time_spec("每周一三五晚上7点半"), now) == datetime(2026, 10, 19, 19, 30)
+    assert resolve(parse_time_spec("每隔两小时"), now) == datetime(2026, 10, 19, 12, 0)
+    assert resolve(parse_time_spec("每月15号上午9点"), now) == datetime(2026, 11, 15, 9, 0)
+    assert parse_time_spec("每天早上8点").recurrence is None
+
+    db_path = str(tmp_path / "memory.db")
+    core = SentientCubeCore(db_path=db_path)
+    try:
+        result = core.add_reminder("每周二周四晚上9点", "倒垃圾")
+        assert result["recurrence"] == "FREQ=WEEKLY;INTERVAL=1;BYDAY=TU,TH"
+    finally:
+        core.close()
+    reopened = SentientCubeCore(db_path=db_path)
+    try:
+        stored = reopened.reminder_manager.upcoming()[0]
+        assert stored.rule == Recurrence(WEEKLY, weekdays=(1, 3))
+        assert stored.remind_at.weekday() in (1, 3) and stored.remind_at.hour == 21
+    finally:
+        reopened.close()
+
+
+def test_daily_shorthand_matches_every_day_rule():
+    assert Reminder(content="x", remind_at=ANCHOR, repeat_daily=True).rule == Recurrence(DAILY)
+    assert Reminder(content="x", remind_at=ANCHOR).rule is None
+
+
+def test_day_and_half_hour_intervals_are_understood():
+    now = datetime(2026, 10, 19, 10, 0)
+    assert parse_time_spec("每隔3天").recurrence == Recurrence(DAILY, interval=3)
+    assert resolve(parse_time_spec("每隔三天早上8点"), now) == datetime(2026, 10, 22, 8, 0)
+    assert resolve(parse_time_spec("每3天下午3点"), now) == datetime(2026, 10, 19, 15, 0)
+    assert parse_time_spec("每隔半小时").recurrence == Recurrence(MINUTELY, interval=30)
+    assert parse_time_spec("每隔一个半小时").recurrence == Recurrence(MINUTELY, interval=90)
+    assert resolve(parse_time_spec("每隔半小时"), now) == datetime(2026, 10, 19, 10, 30)
+
+
+def test_impossible_rules_are_reported_not_guessed(tmp_path: Path):
+    for text in ("每月35号", "每月0号", "每隔0小时", "每隔半分钟", "明天99点", "25点", "晚上8点60分", "24点30分"):
+        spec = parse_time_spec(text)
+        assert not spec.understood and spec.recurrence is None
+        assert resolve(spec, ANCHOR) is None
+
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        result = core.process_text("每月35号提醒交房租")["result"]
+        assert result["remind_at"] is None
+        assert core.last_message.startswith("无法识别的时间")
+        assert len(core.reminder_manager) == 0
+    finally:
+        core.close()
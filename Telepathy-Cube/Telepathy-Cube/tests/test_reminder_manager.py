@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta
+
+from sentient_cube.models import Reminder
+from sentient_cube.reminder.benchmark import LegacyReminderManager, run_benchmark, synthetic_reminders
+from sentient_cube.reminder.manager import ReminderManager
+
+START = datetime(2026, 10, 19, 8, 0)
+
+
+def test_due_reminders_fire_in_time_order_and_retire():
+    manager = ReminderManager()
+    for minutes in (30, 10, 20):
+        manager.add(Reminder(content=f"{minutes}", remind_at=START + timedelta(minutes=minutes)))
+    assert manager.due_reminders(START) == []
+    due = manager.due_reminders(START + timedelta(minutes=25))
+    assert [item.content for item in due] == ["10", "20"]
+    assert all(item.triggered for item in due)
+    assert len(manager) == 1
+    assert list(manager.retired) == due
+    assert manager.next_due() == START + timedelta(minutes=30)
+
+
+def test_repeating_reminder_is_pushed_back_for_the_next_day():
+    manager = ReminderManager()
+    daily = Reminder(content="吃药", remind_at=START, repeat_daily=True)
+    manager.add(daily)
+    assert manager.due_reminders(START + timedelta(minutes=1)) == [daily]
+    assert not daily.triggered
+    assert manager.next_due() == START + timedelta(days=1)
+    assert manager.due_reminders(START + timedelta(hours=2)) == []
+
+
+def test_upcoming_matches_a_full_sort():
+    manager = ReminderManager()
+    reminders = synthetic_reminders(500, seed=3)
+    for reminder in reminders:
+        manager.add(reminder)
+    expected = sorted(reminders, key=lambda item: item.remind_at)
+    assert manager.upcoming(25) == expected[:25]
+    assert manager.list() == expected
+    assert ReminderManager().upcoming() == []
+
+
+def test_matches_the_legacy_manager_tick_by_tick():
+    rng = random.Random(5)
+    heap, legacy = ReminderManager(), LegacyReminderManager()
+    for index in range(200):
+        at = START + timedelta(minutes=rng.randrange(3 * 24 * 60))
+        repeat = index % 7 == 0
+        heap.add(Reminder(content=str(index), remind_at=at, repeat_daily=repeat))
+        legacy.add(Reminder(content=str(index), remind_at=at, repeat_daily=repeat))
+    now = START
+    for _ in range(4 * 24 * 4):
+        now += timedelta(minutes=15)
+        assert sorted(item.content for item in heap.due_reminders(now)) == sorted(
+            item.content for item in legacy.due_reminders(now)
+        )
+
+
+def test_benchmark_tick_cost_does_not_grow_with_reminders():
+    report = run_benchmark(sizes=(1000, 50000), ticks=2000, legacy_ticks=5, adds=10)
+    heap = [stats for stats in report.stats if stats.manager == "heap"]
+    assert [stats.reminders for stats in heap] == [1000, 50000]
+    assert heap[1].tick_us < heap[0].tick_us * 5 + 5
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.memory.spatial_memory import SpatialMemoryDB
+from sentient_cube.models import Reminder
+from sentient_cube.reminder.benchmark import synthetic_reminders
+from sentient_cube.reminder.manager import ReminderManager
+from sentient_cube.reminder.store import ReminderStore
+
+START = datetime(2026, 1, 1, 8, 0)
+
+
+def _fire_all(manager, until, step=timedelta(minutes=10)):
+    fired = []
+    now = START
+    while now < until:
+        now += step
+        fired.extend((item.content, item.remind_at) for item in manager.due_reminders(now))
+    return fired
+
+
+def test_startup_loads_only_the_upcoming_window(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    try:
+        reminders = synthetic_reminders(5000, repeat_ratio=0.0)
+        ReminderStore(memory).add_many(reminders)
+        manager = ReminderManager(store=ReminderStore(memory), horizon=timedelta(hours=6), now=START)
+        window = [item for item in reminders if item.remind_at <= START + timedelta(hours=6)]
+        assert len(manager) == len(window) < 10
+        assert all(item.id is not None for item in reminders)
+    finally:
+        memory.close()
+
+
+def test_paged_manager_fires_like_the_in_memory_one(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    try:
+        ReminderStore(memory).add_many(synthetic_reminders(400, seed=4, repeat_ratio=0.1))
+        paged = ReminderManager(store=ReminderStore(memory), horizon=timedelta(hours=2), page_size=3, now=START)
+        plain = ReminderManager()
+        for reminder in synthetic_reminders(400, seed=4, repeat_ratio=0.1):
+            plain.add(reminder)
+        until = START + timedelta(days=20)
+        assert sorted(_fire_all(paged, until)) == sorted(_fire_all(plain, until))
+    finally:
+        memory.close()
+
+
+def test_overdue_backlog_is_paged_in_without_losing_any(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    try:
+        store = ReminderStore(memory)
+        store.add_many([Reminder(content=str(i), remind_at=START - timedelta(minutes=i)) for i in range(50)])
+        manager = ReminderManager(store=store, page_size=8, now=START)
+        assert len(manager) == 50
+        assert len(manager.due_reminders(START)) == 50
+        assert store.count_pending() == 0
+    finally:
+        memory.close()
+
+
+def test_reminders_survive_a_restart(tmp_path: Path):
+    db_path = str(tmp_path / "memory.db")
+    core = SentientCubeCore(db_path=db_path)
+    try:
+        core.add_reminder("每天早上8点", "吃药")
+        core.add_reminder("下周三上午10点", "交报告")
+        far = Reminder(content="续签护照", remind_at=datetime.now() + timedelta(days=200))
+        core.reminder_manager.add(far)
+        assert far not in core.reminder_manager.list()
+    finally:
+        core.close()
+
+    reopened = SentientCubeCore(db_path=db_path)
+    try:
+        manager = reopened.reminder_manager
+        assert manager.store.count_pending() == 3
+        pending = manager.store.pending(None, datetime.now() + timedelta(days=365), 10)
+        assert [item.content for item in pending] == ["吃药", "交报告", "续签护照"]
+        assert pending[0].repeat_daily
+        due_at = pending[0].remind_at
+        fired = manager.due_reminders(due_at)
+        assert [item.content for item in fired] == ["吃药"]
+        # The rescheduled slot is written back for the next start.
+        assert manager.store.pending(None, due_at + timedelta(days=1), 10)[0].remind_at == due_at + timedelta(days=1)
+    finally:
+        reopened.close()
+
+
+def test_full_listing_keeps_every_fired_reminder(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        manager = core.reminder_manager
+        now = datetime.now()
+        for i in range(30):
+            manager.add(Reminder(content=f"旧{i}", remind_at=now - timedelta(hours=30 - i)))
+        far = Reminder(content="续签护照", remind_at=now + timedelta(days=200))
+        manager.add(far)
+        manager.due_reminders(now)
+
+        recent = [item["content"] for item in core.status()["reminders"]]
+        assert recent == [f"旧{i}" for i in range(10, 30)] + ["续签护照"]
+        full = core.status(full=True)["reminders"]
+        assert [item["content"] for item in full] == [f"旧{i}" for i in range(30)] + ["续签护照"]
+        assert all(item["triggered"] for item in full[:30])
+    finally:
+        core.close()
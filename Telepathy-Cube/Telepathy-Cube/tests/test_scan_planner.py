@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.control.hardware import MockHardwareController
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.control.scan_planner import (
+    ScanExecutor,
+    ScanPlanner,
+    ScanView,
+    order_views,
+    stale_zones,
+    tour_cost,
+)
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+from sentient_cube.vision.capture import StaticFrameSource
+from sentient_cube.vision.detector import Detection, MockObjectDetector
+from sentient_cube.vision.zones import ZoneMap, ZoneRegistry
+
+SIZE = (1280, 720)
+ZONES = {
+    "Desk_Zone_A": [(0, 0), (640, 0), (640, 720), (0, 720)],
+    "Desk_Zone_B": [(640, 0), (1280, 0), (1280, 720), (640, 720)],
+}
+
+
+def _planner():
+    return ScanPlanner(PointingSolver.from_pinhole(size=SIZE), ZoneMap.from_polygons(SIZE, ZONES, stride=8))
+
+
+def test_tour_beats_raster_order():
+    rng = np.random.default_rng(1)
+    points = rng.uniform([-60, -30], [60, 30], size=(30, 2))
+    views = [ScanView(float(p), float(t)) for p, t in points]
+    tour = [views[i] for i in order_views(points, (0.0, 0.0))]
+    raster = sorted(views, key=lambda v: (round(v.tilt / 10), v.pan))
+    assert sorted(tour, key=id) == sorted(views, key=id)
+    assert tour_cost(tour, (0.0, 0.0)) < tour_cost(raster, (0.0, 0.0))
+
+
+def test_views_cover_every_zone_and_plan_is_cached():
+    planner = _planner()
+    plan = planner.plan()
+    assert {view.zone for view in plan.views} == set(ZONES)
+    assert planner.plan() is plan
+    planner.pointing = PointingSolver.from_pinhole(size=SIZE, mount_offset=(5.0, 0.0))
+    assert planner.plan() is not plan
+
+
+def test_stale_zones_are_visited_first():
+    planner = _planner()
+    plan = planner.plan(priority_zones={"Desk_Zone_B"})
+    zones = [view.zone for view in plan.views]
+    first_a = zones.index("Desk_Zone_A")
+    assert set(zones[:first_a]) == {"Desk_Zone_B"}
+    assert "Desk_Zone_B" not in zones[first_a:]
+
+
+def test_stale_zone_selection():
+    now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    freshness = {
+        "Desk_Zone_A": (now - timedelta(minutes=5), 0.9),
+        "Desk_Zone_B": (now - timedelta(hours=2), 0.9),
+        "Desk_Zone_C": (now, 0.2),
+    }
+    assert stale_zones(freshness, ["Desk_Zone_A", "Desk_Zone_B", "Desk_Zone_C", "Desk_Zone_D"], now=now) == {
+        "Desk_Zone_B",
+        "Desk_Zone_C",
+        "Desk_Zone_D",
+    }
+
+
+def test_executor_moves_and_batches():
+    planner = _planner()
+    plan = planner.plan()
+    detector = MockObjectDetector([Detection(label="钥匙", confidence=0.9, bbox=(1, 1, 5, 5))])
+    hardware = MockHardwareController()
+    frames = StaticFrameSource([np.zeros((8, 8, 3), dtype=np.uint8)], loop=True)
+    results = ScanExecutor(hardware, detector, batch_size=3, sleep=lambda _: None).run(plan, frames)
+    assert [result.view for result in results] == plan.views
+    last = plan.views[-1]
+    assert (hardware.get_state().pan_angle, hardware.get_state().tilt_angle) == (last.pan, last.tilt)
+
+
+def test_core_scan_records_zone_and_pose(tmp_path: Path):
+    registry = ZoneRegistry()
+    registry.add("main", ZoneMap.from_polygons(SIZE, ZONES, stride=8))
+    detector = MockObjectDetector([Detection(label="手机", confidence=0.8, bbox=(10, 10, 30, 30))])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector, zones=registry)
+    try:
+        core.memory.add_object(ObjectMemory(name="钥匙", location="Desk_Zone_A", confidence=0.9))
+        frames = StaticFrameSource([np.zeros((8, 8, 3), dtype=np.uint8)], loop=True)
+        result = core.scan_desk(frames)
+        assert result["priority_zones"] == ["Desk_Zone_B"]
+        assert result["recorded"] == result["views"]
+        latest = core.memory.latest_object("手机")
+        assert latest.location in ZONES
+        assert latest.pose is not None
+    finally:
+        core.close()
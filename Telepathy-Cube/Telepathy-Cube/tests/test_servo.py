@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sentient_cube.control.hardware import MockHardwareController
+from sentient_cube.control.kinematics import PointingSolver
+from sentient_cube.control.servo import AlphaBetaFilter, ServoConfig, VisualServo, find_laser_spot
+from sentient_cube.control.simulator import ColorBlobDetector, DeskSimulator
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+from sentient_cube.vision.capture import StaticFrameSource
+
+SIZE = (640, 360)
+
+
+def _setup(velocity=(0.0, 0.0)):
+    sim = DeskSimulator(size=SIZE, velocity=velocity)
+    detector = ColorBlobDetector("钥匙", sim.object_bgr)
+    pointing = PointingSolver.from_pinhole(size=SIZE)
+    return sim, detector, pointing
+
+
+def _miss(sim):
+    x1, y1, x2, y2 = sim.object_bbox
+    sx, sy = sim.laser_pixel()
+    return float(np.hypot(sx - (x1 + x2) / 2.0, sy - (y1 + y2) / 2.0))
+
+
+def test_laser_spot_is_found_inside_region():
+    frame = np.full((100, 100, 3), 110, dtype=np.uint8)
+    frame[40:43, 70:73] = (40, 40, 255)
+    assert find_laser_spot(frame) == (71.0, 41.0)
+    assert find_laser_spot(frame, region=(0, 0, 50, 50)) is None
+
+
+def test_alpha_beta_leads_constant_motion():
+    tracker = AlphaBetaFilter()
+    for step in range(20):
+        tracker.update((10.0 + 2.0 * step, 5.0), dt=1.0)
+    x, _ = tracker.predict(1.0)
+    assert abs(x - (10.0 + 2.0 * 20)) < 1.0
+
+
+def test_servo_corrects_open_loop_miss():
+    sim, detector, pointing = _setup()
+    sim.gimbal.move_gimbal(*pointing.aim(sim.object_bbox))
+    for _ in range(10):
+        sim.read()
+    open_loop_miss = _miss(sim)
+    assert open_loop_miss > 10.0
+
+    # Every clock read advances 10 ms: one start and one end read per iteration.
+    ticks = iter(np.arange(0.0, 1000.0, 0.01))
+    servo = VisualServo(
+        detector,
+        sim.gimbal,
+        pointing,
+        ServoConfig(budget_ms=50.0),
+        clock=lambda: float(next(ticks)),
+        sleep=lambda _: None,
+    )
+    result = servo.run(sim, "钥匙", bbox=sim.object_bbox)
+    assert result.converged
+    assert result.error_px <= 4.0
+    assert _miss(sim) < 6.0
+    assert result.overruns == 0
+    assert all(step.latency_ms == pytest.approx(10.0) for step in result.steps)
+
+
+def test_open_loop_fallback_aims_at_target_from_current_pose():
+    frame = np.full((360, 640, 3), 110, dtype=np.uint8)
+    frame[200:240, 400:440] = (30, 200, 30)
+    pointing = PointingSolver.from_pinhole(size=SIZE, relative=True)
+    hardware = MockHardwareController()
+    hardware.move_gimbal(10.0, 5.0)
+    servo = VisualServo(
+        ColorBlobDetector("钥匙", (30, 200, 30)), hardware, pointing, ServoConfig(max_iterations=1), sleep=lambda _: None
+    )
+    step = servo.run(StaticFrameSource([frame]), "钥匙").steps[0]
+    assert step.spot is None
+    expected = pointing.solve(np.array([step.target]), np.array([10.0, 5.0]))[0]
+    assert step.command == pytest.approx(tuple(expected))
+    assert step.command[0] > 10.0
+
+
+def test_servo_tracks_moving_object():
+    sim, detector, pointing = _setup(velocity=(-1.5, 0.5))
+    # Simulated time: one 50 ms camera period per frame.
+    servo = VisualServo(
+        detector,
+        sim.gimbal,
+        pointing,
+        ServoConfig(budget_ms=60.0, tolerance_px=5.0, max_iterations=80),
+        clock=lambda: sim.frames * 0.05,
+        sleep=lambda _: None,
+    )
+    result = servo.run(sim, "钥匙", bbox=sim.object_bbox)
+    assert result.converged
+    assert _miss(sim) < 8.0
+
+
+def test_overrun_shrinks_roi_size():
+    sim, detector, pointing = _setup()
+    ticks = iter(np.arange(0.0, 1000.0, 0.1))
+    servo = VisualServo(
+        detector,
+        sim.gimbal,
+        pointing,
+        ServoConfig(budget_ms=1.0, max_iterations=3),
+        clock=lambda: float(next(ticks)),
+        sleep=lambda _: None,
+    )
+    result = servo.run(sim, "钥匙", bbox=sim.object_bbox)
+    assert result.overruns == 3
+
+
+def test_core_spotlight_locks_on_remembered_object(tmp_path: Path):
+    sim, detector, pointing = _setup()
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector, pointing=pointing)
+    core.hardware = sim.gimbal
+    try:
+        core.memory.add_object(
+            ObjectMemory(name="钥匙", location="桌面", confidence=0.9, bbox=sim.object_bbox, camera="main")
+        )
+        core.find_object("钥匙")
+        result = core.spotlight(sim, config=ServoConfig(budget_ms=50.0))
+        assert result.converged
+        assert core.last_message == "已锁定钥匙。"
+    finally:
+        core.close()
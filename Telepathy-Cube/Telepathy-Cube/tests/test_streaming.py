@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import IntentType, ObjectMemory
+from sentient_cube.voice.benchmark import synthetic_utterances
+from sentient_cube.voice.rules import IntentEngine
+from sentient_cube.voice.streaming import StreamEventType, StreamingIntentRecognizer
+
+ENGINE = IntentEngine.from_file()
+
+
+def _prefixes(text):
+    return [text[: i + 1] for i in range(len(text))]
+
+
+def test_streamed_final_matches_batch_parse():
+    recognizer = StreamingIntentRecognizer(ENGINE, vocabulary=["钥匙", "手机"])
+    for text in synthetic_utterances(300, seed=7) + ["  我的钥匙在哪？ "]:
+        for partial in _prefixes(text):
+            recognizer.update(partial)
+        assert recognizer.finish().intent == ENGINE.parse(text), text
+
+
+def test_each_character_is_scanned_once(monkeypatch):
+    scanned = []
+    original = ENGINE.automaton.scan_states
+
+    def counting(chunk, state=0, offset=0):
+        scanned.append(len(chunk))
+        return original(chunk, state, offset)
+
+    monkeypatch.setattr(ENGINE.automaton, "scan_states", counting)
+    recognizer = StreamingIntentRecognizer(ENGINE)
+    text = "明天早上8点提醒我带身份证和钥匙"
+    for partial in _prefixes(text):
+        recognizer.update(partial)
+    assert sum(scanned) == len(text)
+
+
+def test_revised_partial_rewinds_to_common_prefix():
+    recognizer = StreamingIntentRecognizer(ENGINE)
+    recognizer.update("我的要是在哪")
+    recognizer.update("我的钥匙在哪")
+    assert recognizer.finish().intent.item == "钥匙"
+
+    recognizer.update("哪里")
+    recognizer.update("那里有")
+    assert recognizer.finish().intent.intent_type == IntentType.CHAT
+
+
+def test_prefetch_precedes_provisional_find():
+    recognizer = StreamingIntentRecognizer(ENGINE, vocabulary=["钥匙"])
+    timeline = []
+    for partial in _prefixes("我的钥匙在哪呢"):
+        timeline.extend((partial, event.kind, event.item) for event in recognizer.update(partial))
+    assert timeline[0] == ("我的钥匙", StreamEventType.PREFETCH, "钥匙")
+    assert timeline[1] == ("我的钥匙在哪", StreamEventType.PROVISIONAL, "钥匙")
+    # "呢" changes the reading of the item, so a corrected provisional follows.
+    assert timeline[2][1:] == (StreamEventType.PROVISIONAL, "钥匙呢")
+
+
+def test_core_reacts_before_endpoint(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        core.memory.add_object(
+            ObjectMemory(name="钥匙", location="桌面右侧", confidence=0.9, bbox=(10, 10, 30, 30), camera="main")
+        )
+        reference = core.process_text("我的钥匙在哪？")
+        core.hardware.set_laser(False)
+
+        core.begin_utterance()
+        reacted_at = None
+        text = "我的钥匙在哪？"
+        for partial in _prefixes(text):
+            core.feed_partial(partial)
+            if reacted_at is None and core.hardware.get_state().laser_on:
+                reacted_at = len(partial)
+        assert reacted_at is not None and reacted_at < len(text)
+
+        queries = []
+        core.memory.latest_object = lambda name: queries.append(name)  # type: ignore[assignment]
+        result = core.end_utterance()
+        assert queries == []
+        assert result["result"]["message"] == reference["result"]["message"]
+        assert core.laser_target == "钥匙"
+    finally:
+        core.close()
+
+
+def test_corrected_item_undoes_the_early_spotlight(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        core.memory.add_object(
+            ObjectMemory(name="钥匙", location="桌面右侧", confidence=0.9, bbox=(10, 10, 30, 30), camera="main")
+        )
+        text = "钥匙在哪呢"
+        reference = core.process_text(text)
+        assert not core.hardware.get_state().laser_on
+
+        core.begin_utterance()
+        queries = []
+        lookup = core.memory.latest_object
+        core.memory.latest_object = lambda name: queries.append(name) or lookup(name)  # type: ignore[assignment]
+        for partial in _prefixes(text):
+            core.feed_partial(partial)
+        # The provisional "钥匙" lit the laser; the revised "钥匙呢" is not a known name and waits.
+        assert core.laser_target == "钥匙"
+        assert queries == ["钥匙"]
+
+        result = core.end_utterance()
+        assert result["result"]["message"] == reference["result"]["message"]
+        assert core.laser_target is None
+        assert not core.hardware.get_state().laser_on
+    finally:
+        core.close()
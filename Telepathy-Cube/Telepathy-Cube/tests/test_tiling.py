@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+from sentient_cube.vision.boxes import nms
+from sentient_cube.vision.detector import Detection, ObjectDetector
+from sentient_cube.vision.tiling import TiledDetector, tile_windows
+
+
+class CropRecorder(ObjectDetector):
+    """Reports one fixed box per crop and remembers the crop shapes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def detect(self, image, imgsz=None):
+        self.calls.append((image.shape[:2], imgsz))
+        return [Detection(label="钥匙", confidence=0.8, bbox=(5, 5, 25, 25))]
+
+
+def test_tile_windows_cover_frame():
+    windows = tile_windows(1000, 600, tile=400, overlap=0.25)
+    assert windows[0] == (0, 0, 400, 400)
+    assert max(x2 for _, _, x2, _ in windows) == 1000
+    assert max(y2 for _, _, _, y2 in windows) == 600
+
+
+def test_nms_is_per_class():
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10]], dtype=float)
+    scores = np.array([0.9, 0.8, 0.7])
+    assert nms(boxes, scores, 0.5).tolist() == [0]
+    assert nms(boxes, scores, 0.5, classes=np.array([0, 0, 1])).tolist() == [0, 2]
+
+
+def test_region_boxes_are_mapped_to_frame_coordinates():
+    inner = CropRecorder()
+    tiler = TiledDetector(inner, imgsz=160)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    out = tiler.detect_regions(frame, [(100, 200, 260, 360)])
+    assert out[0].bbox == (105, 205, 125, 225)
+    assert inner.calls == [((160, 160), 160)]
+
+
+def test_locate_object_searches_around_last_known_bbox(tmp_path: Path):
+    inner = CropRecorder()
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=inner)
+    try:
+        core.memory.add_object(ObjectMemory(name="钥匙", location="桌面", confidence=0.9, bbox=(300, 200, 320, 220)))
+        result = core.locate_object("钥匙", np.zeros((480, 640, 3), dtype=np.uint8))
+        assert result["found"]
+        assert len(inner.calls) == 1
+        assert inner.calls[0][0] == (160, 160)
+    finally:
+        core.close()
@@ -0,0 +1,56 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.voice.time_parser import cn_number, parse_reminder_time, parse_time_spec
+
+# A Monday morning.
+NOW = datetime(2026, 10, 19, 10, 0)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("明天9点", datetime(2026, 10, 20, 9, 0)),
+        ("后天8点30分", datetime(2026, 10, 21, 8, 30)),
+        ("下午3点半", datetime(2026, 10, 19, 15, 30)),
+        ("二十分钟后", datetime(2026, 10, 19, 10, 20)),
+        ("一个半小时后", datetime(2026, 10, 19, 11, 30)),
+        ("三天后上午9点", datetime(2026, 10, 22, 9, 0)),
+        ("两天后", datetime(2026, 10, 21, 10, 0)),
+        ("每天早上8点", datetime(2026, 10, 20, 8, 0)),
+        ("今晚8点", datetime(2026, 10, 19, 20, 0)),
+        ("中午1点", datetime(2026, 10, 19, 13, 0)),
+        ("周五", datetime(2026, 10, 23, 9, 0)),
+        ("下周三上午10点", datetime(2026, 10, 28, 10, 0)),
+        ("星期一9点一刻", datetime(2026, 10, 26, 9, 15)),
+        ("10:30", datetime(2026, 10, 19, 10, 30)),
+        ("8点", datetime(2026, 10, 20, 8, 0)),
+        ("", datetime(2026, 10, 20, 9, 0)),
+    ],
+)
+def test_expressions_resolve_against_now(text, expected):
+    assert parse_reminder_time(text, now=NOW) == expected
+
+
+def test_chinese_numerals():
+    assert [cn_number(text) for text in ["二十", "十五", "三十五", "两", "一百二十", "45"]] == [20, 15, 35, 2, 120, 45]
+
+
+def test_specs_are_memoized_and_flag_repeats():
+    first = parse_time_spec("每天早上8点")
+    assert first.repeat_daily
+    assert parse_time_spec("每天早上8点") is first
+
+
+def test_core_sets_daily_repeat(tmp_path: Path):
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"))
+    try:
+        core.process_text("每天早上8点提醒吃药")
+        reminder = core.reminder_manager.upcoming()[0]
+        assert reminder.repeat_daily
+        assert (reminder.remind_at.hour, reminder.remind_at.minute) == (8, 0)
+    finally:
+        core.close()
@@ -0,0 +1,41 @@
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.vision.detector import Detection, MockObjectDetector
+from sentient_cube.vision.tracker import ObjectTracker, TrackEventType
+
+
+def test_tracker_keeps_ids_and_reports_changes_only():
+    tracker = ObjectTracker(max_age=1)
+    first = tracker.update([Detection(label="钥匙", confidence=0.9, bbox=(10, 10, 60, 60))])
+    assert [e.kind for e in first] == [TrackEventType.APPEARED]
+    track_id = first[0].track_id
+
+    assert tracker.update([Detection(label="钥匙", confidence=0.9, bbox=(12, 11, 62, 61))]) == []
+
+    moved = tracker.update([Detection(label="钥匙", confidence=0.9, bbox=(40, 30, 90, 80))])
+    assert [e.kind for e in moved] == [TrackEventType.MOVED]
+    assert moved[0].track_id == track_id
+
+    assert tracker.update([]) == []
+    left = tracker.update([])
+    assert [e.kind for e in left] == [TrackEventType.LEFT]
+    assert left[0].track_id == track_id
+
+
+def test_tracker_does_not_match_across_labels():
+    tracker = ObjectTracker()
+    tracker.update([Detection(label="钥匙", confidence=0.9, bbox=(10, 10, 60, 60))])
+    events = tracker.update([Detection(label="手机", confidence=0.9, bbox=(10, 10, 60, 60))])
+    assert {e.kind for e in events} == {TrackEventType.APPEARED}
+    assert events[0].label == "手机"
+
+
+def test_detect_and_remember_writes_on_state_change(tmp_path):
+    detector = MockObjectDetector(fixtures=[Detection(label="钥匙", confidence=0.9, bbox=(10, 10, 60, 60))])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector)
+    try:
+        assert core.detect_and_remember("frame.jpg")["recorded"] == 1
+        assert core.detect_and_remember("frame.jpg")["recorded"] == 0
+        assert len(core.memory.history("钥匙")) == 1
+        assert core.memory.latest_object("钥匙").bbox == (10, 10, 60, 60)
+    finally:
+        core.close()
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.memory.spatial_memory import SpatialMemoryDB
+from sentient_cube.memory.utterance_log import UtteranceLog, index_terms, match_query
+from sentient_cube.models import Intent, IntentType
+from sentient_cube.voice.intent import parse_intent
+
+
+def _chat(text):
+    return Intent(intent_type=IntentType.CHAT, content=text, raw_text=text)
+
+
+def test_cjk_text_is_indexed_as_bigrams():
+    assert index_terms("钥匙在走廊 AirPods") == ["钥匙", "匙在", "在走", "走廊", "廊", "airpods"]
+    assert match_query("身份证") == '"身份" + "份证"'
+    assert match_query("书") == '"书"*'
+
+
+def test_writes_are_batched(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    now = [0.0]
+    log = UtteranceLog(memory, batch_size=3, flush_interval_s=10.0, clock=lambda: now[0])
+    try:
+        stored = lambda: memory.conn.execute("SELECT COUNT(*) FROM utterances").fetchone()[0]
+        log.log(_chat("一"))
+        log.log(_chat("二"))
+        assert stored() == 0
+        log.log(_chat("三"))
+        assert stored() == 3
+        log.log(_chat("四"))
+        now[0] = 11.0
+        log.log(_chat("五"))
+        assert stored() == 5
+        log.log(_chat("六"))
+        assert log.count() == 6
+    finally:
+        memory.close()
+
+
+def test_mentions_prefer_recent_statements_over_questions(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    log = UtteranceLog(memory)
+    now = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+    try:
+        log.log(_chat("钥匙在厨房"), timestamp=now - timedelta(days=400))
+        log.log(_chat("我把钥匙放在走廊抽屉里了"), timestamp=now - timedelta(hours=12))
+        log.log(parse_intent("我的钥匙在哪？"), timestamp=now - timedelta(hours=1))
+        log.log(_chat("钥扣坏了"), timestamp=now)
+        found = log.mentions("钥匙", now=now)
+        assert [utterance.text for utterance in found] == ["我把钥匙放在走廊抽屉里了", "钥匙在厨房"]
+        assert log.mentions("钥匙", include_questions=True, now=now, limit=5)[-1].text == "钥匙在厨房"
+        assert log.mentions("雨伞", now=now) == []
+    finally:
+        memory.close()
+
+
+def test_lookup_stays_fast_over_years_of_logs(tmp_path: Path):
+    memory = SpatialMemoryDB(str(tmp_path / "memory.db"))
+    log = UtteranceLog(memory, batch_size=5000)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    phrases = ["今天天气不错", "帮我放点音乐", "明天早上八点提醒我开会", "钥匙放在玄关了", "把手机放抽屉里"]
+    try:
+        for index in range(60000):
+            log.log(_chat(phrases[index % len(phrases)]), timestamp=start + timedelta(minutes=30 * index))
+        log.flush()
+        statements = []
+        memory.conn.set_trace_callback(statements.append)
+        found = log.mentions("钥匙", limit=100, window=20, now=start + timedelta(days=1300))
+        memory.conn.set_trace_callback(None)
+        assert found and found[0].text == "钥匙放在玄关了"
+        # 12000 entries mention the keys; only the window of most recent ones is read.
+        assert len(found) == 20
+        query = next(sql for sql in statements if "MATCH" in sql)
+        plan = [row["detail"] for row in memory.conn.execute("EXPLAIN QUERY PLAN " + query)]
+        # The FTS index drives the lookup and each log row is fetched by id, never scanned.
+        assert plan[0].startswith("SCAN utterance_fts VIRTUAL TABLE INDEX")
+        assert all(detail.startswith("SEARCH") for detail in plan[1:])
+    finally:
+        memory.close()
+
+
+def test_find_object_falls_back_to_what_was_said(tmp_path: Path):
+    db_path = str(tmp_path / "memory.db")
+    core = SentientCubeCore(db_path=db_path)
+    try:
+        core.process_text("我把钥匙放在走廊抽屉里了")
+        result = core.process_text("我的钥匙在哪？")["result"]
+        assert not result["found"]
+        assert result["recalled"]["text"] == "我把钥匙放在走廊抽屉里了"
+        assert "走廊抽屉" in result["message"]
+        assert core.hardware.get_state().laser_on is False
+    finally:
+        core.close()
+
+    reopened = SentientCubeCore(db_path=db_path)
+    try:
+        assert reopened.utterances.count() == 2
+        assert reopened.find_object("钥匙")["recalled"]["text"] == "我把钥匙放在走廊抽屉里了"
+    finally:
+        reopened.close()
@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from sentient_cube.core import SentientCubeCore
+from sentient_cube.models import ObjectMemory
+from sentient_cube.vision.detector import Detection, MockObjectDetector
+from sentient_cube.vision.tracker import ObjectTracker
+from sentient_cube.vision.zones import ZoneMap, ZoneRegistry
+
+HALVES = {
+    "Desk_Zone_A": [(0, 0), (320, 0), (320, 240), (0, 240)],
+    "Desk_Zone_B": [(320, 0), (640, 0), (640, 240), (320, 240)],
+}
+
+
+def test_box_centres_resolve_to_zones_with_fallback():
+    zone_map = ZoneMap.from_polygons((640, 480), HALVES)
+    names = zone_map.zones_for([(10, 10, 50, 50), (400, 100, 500, 200), (100, 300, 200, 400)], "桌面区域")
+    assert names == ["Desk_Zone_A", "Desk_Zone_B", "桌面区域"]
+    assert zone_map.labels.shape == (120, 160)
+
+
+def test_homography_maps_pixels_onto_plane_zones():
+    # Plane coordinates are pixels scaled down by 10, e.g. centimetres on the desk.
+    homography = [[0.1, 0, 0], [0, 0.1, 0], [0, 0, 1]]
+    zone_map = ZoneMap.from_polygons(
+        (640, 480), {"Drawer": [(0, 0), (10, 0), (10, 10), (0, 10)]}, homography=homography
+    )
+    assert zone_map.zone_of((20, 20, 60, 60), "桌面区域") == "Drawer"
+    assert zone_map.zone_of((300, 300, 340, 340), "桌面区域") == "桌面区域"
+    assert zone_map.lookup(np.array([[50.0, 50.0], [9999.0, -5.0]])).tolist() == [0, -1]
+
+
+def test_registry_falls_back_to_default_pose(tmp_path: Path):
+    path = tmp_path / "zones.json"
+    path.write_text(
+        json.dumps({"maps": [{"camera": "main", "size": [640, 480], "zones": HALVES}]}), encoding="utf-8"
+    )
+    registry = ZoneRegistry.from_file(path)
+    assert registry.get("main", "pan_30") is registry.get("main")
+    assert registry.get("overview") is None
+
+
+def test_core_records_zone_instead_of_hint(tmp_path: Path):
+    registry = ZoneRegistry()
+    registry.add("main", ZoneMap.from_polygons((1280, 720), {"Desk_Zone_A": [(0, 0), (640, 0), (640, 720), (0, 720)]}))
+    detector = MockObjectDetector(
+        [
+            Detection(label="钥匙", confidence=0.9, bbox=(100, 100, 200, 200)),
+            Detection(label="手机", confidence=0.9, bbox=(900, 100, 1000, 200)),
+        ]
+    )
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector, zones=registry)
+    try:
+        result = core.detect_and_remember(np.zeros((720, 1280, 3), dtype=np.uint8), location_hint="桌面区域")
+        assert [event["location"] for event in result["events"]] == ["Desk_Zone_A", "桌面区域"]
+        assert core.memory.latest_object("钥匙").location == "Desk_Zone_A"
+        assert core.memory.latest_object("手机").location == "桌面区域"
+    finally:
+        core.close()
+
+
+def test_frames_of_another_size_are_scaled_or_fall_back(tmp_path: Path, caplog):
+    zone_map = ZoneMap.from_polygons((640, 480), HALVES)
+    assert zone_map.frame_scale((1280, 960)) == (0.5, 0.5)
+    assert zone_map.zones_for([(20, 20, 100, 100)], "桌面区域", scale=(0.5, 0.5)) == ["Desk_Zone_A"]
+
+    registry = ZoneRegistry()
+    registry.add("main", zone_map)
+    detector = MockObjectDetector([Detection(label="钥匙", confidence=0.9, bbox=(700, 20, 780, 100))])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector, zones=registry)
+    try:
+        # Same aspect ratio at twice the resolution: boxes are scaled onto the map.
+        result = core.detect_and_remember(np.zeros((960, 1280, 3), dtype=np.uint8))
+        assert [event["location"] for event in result["events"]] == ["Desk_Zone_B"]
+
+        core.tracker = ObjectTracker()
+        with caplog.at_level("WARNING"):
+            result = core.detect_and_remember(np.zeros((720, 1280, 3), dtype=np.uint8))
+        # A different aspect ratio cannot be mapped, but the sighting is still recorded.
+        assert result["recorded"] == 1
+        assert core.memory.latest_object("钥匙").location == "桌面区域"
+        assert "640x480" in caplog.text
+    finally:
+        core.close()
+
+
+def test_camera_pose_follows_the_gimbal(tmp_path: Path):
+    registry = ZoneRegistry()
+    registry.add("main", ZoneMap.from_polygons((640, 480), {"Left": HALVES["Desk_Zone_A"]}), gimbal=(0.0, 0.0))
+    registry.add("main", ZoneMap.from_polygons((640, 480), {"Right": HALVES["Desk_Zone_A"]}), "right", (30.0, 0.0))
+    assert registry.pose_at(29.0, 1.0) == "right"
+    assert registry.pose_at(15.0, 0.0) is None
+
+    detector = MockObjectDetector([Detection(label="钥匙", confidence=0.9, bbox=(10, 10, 50, 50))])
+    core = SentientCubeCore(db_path=str(tmp_path / "memory.db"), detector=detector, zones=registry)
+    try:
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        assert core.detect_and_remember(frame)["events"][0]["location"] == "Left"
+        core.memory.add_object(
+            ObjectMemory(name="手机", location="Right", confidence=0.9, bbox=(10, 10, 50, 50), camera="main")
+        )
+        core.pointing = _FixedAim((30.0, 0.0))
+        core.find_object("手机")
+        assert core.camera_pose == "right"
+        detector.fixtures = [Detection(label="手机", confidence=0.9, bbox=(10, 10, 50, 50))]
+        assert core.detect_and_remember(frame)["events"][0]["location"] == "Right"
+    finally:
+        core.close()
+
+
+class _FixedAim:
+    def __init__(self, angles):
+        self.angles = angles
+
+    def aim(self, bbox, pose=None):
+        return self.angles
@@ -0,0 +1,129 @@
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+
+// Shared with the Python core (sentient_cube/voice/rules.py).
+const DEFAULT_RULES_PATH = path.join(__dirname, '..', '..', 'sentient_cube', 'voice', 'intent_rules.json');
+
+function buildAutomaton(patterns) {
+  const goto = [new Map()];
+  const outputs = [[]];
+  patterns.forEach((pattern, index) => {
+    let state = 0;
+    for (const char of pattern) {
+      let next = goto[state].get(char);
+      if (next === undefined) {
+        next = goto.length;
+        goto[state].set(char, next);
+        goto.push(new Map());
+        outputs.push([]);
+      }
+      state = next;
+    }
+    outputs[state].push(index);
+  });
+
+  const fail = new Array(goto.length).fill(0);
+  const delta = goto.map(() => new Map());
+  delta[0] = new Map(goto[0]);
+  const queue = Array.from(goto[0].values());
+  for (let head = 0; head < queue.length; head += 1) {
+    const state = queue[head];
+    delta[state] = new Map([...delta[fail[state]], ...goto[state]]);
+    outputs[state] = outputs[state].concat(outputs[fail[state]]);
+    for (const [char, child] of goto[state]) {
+      fail[child] = delta[fail[state]].get(char) || 0;
+      queue.push(child);
+    }
+  }
+
+  const lengths = patterns.map((pattern) => Array.from(pattern).length);
+  return function findAll(chars) {
+    const found = [];
+    let state = 0;
+    chars.forEach((char, i) => {
+      state = delta[state].get(char) || 0;
+      for (const index of outputs[state]) {
+        found.push([i + 1 - lengths[index], i + 1, index]);
+      }
+    });
+    return found;
+  };
+}
+
+function compileRules(table) {
+  const rules = table.rules.map((rule) => ({
+    intent: rule.intent,
+    triggers: rule.triggers.map((k) => k.toLowerCase()),
+    strip: (rule.strip || []).map((k) => k.toLowerCase()),
+    slot: rule.slot || '',
+    mode: rule.mode || null,
+    defaultContent: rule.default_content || ''
+  }));
+  const keywords = [];
+  rules.forEach((rule) => {
+    rule.triggers.concat(rule.strip).forEach((k) => {
+      if (!keywords.includes(k)) keywords.push(k);
+    });
+  });
+  const rank = keywords.map((k) => {
+    const index = rules.findIndex((rule) => rule.triggers.includes(k));
+    return index < 0 ? rules.length : index;
+  });
+  return { rules, keywords, rank, findAll: buildAutomaton(keywords) };
+}
+
+function loadRules(rulesPath = DEFAULT_RULES_PATH) {
+  return compileRules(JSON.parse(fs.readFileSync(rulesPath, 'utf8')));
+}
+
+function parseWithRules(compiled, text) {
+  const query = String(text || '').trim();
+  if (!query) {
+    return { type: 'chat', content: '' };
+  }
+  // Code points, so offsets line up with the Python engine.
+  const chars = Array.from(query);
+  const lowered = chars.map((c) => (c.length === 1 && c < '\u0080' ? c.toLowerCase() : c));
+  const matches = compiled.findAll(lowered);
+  let best = compiled.rules.length;
+  matches.forEach(([, , k]) => {
+    best = Math.min(best, compiled.rank[k]);
+  });
+  if (best === compiled.rules.length) {
+    return { type: 'chat', content: query };
+  }
+
+  const rule = compiled.rules[best];
+  const keyword = (k) => compiled.keywords[k];
+  if (rule.slot === 'item') {
+    const removed = new Array(chars.length).fill(false);
+    matches
+      .filter(([, , k]) => rule.triggers.includes(keyword(k)) || rule.strip.includes(keyword(k)))
+      .forEach(([start, end]) => removed.fill(true, start, end));
+    return { type: rule.intent, item: chars.filter((_, i) => !removed[i]).join('').trim() };
+  }
+  if (rule.slot === 'split') {
+    const [start, end] = matches
+      .filter(([, , k]) => rule.triggers.includes(keyword(k)))
+      .sort((a, b) => a[0] - b[0])[0];
+    return {
+      type: rule.intent,
+      timeText: chars.slice(0, start).join('').trim(),
+      content: chars.slice(end).join('').trim() || rule.defaultContent
+    };
+  }
+  if (rule.mode) {
+    return { type: rule.intent, value: rule.mode };
+  }
+  return { type: rule.intent };
+}
+
+module.exports = {
+  DEFAULT_RULES_PATH,
+  buildAutomaton,
+  compileRules,
+  loadRules,
+  parseWithRules
+};
@@ -2,6 +2,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { loadRules, parseWithRules } = require('./intentRules');
 
 const MODE = {
   AMBIENT: 'ambient',
@@ -17,37 +18,10 @@ const EMOTION_CONFIG = {
   meditative: { duration: 10.0, minAngle: 15, maxAngle: 45, color: '#9370DB' }
 };
 
-function parseIntent(text) {
-  const query = String(text || '').trim();
-  if (!query) {
-    return { type: 'chat', content: '' };
-  }
-
-  if (query.includes('在哪') || query.includes('哪里')) {
-    const item = query
-      .replace(/[？?]/g, '')
-      .replace('我的', '')
-      .replace('在哪', '')
-      .replace('哪里', '')
-      .trim();
-    return { type: 'find', item };
-  }
-
-  if (query.includes('提醒')) {
-    const parts = query.split('提醒');
-    const timeText = (parts[0] || '').trim();
-    const content = (parts.slice(1).join('提醒') || '').trim();
-    return { type: 'reminder', timeText, content };
-  }
+const INTENT_RULES = loadRules();
 
-  if (query.includes('左脑') || query.includes('右脑') || query.includes('模式')) {
-    return {
-      type: 'mode',
-      value: query.includes('左脑') ? MODE.FOCUS : MODE.AMBIENT
-    };
-  }
-
-  return { type: 'chat', content: query };
+function parseIntent(text) {
+  return parseWithRules(INTENT_RULES, text);
 }
 
 function ensureStoreFile(storePath) {